@@ -38,3 +38,55 @@ def register_cli(app):
             user.normalize()
             db.session.commit()
             click.echo(f"✔ Usuario admin actualizado: {email}")
+
+    @app.cli.command("scoring-worker")
+    @click.option("--concurrency", type=int, default=None, help="Hilos de scoring (default: SCORING_WORKER_CONCURRENCY).")
+    @click.option("--poll-interval", type=float, default=None, help="Segundos de espera con la cola vacía.")
+    @click.option("--once", is_flag=True, default=False, help="Procesa a lo sumo un job y termina.")
+    def scoring_worker(concurrency, poll_interval, once):
+        """Ejecuta el pipeline de scoring IA consumiendo la cola scoring_jobs."""
+        import signal
+        from .services.scoring.worker import ScoringWorker
+
+        worker = ScoringWorker(app, concurrency=concurrency, poll_interval=poll_interval)
+        if once:
+            processed = worker.run_once()
+            click.echo("✔ Job procesado" if processed else "Cola vacía")
+            return
+
+        signal.signal(signal.SIGTERM, lambda *_: worker.stop())
+        worker.run_forever()
+
+    @app.cli.command("rescore-vacancy")
+    @click.argument("vacancy_id", type=int)
+    @click.option("--status", "statuses", multiple=True, help="Solo postulaciones en este estado (repetible).")
+    @click.option("--postulation", "postulation_ids", multiple=True, type=int, help="Solo estas postulaciones (repetible).")
+    @click.option("--concurrency", type=int, default=None, help="Jobs simultáneos del lote (default: SCORING_BATCH_CONCURRENCY).")
+    def rescore_vacancy(vacancy_id, statuses, postulation_ids, concurrency):
+        """Encola el re-scoring IA de las postulaciones de una vacante."""
+        from .models.admin.vacancy import Vacancy
+        from .services.scoring.batches import enqueue_rescore
+
+        vac = db.session.get(Vacancy, vacancy_id)
+        if vac is None:
+            raise click.ClickException(f"Vacante {vacancy_id} no existe")
+        batch = enqueue_rescore(
+            vac,
+            postulation_ids=list(postulation_ids) or None,
+            statuses=list(statuses) or None,
+            max_concurrency=concurrency,
+            created_by="cli",
+        )
+        click.echo(f"✔ Lote {batch.id}: {batch.total} jobs encolados, {batch.skipped} omitidos por tener "
+                   f"un job en curso (concurrencia {batch.max_concurrency})")
+
+    @app.cli.command("sweep-cvs")
+    @click.option("--grace-hours", type=int, default=None, help="No borra objetos más nuevos (default: CV_SWEEP_GRACE_HOURS).")
+    @click.option("--dry-run", is_flag=True, default=False, help="Solo cuenta los huérfanos, no borra.")
+    def sweep_cvs(grace_hours, dry_run):
+        """Borra de S3 los CVs que ninguna postulación referencia (en lotes de 1000)."""
+        from .services.cv_sweeper import sweep_orphan_cvs
+
+        result = sweep_orphan_cvs(grace_hours=grace_hours, dry_run=dry_run)
+        verb = "a borrar" if dry_run else f"{result.deleted} borrados"
+        click.echo(f"✔ {result.scanned} CVs revisados, {result.orphans} huérfanos ({verb})")
@@ -42,6 +42,45 @@ class BaseConfig:
     ENABLE_ADMIN_SIMULATION = False
     # =======================================================================
 
+    # ===================== Scoring IA (cola + worker) =====================
+    SCORING_WORKER_CONCURRENCY = int(os.getenv("SCORING_WORKER_CONCURRENCY", "2"))
+    SCORING_POLL_INTERVAL_SEC = float(os.getenv("SCORING_POLL_INTERVAL_SEC", "2"))
+    SCORING_LEASE_SECONDS = int(os.getenv("SCORING_LEASE_SECONDS", "300"))
+    SCORING_MAX_ATTEMPTS = int(os.getenv("SCORING_MAX_ATTEMPTS", "3"))
+    SCORING_RETRY_BACKOFF_SEC = int(os.getenv("SCORING_RETRY_BACKOFF_SEC", "30"))
+    # Jobs en curso simultáneos por lote de re-scoring (si el request no lo indica)
+    SCORING_BATCH_CONCURRENCY = int(os.getenv("SCORING_BATCH_CONCURRENCY", "4"))
+    # Máx. postulaciones pendientes del mismo postulante puntuadas en una llamada (1 = desactivado)
+    AI_MULTI_SCORE_MAX = int(os.getenv("AI_MULTI_SCORE_MAX", "5"))
+
+    # Pre-filtro local (0 = desactivado). Modo "skip" o "defer" (reencola el LLM para más tarde)
+    AI_PRESCREEN_MIN_COVERAGE = float(os.getenv("AI_PRESCREEN_MIN_COVERAGE", "0"))
+    AI_PRESCREEN_MODE = os.getenv("AI_PRESCREEN_MODE", "defer")
+    AI_PRESCREEN_DEFER_SEC = int(os.getenv("AI_PRESCREEN_DEFER_SEC", "21600"))
+
+    # Long-poll de resultados IA (por debajo del --timeout de gunicorn). El aviso llega por
+    # LISTEN/NOTIFY; la re-consulta a la BD es solo red de seguridad
+    AI_RESULT_WAIT_MAX_SEC = float(os.getenv("AI_RESULT_WAIT_MAX_SEC", "25"))
+    AI_RESULT_RECHECK_SEC = float(os.getenv("AI_RESULT_RECHECK_SEC", "5"))
+
+    # Métricas por ejecución: precio USD por millón de tokens y ventana del export
+    AI_PRICE_INPUT_PER_MTOK = float(os.getenv("AI_PRICE_INPUT_PER_MTOK", "2.5"))
+    AI_PRICE_OUTPUT_PER_MTOK = float(os.getenv("AI_PRICE_OUTPUT_PER_MTOK", "10"))
+    SCORING_METRICS_WINDOW_MIN = int(os.getenv("SCORING_METRICS_WINDOW_MIN", "15"))
+    # Token del scraper para /metrics/scoring (sin él, solo con JWT de admin)
+    METRICS_SCRAPE_TOKEN = os.getenv("METRICS_SCRAPE_TOKEN") or None
+
+    # CVs casi idénticos (MinHash/LSH): umbral de los reportes y de reuso del CV_JSON (0 = sin reuso)
+    CV_SIMILARITY_THRESHOLD = float(os.getenv("CV_SIMILARITY_THRESHOLD", "0.8"))
+    AI_NEAR_DUP_REUSE_MIN = float(os.getenv("AI_NEAR_DUP_REUSE_MIN", "0.95"))
+
+    # Extraer/cachear el texto del CV apenas se sube (job `preprocess` en scoring_jobs)
+    CV_PREPROCESS_ON_UPLOAD = os.getenv("CV_PREPROCESS_ON_UPLOAD", "true").lower() == "true"
+
+    # Barrido de CVs huérfanos en S3: no toca objetos más nuevos que esto (subidas en curso)
+    CV_SWEEP_GRACE_HOURS = int(os.getenv("CV_SWEEP_GRACE_HOURS", "48"))
+    # =======================================================================
+
 
 class DevConfig(BaseConfig):
     DEBUG = True
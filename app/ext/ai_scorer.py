@@ -3,7 +3,7 @@
 """
 AI Scorer: flujo de evaluación de postulantes basado en CV.
 Incluye:
-  - Envío básico a Chat Completions con control de reintentos
+  - Envío a Chat Completions con Session compartida (keep-alive) y reintentos selectivos
   - Scoring legacy (posición + skills)
   - Scoring v2 (perfiles + texto crudo del CV)
   - Flujo Pin-Pon:
@@ -21,14 +21,117 @@ import os
 import re
 import json
 import time
+import random
+import hashlib
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+
 import requests
+from requests.adapters import HTTPAdapter
+
+from app.ext.llm_rate_limiter import llm_limiter, estimate_tokens
+from app.ext.llm_circuit_breaker import llm_breaker, CircuitOpenError
+from app.ext.cv_heuristics import CV_HEURISTICS_VERSION, extract_local
 
+logger = logging.getLogger(__name__)
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 AI_MODEL = os.getenv("AI_MODEL", "gpt-4o")
 AI_MAX_TOKENS = int(os.getenv("AI_MAX_TOKENS", "100000"))  
 AI_TEMPERATURE = float(os.getenv("AI_TEMPERATURE", "0.7"))
 
+# Cliente HTTP compartido (keep-alive + pool acotado)
+AI_CONNECT_TIMEOUT = float(os.getenv("AI_CONNECT_TIMEOUT", "5"))
+AI_READ_TIMEOUT = float(os.getenv("AI_READ_TIMEOUT", "60"))
+AI_POOL_MAXSIZE = int(os.getenv("AI_POOL_MAXSIZE", "8"))
+AI_BACKOFF_CAP_SEC = float(os.getenv("AI_BACKOFF_CAP_SEC", "30"))
+
+# Base configurable: proveedores compatibles o el servidor falso de benchmarks/
+AI_API_BASE = os.getenv("AI_API_BASE", "https://api.openai.com/v1").rstrip("/")
+_CHAT_URL = f"{AI_API_BASE}/chat/completions"
+_RETRYABLE_STATUS = {408, 409, 425, 429, 500, 502, 503, 504}
+# Fallas de transporte transitorias (incluye el cuerpo cortado a mitad de la respuesta)
+_RETRYABLE_NETWORK_ERRORS = (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)
+
+_session = None
+_session_lock = threading.Lock()
+_call_log = threading.local()
+
+
+class ChatAPIError(RuntimeError):
+    """Error HTTP del proveedor; `retryable` indica si vale la pena reintentar."""
+
+    def __init__(self, message, *, status_code=None, retryable=False, retry_after=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+def _get_session() -> requests.Session:
+    """
+    Session única por proceso: reutiliza conexiones TCP+TLS hacia el proveedor.
+    pool_block=True acota las conexiones simultáneas a AI_POOL_MAXSIZE.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                s = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=AI_POOL_MAXSIZE, pool_block=True, max_retries=0)
+                s.mount("https://", adapter)
+                s.mount("http://", adapter)
+                _session = s
+    return _session
+
+
+def _retry_after_seconds(resp) -> float | None:
+    """Lee Retry-After (segundos o fecha HTTP) o retry-after-ms."""
+    headers = getattr(resp, "headers", None) or {}
+    ms = headers.get("retry-after-ms")
+    if ms:
+        try:
+            return max(float(ms) / 1000.0, 0.0)
+        except ValueError:
+            pass
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except Exception:
+        return None
+
+
+def _backoff_delay(attempt: int, backoff: float, retry_after: float | None = None) -> float:
+    """Respeta Retry-After si viene; si no, backoff exponencial con jitter."""
+    if retry_after is not None:
+        return min(retry_after, AI_BACKOFF_CAP_SEC) + random.uniform(0, 0.25)
+    ceiling = min(AI_BACKOFF_CAP_SEC, backoff ** (attempt + 1))
+    return random.uniform(ceiling / 2.0, ceiling)
+
+
+def _record_call(stats: dict) -> None:
+    calls = getattr(_call_log, "calls", None)
+    if calls is None:
+        calls = _call_log.calls = []
+    calls.append(stats)
+    del calls[:-100]
+
+
+def pop_call_stats() -> list[dict]:
+    """
+    Devuelve y limpia las métricas de las llamadas hechas por ESTE hilo
+    (latency_ms, attempts, status, tokens de usage).
+    """
+    calls = getattr(_call_log, "calls", None) or []
+    _call_log.calls = []
+    return calls
 
 
 def _post_chat(
@@ -43,13 +146,14 @@ def _post_chat(
     Envía una conversación al endpoint /v1/chat/completions.
     - messages: [{"role":"system|user|assistant","content":"..."}]
     - response_format: "json_object" | "text"
-    - control de reintentos exponenciales
+    - reintenta solo errores de red, 429 y 5xx (honra Retry-After); un 4xx falla al instante
+    - cada intento pasa por el limitador global de RPM/TPM (llm_rate_limiter)
+    - con el circuit breaker abierto falla al instante con CircuitOpenError (sin reintentos)
     Devuelve SIEMPRE el "message.content" crudo (string). No recorta la respuesta.
     """
     if not OPENAI_API_KEY:
         raise RuntimeError("OPENAI_API_KEY no configurado")
 
-    url = "https://api.openai.com/v1/chat/completions"
     headers = {
         "Authorization": f"Bearer {OPENAI_API_KEY}",
         "Content-Type": "application/json",
@@ -63,16 +167,88 @@ def _post_chat(
     if response_format == "json_object":
         body["response_format"] = {"type": "json_object"}
 
+    retries = max(int(retries), 1)
+    session = _get_session()
+    est_tokens = estimate_tokens(messages, max_tokens)
+    started = time.monotonic()
+    rate_wait = 0.0
     last_err = None
     for attempt in range(retries):
+        retry_after = None
+        try:
+            llm_breaker.before_call()
+        except CircuitOpenError as e:
+            last_err = e
+            break
+        # Cada intento consume presupuesto global (RPM/TPM) antes de salir a la red
+        rate_wait += llm_limiter.acquire(est_tokens)
+        attempt_started = time.monotonic()
         try:
-            r = requests.post(url, json=body, headers=headers, timeout=60)
-            r.raise_for_status()
-            data = r.json()
-            return data["choices"][0]["message"]["content"]
-        except Exception as e:
+            r = session.post(_CHAT_URL, json=body, headers=headers, timeout=(AI_CONNECT_TIMEOUT, AI_READ_TIMEOUT))
+            if r.status_code >= 400:
+                retry_after = _retry_after_seconds(r)
+                raise ChatAPIError(
+                    f"{r.status_code} {r.reason}: {(r.text or '')[:300]}",
+                    status_code=r.status_code,
+                    retryable=r.status_code in _RETRYABLE_STATUS,
+                    retry_after=retry_after,
+                )
+            try:
+                data = r.json()
+                content = data["choices"][0]["message"]["content"]
+            except (ValueError, KeyError, IndexError, TypeError) as e:
+                # 200 con cuerpo malformado/truncado: transitorio, se reintenta
+                raise ChatAPIError(
+                    f"{r.status_code} respuesta inválida ({type(e).__name__}): {(r.text or '')[:300]}",
+                    status_code=r.status_code,
+                    retryable=True,
+                ) from e
+            llm_breaker.record_success(time.monotonic() - attempt_started)
+            usage = data.get("usage") or {}
+            stats = {
+                "model": AI_MODEL,
+                "latency_ms": int((time.monotonic() - started) * 1000),
+                "attempts": attempt + 1,
+                "status": r.status_code,
+                "prompt_tokens": usage.get("prompt_tokens"),
+                "completion_tokens": usage.get("completion_tokens"),
+                "total_tokens": usage.get("total_tokens"),
+                "rate_wait_ms": int(rate_wait * 1000),
+            }
+            _record_call(stats)
+            logger.info("[AI] chat OK %sms intentos=%s tokens=%s/%s",
+                        stats["latency_ms"], stats["attempts"], stats["prompt_tokens"], stats["completion_tokens"])
+            return content
+        except ChatAPIError as e:
+            last_err = e
+            # 429 es presupuesto (limitador), un 4xx es error del request: el proveedor responde
+            if e.status_code == 429:
+                llm_breaker.record_throttled(e.retry_after)
+            elif e.retryable:
+                llm_breaker.record_failure(e)
+            else:
+                llm_breaker.record_success(time.monotonic() - attempt_started)
+            if not e.retryable:
+                break
+        except _RETRYABLE_NETWORK_ERRORS as e:
             last_err = e
-            time.sleep(backoff ** attempt)
+            llm_breaker.record_failure(f"{type(e).__name__}: {e}")
+        if attempt + 1 < retries:
+            delay = _backoff_delay(attempt, backoff, retry_after)
+            logger.warning("[AI] chat reintento %s/%s en %.1fs: %s", attempt + 1, retries - 1, delay, last_err)
+            time.sleep(delay)
+
+    _record_call({
+        "model": AI_MODEL,
+        "latency_ms": int((time.monotonic() - started) * 1000),
+        "attempts": attempt + 1,
+        "status": getattr(last_err, "status_code", None),
+        "prompt_tokens": None,
+        "completion_tokens": None,
+        "total_tokens": None,
+        "rate_wait_ms": int(rate_wait * 1000),
+        "error": str(last_err),
+    })
     raise last_err
 
 
@@ -250,15 +426,15 @@ def _system_prompt_cv_parser() -> str:
         "UN JSON ESTRICTO con secciones estructuradas SOLO con información presente en el texto.\n"
         "PROHIBIDO inventar, inferir de contexto o agregar campos que no estén literal o inequívocamente presentes.\n"
         "Si algún campo no aparece, devuélvelo como null o [].\n"
+        "Email, teléfono y links (LinkedIn/GitHub) ya se extrajeron aparte: NO los incluyas.\n"
         "Formato JSON:\n"
         "{\n"
-        "  \"identidad\": { \"nombre\": null|string, \"email\": null|string, \"telefono\": null|string, \"ubicacion\": null|string },\n"
+        "  \"identidad\": { \"nombre\": null|string, \"ubicacion\": null|string },\n"
         "  \"educacion\": [ { \"titulo\": string, \"institucion\": string, \"periodo\": string|null } ],\n"
         "  \"experiencia\": [ { \"puesto\": string, \"empresa\": string|null, \"periodo\": string|null, \"funciones\": [string] } ],\n"
         "  \"habilidades\": [string],\n"
         "  \"certificaciones\": [ { \"nombre\": string, \"emisor\": string|null, \"url\": string|null } ],\n"
-        "  \"idiomas\": [ { \"idioma\": string, \"nivel\": string|null } ],\n"
-        "  \"links\": { \"linkedin\": string|null, \"github\": string|null }\n"
+        "  \"idiomas\": [ { \"idioma\": string, \"nivel\": string|null } ]\n"
         "}\n"
         "Responde SOLO con JSON válido. No comentes."
     )
@@ -274,21 +450,38 @@ def _user_prompt_cv_parser(cv_text: str) -> str:
     )
 
 
+def _cv_parser_prompt_version() -> str:
+    """Huella de los prompts del parser: cambia sola cuando se editan los prompts."""
+    raw = _system_prompt_cv_parser() + "\x00" + _user_prompt_cv_parser("") + "\x00" + CV_HEURISTICS_VERSION
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+CV_PARSER_PROMPT_VERSION = _cv_parser_prompt_version()
+
+
+def cv_text_fingerprint(cv_text: str) -> str:
+    """SHA-256 del texto normalizado (lo que realmente recibe el parser)."""
+    return hashlib.sha256(_normalize_cv_text(cv_text).encode("utf-8")).hexdigest()
+
+
 def summarize_cv_to_json(cv_text: str) -> dict:
     """
     Pin-Pon (Paso 1): Normaliza y parsea el CV a un JSON canónico con evidencia explícita.
+    Email, teléfono y links se extraen localmente (app/ext/cv_heuristics.py) y se
+    completan sobre la respuesta; el LLM recibe el texto sin ellos ni referencias.
     Nunca recorta la respuesta de la API antes de hacer json.loads.
     """
     normalized = _normalize_cv_text(cv_text)
+    local = extract_local(normalized)
     messages = [
         {"role": "system", "content": _system_prompt_cv_parser()},
-        {"role": "user", "content": _user_prompt_cv_parser(normalized)},
+        {"role": "user", "content": _user_prompt_cv_parser(local.text)},
     ]
     raw = _post_chat(messages, response_format="json_object", temperature=0.7, max_tokens=min(8000, AI_MAX_TOKENS))
     try:
-        return json.loads(raw)
+        return local.merge_into(json.loads(raw))
     except Exception:
-        return {
+        return local.merge_into({
             "identidad": {"nombre": None, "email": None, "telefono": None, "ubicacion": None},
             "educacion": [],
             "experiencia": [],
@@ -297,7 +490,7 @@ def summarize_cv_to_json(cv_text: str) -> dict:
             "idiomas": [],
             "links": {"linkedin": None, "github": None},
             "_raw": normalized,  
-        }
+        })
 
 
 def _canonicalize_terms(items: list[str]) -> list[str]:
@@ -340,23 +533,13 @@ def _system_prompt_v3() -> str:
     )
 
 
-def _comparison_prompt_v3(applicant_profile: dict, vacancy_profile: dict, cv_json: dict) -> str:
-    cv_json_norm = dict(cv_json or {})
-    cv_json_norm["_habilidades_tokens"] = _canonicalize_terms(cv_json.get("habilidades", []))
-    for exp in cv_json_norm.get("experiencia", []) or []:
-        funcs = exp.get("funciones") or []
-        exp["_funciones_tokens"] = _canonicalize_terms(funcs)
-
-    return f"""
-[PERFIL DEL POSTULANTE]
-- Residencia: {applicant_profile.get('residence_addr')}
-- Edad: {applicant_profile.get('age')}
-- Años en el rol: {applicant_profile.get('role_exp_years')}
-- Aspiración salarial: {applicant_profile.get('expected_salary')}
-- Identificación: {applicant_profile.get('credential')}
-- Teléfono: {applicant_profile.get('phone')}
-
-[PERFIL DEL CARGO]
+def render_vacancy_block(vacancy_profile: dict) -> str:
+    """
+    Bloque [PERFIL DEL CARGO] del prompt v3. Depende solo de la vacante, por lo que
+    se precalcula una vez por versión (ver app/services/scoring/vacancy_prompt.py)
+    y va al inicio del mensaje: prefijo estable para el prompt caching del proveedor.
+    """
+    return f"""[PERFIL DEL CARGO]
 - Cargo: {vacancy_profile.get('charge_title')}
 - Área: {vacancy_profile.get('charge_area')}
 - Objetivo del rol: {vacancy_profile.get('role_objective')}
@@ -367,17 +550,50 @@ def _comparison_prompt_v3(applicant_profile: dict, vacancy_profile: dict, cv_jso
 - Requisitos (experiencia): {vacancy_profile.get('req_experience')}
 - Requisitos (conocimientos): {vacancy_profile.get('req_knowledge')}
 - Descripción del cargo: {vacancy_profile.get('charge_description')}
+"""
 
-[CV_JSON — SOLO EVIDENCIA DEL CV (+ vistas tokenizadas genéricas)]
-{json.dumps(cv_json_norm, ensure_ascii=False)}
 
-GUÍAS DE EVALUACIÓN (GENÉRICAS, MULTI-INDUSTRIA)
+_GUIDES_V3 = """GUÍAS DE EVALUACIÓN (GENÉRICAS, MULTI-INDUSTRIA)
 - Distingue entre competencias núcleo del rol, herramientas de soporte y habilidades blandas a partir de los textos de requisitos y responsabilidades de la vacante.
 - No sobre-ponderes herramientas de soporte frente a competencias núcleo del rol.
 - Si 'funciones' está vacío pero existen 'puesto' y 'periodo', puntúa experiencia con base en esos campos (sin inventar funciones).
 - Para roles de entrada (ej.: pasantía, intern, trainee, junior), considera los requerimientos secundarios como deseables: su ausencia debe impactar menos que la falta de competencias núcleo.
 - Mantén coherencia con la modalidad/ubicación/educación solicitadas para el ajuste general.
+"""
+
+
+def _applicant_and_cv_block(applicant_profile: dict, cv_json: dict) -> str:
+    cv_json_norm = dict(cv_json or {})
+    cv_json_norm["_habilidades_tokens"] = _canonicalize_terms(cv_json.get("habilidades", []))
+    for exp in cv_json_norm.get("experiencia", []) or []:
+        funcs = exp.get("funciones") or []
+        exp["_funciones_tokens"] = _canonicalize_terms(funcs)
+
+    return f"""[PERFIL DEL POSTULANTE]
+- Residencia: {applicant_profile.get('residence_addr')}
+- Edad: {applicant_profile.get('age')}
+- Años en el rol: {applicant_profile.get('role_exp_years')}
+- Aspiración salarial: {applicant_profile.get('expected_salary')}
+- Identificación: {applicant_profile.get('credential')}
+- Teléfono: {applicant_profile.get('phone')}
+
+[CV_JSON — SOLO EVIDENCIA DEL CV (+ vistas tokenizadas genéricas)]
+{json.dumps(cv_json_norm, ensure_ascii=False)}
+"""
 
+
+def _comparison_prompt_v3(
+    applicant_profile: dict,
+    vacancy_profile: dict,
+    cv_json: dict,
+    vacancy_block: str | None = None,
+) -> str:
+    if vacancy_block is None:
+        vacancy_block = render_vacancy_block(vacancy_profile or {})
+
+    return f"""{vacancy_block}
+{_applicant_and_cv_block(applicant_profile, cv_json)}
+{_GUIDES_V3}
 INSTRUCCIONES
 1) Puntúa experiencia (0..40) usando 'experiencia' del CV_JSON (puesto, periodo y, si existen, funciones).
 2) Puntúa conocimientos (0..40) comparando los requerimientos de la vacante con la evidencia ('habilidades' y, si aplica, funciones o logros) del CV_JSON.
@@ -393,14 +609,20 @@ INSTRUCCIONES
 """
 
 
-def score_candidate_v3(applicant_profile: dict, vacancy_profile: dict, cv_json: dict) -> dict:
+def score_candidate_v3(
+    applicant_profile: dict,
+    vacancy_profile: dict,
+    cv_json: dict,
+    vacancy_block: str | None = None,
+) -> dict:
     """
     v3 (Pin-Pon): usa el JSON del CV (evidencia) para evaluar contra el perfil de vacante + postulante.
     Reglas genéricas, sin hardcode de dominios o stacks.
+    `vacancy_block` permite reutilizar el fragmento precalculado de la vacante.
     """
     messages = [
         {"role": "system", "content": _system_prompt_v3()},
-        {"role": "user", "content": _comparison_prompt_v3(applicant_profile, vacancy_profile, cv_json)},
+        {"role": "user", "content": _comparison_prompt_v3(applicant_profile, vacancy_profile, cv_json, vacancy_block)},
     ]
     raw = _post_chat(messages, response_format="json_object", temperature=0, max_tokens=min(900, AI_MAX_TOKENS))
     try:
@@ -413,14 +635,86 @@ def score_candidate_v3(applicant_profile: dict, vacancy_profile: dict, cv_json:
     }
 
 
+def _system_prompt_v3_multi() -> str:
+    return (
+        "Eres un evaluador de RRHH para múltiples industrias. "
+        "Evalúas al MISMO candidato contra VARIAS vacantes, cada una de forma independiente: "
+        "lo que exige una vacante no influye en el puntaje de otra. Cada vacante llega como una "
+        "postulación identificada por su id de postulación (no es el id de la vacante).\n"
+        "Usa el JSON estructurado del CV (sin inventar) para comparar contra el perfil de cada vacante.\n"
+        "Rúbrica por vacante: experiencia (0..40), conocimientos (0..40), ajuste general (0..20: educación/ubicación/modalidad).\n"
+        "Si hay discrepancias entre 'PERFIL DEL POSTULANTE' y 'CV_JSON' en identidad/ubicación, prioriza 'CV_JSON'.\n"
+        "Responde SOLO JSON: {resultados: [{postulacion:str, score:int 0..100, feedback:str 1–3 frases}]}."
+    )
+
+
+def _comparison_prompt_v3_multi(applicant_profile: dict, targets: list[dict], cv_json: dict) -> str:
+    blocks = "\n".join(
+        f"[POSTULACIÓN {t['key']}]\n{t.get('vacancy_block') or render_vacancy_block(t.get('vacancy_profile') or {})}"
+        for t in targets
+    )
+    keys = ", ".join(f'"{t["key"]}"' for t in targets)
+    return f"""{_applicant_and_cv_block(applicant_profile, cv_json)}
+{blocks}
+{_GUIDES_V3}
+INSTRUCCIONES
+1) Para CADA postulación ({keys}), contra el perfil de su vacante, aplica la rúbrica por separado: experiencia (0..40), conocimientos (0..40) y ajuste general (0..20) con educación, idioma.
+2) Usa solo la evidencia del CV_JSON ('experiencia', 'habilidades' y, si aplica, funciones o logros). No inventes datos.
+3) No califiques la ubicacion de la residencia del postulante.
+4) Da 0 a la vacante con la que el perfil sea incompatible y explica la razón en su feedback.
+5) Devuelve SOLO JSON, un elemento por postulación y en el mismo orden:
+{{
+  "resultados": [{{"postulacion": "<id de la postulación>", "score": <entero 0..100>, "feedback": "<frases concisas>"}}]
+}}
+"""
+
+
+def score_candidate_v3_multi(applicant_profile: dict, targets: list[dict], cv_json: dict) -> dict:
+    """
+    v3 multi-vacante: UNA llamada evalúa el CV_JSON contra N vacantes.
+    `targets`: [{"key", "vacancy_profile", "vacancy_block"?}]; key único por target
+    (el postulation_id) y así se rotula en el prompt, no como id de vacante.
+    Devuelve {key: {score, feedback}}; las postulaciones que falten en la respuesta no
+    aparecen y quien llama decide (p.ej. evaluarlas con score_candidate_v3).
+    """
+    messages = [
+        {"role": "system", "content": _system_prompt_v3_multi()},
+        {"role": "user", "content": _comparison_prompt_v3_multi(applicant_profile, targets, cv_json)},
+    ]
+    max_tokens = min(300 + 300 * len(targets), AI_MAX_TOKENS)
+    raw = _post_chat(messages, response_format="json_object", temperature=0, max_tokens=max_tokens)
+    try:
+        items = json.loads(raw).get("resultados") or []
+    except Exception:
+        items = []
+    wanted = {str(t["key"]) for t in targets}
+    out = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        key = str(item.get("postulacion") or "").strip()
+        if key in wanted and key not in out:
+            out[key] = {
+                "score": _clamp(item.get("score"), 0, 100),
+                "feedback": (item.get("feedback") or "").strip() or "Sin comentarios.",
+            }
+    return out
+
+
 # =======================================================
 # Helpers públicos para orquestación externa
 # =======================================================
 __all__ = [
     "_post_chat",
     "_clamp",
+    "ChatAPIError",
+    "pop_call_stats",
     "score_candidate",        
     "score_candidate_v2",     
     "summarize_cv_to_json",  
+    "cv_text_fingerprint",
+    "CV_PARSER_PROMPT_VERSION",
     "score_candidate_v3",     
+    "score_candidate_v3_multi",
+    "render_vacancy_block",
 ]
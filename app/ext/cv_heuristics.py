@@ -0,0 +1,148 @@
+# app/ext/cv_heuristics.py
+"""
+Extracción local (regex, sin LLM) de datos deterministas del CV.
+
+Email, teléfono y links de LinkedIn/GitHub se leen del texto normalizado por
+`_normalize_cv_text` y se pre-llenan en el CV_JSON; el parser LLM ya no los pide
+(menos tokens de salida) y recibe el texto sin ellos ni la sección de referencias
+(menos tokens de entrada). Nombre y ubicación siguen a cargo del LLM.
+"""
+import re
+from dataclasses import dataclass, field
+
+# Cambia la entrada del parser: forma parte de CV_PARSER_PROMPT_VERSION
+CV_HEURISTICS_VERSION = "2"
+
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+_LINKEDIN_RE = re.compile(r"(?i)(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/(?:in|pub)/[A-Za-z0-9_%-]+/?")
+_GITHUB_RE = re.compile(r"(?i)(?:https?://)?(?:www\.)?github\.com/[A-Za-z0-9](?:[A-Za-z0-9-]{0,38})/?(?![A-Za-z0-9/-])")
+_PHONE_RE = re.compile(r"(?<![\w+])(?:\+\d{1,3}[\s.-]?)?(?:\(\d{1,4}\)[\s.-]?)?\d[\d\s.-]{5,16}\d(?!\w)")
+_PHONE_LABELS = r"tel[eé]fono|tel|cel(?:ular)?|m[oó]vil|phone|whatsapp|contacto"
+_PHONE_LABEL_RE = re.compile(rf"(?i)\b({_PHONE_LABELS})\b")
+# Líneas que quedan solo con etiquetas/puntuación tras quitar los contactos
+_EMPTY_LABEL_LINE_RE = re.compile(
+    rf"(?im)^[ \t]*(?:(?:{_PHONE_LABELS}|e-?mail|correo|linkedin|github)\b|[-|,;:./ \t])*$"
+)
+_YEAR_RANGE_RE = re.compile(r"^(19|20)\d{2}\s*[-.]\s*(19|20)\d{2}$")
+_SECTION_RE = re.compile(r"^### (.+)$", re.MULTILINE)
+
+# Secciones sin valor para el JSON del parser (datos de terceros)
+_DROP_SECTIONS = {"REFERENCIAS"}
+# Resto de la línea original tras un encabezado a descartar ("Referencias laborales:")
+_DROP_HEADING_TAIL_RE = re.compile(r"(?i)[ \t]*(?:personales|laborales|profesionales|familiares)?[ \t]*[:.\-]?[ \t]*")
+
+
+@dataclass
+class LocalExtraction:
+    email: str | None = None
+    phone: str | None = None
+    linkedin: str | None = None
+    github: str | None = None
+    sections: list[str] = field(default_factory=list)
+    text: str = ""  # lo que recibe el parser LLM
+
+    def merge_into(self, cv_json: dict) -> dict:
+        """Completa identidad/links del CV_JSON del LLM con lo extraído localmente."""
+        out = dict(cv_json or {})
+        ident = dict(out.get("identidad") or {})
+        out["identidad"] = {
+            "nombre": ident.get("nombre"),
+            "email": self.email or ident.get("email"),
+            "telefono": self.phone or ident.get("telefono"),
+            "ubicacion": ident.get("ubicacion"),
+        }
+        links = dict(out.get("links") or {})
+        out["links"] = {
+            "linkedin": self.linkedin or links.get("linkedin"),
+            "github": self.github or links.get("github"),
+        }
+        return out
+
+
+def _own_line(normalized: str, m: re.Match) -> bool:
+    """
+    ¿El marcador venía de una línea propia? _normalize_cv_text marca la palabra
+    donde aparezca ("manejo de referencias bibliográficas"); el salto que agrega
+    antes y después permite ver qué había en la misma línea del original.
+    """
+    before = normalized[:max(m.start() - 1, 0)].rsplit("\n", 1)[-1]
+    after = normalized[m.end() + 1:].split("\n", 1)[0]
+    return not before.strip() and bool(_DROP_HEADING_TAIL_RE.fullmatch(after))
+
+
+def split_sections(normalized: str) -> list[tuple[str | None, str]]:
+    """
+    [(encabezado|None, cuerpo)] según los marcadores '### X' de _normalize_cv_text.
+    Un marcador de _DROP_SECTIONS en medio de una frase no abre sección: queda en el cuerpo.
+    """
+    parts: list[tuple[str | None, str]] = []
+    last, heading = 0, None
+    for m in _SECTION_RE.finditer(normalized):
+        if m.group(1).strip().upper() in _DROP_SECTIONS and not _own_line(normalized, m):
+            continue
+        parts.append((heading, normalized[last:m.start()]))
+        heading, last = m.group(1).strip().upper(), m.end()
+    parts.append((heading, normalized[last:]))
+    return [(h, body) for h, body in parts if h is not None or body.strip()]
+
+
+def _digits(s: str) -> str:
+    return re.sub(r"\D", "", s)
+
+
+def _phone_candidates(text: str):
+    for line in text.splitlines():
+        labelled = bool(_PHONE_LABEL_RE.search(line))
+        for m in _PHONE_RE.finditer(line):
+            raw = m.group(0).strip(" .-")
+            digits = _digits(raw)
+            if not 7 <= len(digits) <= 15 or _YEAR_RANGE_RE.match(raw):
+                continue
+            separated = bool(re.search(r"[\s().-]", raw))
+            # Un número de 10 dígitos sin formato puede ser una cédula: solo con etiqueta
+            if labelled or raw.startswith("+") or (separated and len(digits) >= 9):
+                yield raw, m
+
+
+def _url(found: str) -> str:
+    found = found.rstrip("/")
+    return found if found.lower().startswith("http") else f"https://{found}"
+
+
+def extract_local(normalized: str) -> LocalExtraction:
+    """Extrae contactos y arma el texto reducido para el parser (ver docstring del módulo)."""
+    sections = split_sections(normalized)
+    kept = [(h, body) for h, body in sections if h not in _DROP_SECTIONS]
+    own_text = "\n".join(body for _, body in kept)
+
+    out = LocalExtraction(sections=[h for h, _ in sections if h])
+    email = _EMAIL_RE.search(own_text)
+    out.email = email.group(0).lower() if email else None
+    linkedin = _LINKEDIN_RE.search(own_text)
+    out.linkedin = _url(linkedin.group(0)) if linkedin else None
+    github = _GITHUB_RE.search(own_text)
+    out.github = _url(github.group(0)) if github else None
+
+    # Teléfono: primero fuera de URLs/emails para no confundir ids numéricos
+    scrubbed = _LINKEDIN_RE.sub(" ", _GITHUB_RE.sub(" ", _EMAIL_RE.sub(" ", own_text)))
+    phone = next(_phone_candidates(scrubbed), None)
+    out.phone = phone[0] if phone else None
+
+    def reduce(body: str) -> str:
+        body = _EMAIL_RE.sub("", body)
+        body = _LINKEDIN_RE.sub("", body)
+        body = _GITHUB_RE.sub("", body)
+        if out.phone:
+            body = body.replace(out.phone, "")
+        body = _EMPTY_LABEL_LINE_RE.sub("", body)
+        return re.sub(r"\n{3,}", "\n\n", body)
+
+    chunks = []
+    for heading, body in kept:
+        body = reduce(body)
+        if heading is None:
+            chunks.append(body.strip())
+        elif body.strip():
+            chunks.append(f"### {heading}\n{body.strip()}")
+    out.text = "\n\n".join(c for c in chunks if c)
+    return out
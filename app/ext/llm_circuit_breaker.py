@@ -0,0 +1,228 @@
+# app/ext/llm_circuit_breaker.py
+"""
+Circuit breaker hacia el proveedor LLM.
+
+- closed: las llamadas pasan; cada fallo de red/timeout/5xx o respuesta más lenta
+  que AI_BREAKER_SLOW_CALL_SEC suma un fallo consecutivo, un éxito los reinicia.
+- open: tras AI_BREAKER_FAILURE_THRESHOLD fallos seguidos, las llamadas fallan al
+  instante con CircuitOpenError durante AI_BREAKER_OPEN_SEC.
+- half_open: vencido el enfriamiento, UNA llamada de sonda pasa (las demás siguen
+  rechazadas); si responde bien el circuito se cierra, si falla vuelve a abrirse.
+  Si la sonda recibe un 429 (el proveedor responde, pero sin cupo) se libera el
+  turno de sonda: la siguiente llamada, pasado el Retry-After, sondea de nuevo.
+
+Igual que el limitador de tasa: con app context el estado vive en
+`llm_circuit_breakers` (lock de fila); sin app context, en memoria del proceso.
+Si la BD falla se usa el estado local y se reintenta la BD cada
+AI_BREAKER_DB_RETRY_SEC segundos.
+"""
+import os
+import time
+import logging
+import threading
+
+from flask import has_app_context
+from sqlalchemy import select, insert, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from app.ext.db import db
+from app.models.llm_circuit_breaker import LLMCircuitBreaker
+
+logger = logging.getLogger(__name__)
+
+# 0 = breaker desactivado
+AI_BREAKER_FAILURE_THRESHOLD = int(os.getenv("AI_BREAKER_FAILURE_THRESHOLD", "5"))
+AI_BREAKER_OPEN_SEC = float(os.getenv("AI_BREAKER_OPEN_SEC", "60"))
+# 0 = no cuenta la latencia como fallo
+AI_BREAKER_SLOW_CALL_SEC = float(os.getenv("AI_BREAKER_SLOW_CALL_SEC", "45"))
+# Si la sonda no informa en este plazo (proceso caído), otra llamada puede sondear
+AI_BREAKER_PROBE_TIMEOUT_SEC = float(os.getenv("AI_BREAKER_PROBE_TIMEOUT_SEC", "120"))
+AI_BREAKER_DB_RETRY_SEC = float(os.getenv("AI_BREAKER_DB_RETRY_SEC", "30"))
+
+
+class CircuitOpenError(RuntimeError):
+    """El circuito está abierto: no se llamó al proveedor. `retry_after` en segundos."""
+
+    def __init__(self, message, *, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    def __init__(self, name: str = "openai", *, failure_threshold: int = AI_BREAKER_FAILURE_THRESHOLD,
+                 open_sec: float = AI_BREAKER_OPEN_SEC, slow_call_sec: float = AI_BREAKER_SLOW_CALL_SEC,
+                 probe_timeout: float = AI_BREAKER_PROBE_TIMEOUT_SEC,
+                 db_retry: float = AI_BREAKER_DB_RETRY_SEC):
+        self.name = name
+        self.failure_threshold = int(failure_threshold or 0)
+        self.open_sec = float(open_sec)
+        self.slow_call_sec = float(slow_call_sec or 0)
+        self.probe_timeout = float(probe_timeout)
+        self.db_retry = float(db_retry)
+        self._lock = threading.Lock()
+        self._local = self._initial(time.time())
+        self._db_failed_at: float | None = None  # time.time de la última falla de la BD
+
+    @property
+    def enabled(self) -> bool:
+        return self.failure_threshold > 0
+
+    # ---------- API ----------
+    def before_call(self) -> None:
+        """Lanza CircuitOpenError si el circuito no admite la llamada (ni como sonda)."""
+        if not self.enabled:
+            return
+        retry_after = self._transition(self._admit)
+        if retry_after is not None:
+            raise CircuitOpenError(
+                f"Circuito LLM '{self.name}' abierto; reintentar en {retry_after:.0f}s",
+                retry_after=retry_after,
+            )
+
+    def record_success(self, latency_sec: float = 0.0) -> None:
+        if not self.enabled:
+            return
+        if self.slow_call_sec and latency_sec > self.slow_call_sec:
+            self.record_failure(f"respuesta lenta ({latency_sec:.1f}s)")
+            return
+        self._transition(self._on_success)
+
+    def record_failure(self, error) -> None:
+        if not self.enabled:
+            return
+        self._transition(lambda st, now: self._on_failure(st, now, str(error)[:255]))
+
+    def record_throttled(self, retry_after: float | None = None) -> None:
+        """429: ni éxito ni fallo; si era la sonda, libera el turno para la próxima llamada."""
+        if not self.enabled:
+            return
+        self._transition(lambda st, now: self._on_throttled(st, now, retry_after))
+
+    def retry_after(self) -> float | None:
+        """Segundos hasta que el circuito admita una llamada; None si está cerrado."""
+        if not self.enabled:
+            return None
+        st = self._peek()
+        now = time.time()
+        if st["state"] == "closed" or (st["retry_at"] or 0) <= now:
+            return None
+        return st["retry_at"] - now
+
+    def snapshot(self) -> dict:
+        if not self.enabled:
+            return {"name": self.name, "enabled": False, "state": "closed"}
+        st = self._peek()
+        retry_in = self.retry_after()
+        return {
+            "name": self.name,
+            "enabled": True,
+            "state": st["state"],
+            "failures": st["failures"],
+            "failure_threshold": self.failure_threshold,
+            "retry_in_sec": round(retry_in, 1) if retry_in is not None else None,
+            "opened_at": st["opened_at"],
+            "last_error": st["last_error"],
+            "shared": self._use_db(),
+        }
+
+    # ---------- transiciones (puras sobre un dict de estado) ----------
+    @staticmethod
+    def _initial(now: float) -> dict:
+        return {"state": "closed", "failures": 0, "opened_at": None, "retry_at": None,
+                "last_error": None, "updated_at": now}
+
+    def _admit(self, st: dict, now: float) -> float | None:
+        if st["state"] == "closed":
+            return None
+        if (st["retry_at"] or 0) > now:
+            return st["retry_at"] - now
+        # Enfriamiento vencido (o sonda abandonada): esta llamada es la sonda
+        st.update(state="half_open", retry_at=now + self.probe_timeout)
+        logger.warning("[AI] circuit breaker '%s' half_open: sondeando proveedor", self.name)
+        return None
+
+    def _on_success(self, st: dict, now: float) -> None:
+        if st["state"] != "closed":
+            logger.warning("[AI] circuit breaker '%s' cerrado: proveedor recuperado", self.name)
+        st.update(state="closed", failures=0, retry_at=None)
+
+    def _on_throttled(self, st: dict, now: float, retry_after: float | None) -> None:
+        if st["state"] == "half_open":
+            st["retry_at"] = now + min(max(retry_after or 0.0, 0.0), self.open_sec)
+
+    def _on_failure(self, st: dict, now: float, error: str) -> None:
+        st["failures"] = (st["failures"] or 0) + 1
+        st["last_error"] = error
+        if st["state"] == "half_open" or st["failures"] >= self.failure_threshold:
+            if st["state"] != "open":
+                logger.error("[AI] circuit breaker '%s' abierto %.0fs tras %s fallos: %s",
+                             self.name, self.open_sec, st["failures"], error)
+            st.update(state="open", opened_at=now, retry_at=now + self.open_sec)
+
+    # ---------- persistencia ----------
+    def _use_db(self) -> bool:
+        if not has_app_context():
+            return False
+        failed_at = self._db_failed_at
+        return failed_at is None or time.time() - failed_at >= self.db_retry
+
+    def _transition(self, fn):
+        if self._use_db():
+            try:
+                out = self._transition_db(fn)
+            except SQLAlchemyError:
+                self._db_failed_at = time.time()
+                logger.exception("[AI] circuit breaker compartido no disponible; estado local por %.0fs",
+                                 self.db_retry)
+            else:
+                if self._db_failed_at is not None:
+                    self._db_failed_at = None
+                    logger.info("[AI] circuit breaker compartido recuperado")
+                return out
+        with self._lock:
+            now = time.time()
+            out = fn(self._local, now)
+            self._local["updated_at"] = now
+            return out
+
+    def _transition_db(self, fn):
+        table = LLMCircuitBreaker.__table__
+        # Conexión propia: no toca la transacción de db.session del llamador
+        with db.engine.begin() as conn:
+            row = conn.execute(
+                select(table).where(table.c.name == self.name).with_for_update()
+            ).first()
+            now = time.time()
+            st = self._initial(now) if row is None else {
+                k: getattr(row, k) for k in ("state", "failures", "opened_at", "retry_at", "last_error", "updated_at")
+            }
+            before = dict(st)
+            out = fn(st, now)
+            if st == before:
+                return out
+            st["updated_at"] = now
+            if row is None:
+                try:
+                    conn.execute(insert(table).values(name=self.name, **st))
+                except IntegrityError:
+                    pass  # otro proceso creó la fila; la próxima transición la usa
+            else:
+                conn.execute(update(table).where(table.c.name == self.name).values(**st))
+            return out
+
+    def _peek(self) -> dict:
+        if self._use_db():
+            try:
+                table = LLMCircuitBreaker.__table__
+                with db.engine.connect() as conn:
+                    row = conn.execute(select(table).where(table.c.name == self.name)).first()
+                if row is None:
+                    return self._initial(time.time())
+                return {k: getattr(row, k) for k in ("state", "failures", "opened_at", "retry_at", "last_error", "updated_at")}
+            except SQLAlchemyError:
+                logger.exception("[AI] no se pudo leer el circuit breaker compartido")
+        with self._lock:
+            return dict(self._local)
+
+
+llm_breaker = CircuitBreaker()
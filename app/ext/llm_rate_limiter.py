@@ -0,0 +1,205 @@
+# app/ext/llm_rate_limiter.py
+"""
+Token bucket global hacia el proveedor LLM: presupuesta requests/min y
+tokens/min (estimados con largo del prompt + max_tokens).
+
+- Con app context, el estado vive en `llm_rate_buckets` y se coordina entre
+  procesos/pods con un lock de fila (SELECT ... FOR UPDATE).
+- Sin app context (scripts, tests) cae a un bucket en memoria del proceso.
+  Si la BD falla se usa el bucket local y se reintenta la BD cada
+  AI_RATE_LIMIT_DB_RETRY_SEC segundos.
+Las llamadas que exceden el presupuesto esperan en cola hasta AI_RATE_LIMIT_MAX_WAIT_SEC.
+"""
+import os
+import time
+import random
+import logging
+import threading
+
+from flask import has_app_context
+from sqlalchemy import select, insert, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from app.ext.db import db
+from app.models.llm_rate_bucket import LLMRateBucket
+
+logger = logging.getLogger(__name__)
+
+# 0 = sin límite. Configurar con los límites reales de la cuenta del proveedor.
+AI_RATE_LIMIT_RPM = float(os.getenv("AI_RATE_LIMIT_RPM", "0"))
+AI_RATE_LIMIT_TPM = float(os.getenv("AI_RATE_LIMIT_TPM", "0"))
+AI_RATE_LIMIT_MAX_WAIT_SEC = float(os.getenv("AI_RATE_LIMIT_MAX_WAIT_SEC", "300"))
+AI_RATE_LIMIT_DB_RETRY_SEC = float(os.getenv("AI_RATE_LIMIT_DB_RETRY_SEC", "30"))
+
+
+class RateLimitTimeout(RuntimeError):
+    """La llamada esperó más de max_wait sin obtener presupuesto."""
+
+
+def estimate_tokens(messages, max_tokens: int) -> int:
+    """Estimación barata: ~4 caracteres por token de prompt + tope de salida."""
+    chars = sum(len(m.get("content") or "") for m in messages or [])
+    return chars // 4 + int(max_tokens or 0)
+
+
+class TokenBucketLimiter:
+    def __init__(self, name: str = "openai", *, rpm: float = AI_RATE_LIMIT_RPM,
+                 tpm: float = AI_RATE_LIMIT_TPM, max_wait: float = AI_RATE_LIMIT_MAX_WAIT_SEC,
+                 db_retry: float = AI_RATE_LIMIT_DB_RETRY_SEC):
+        self.name = name
+        self.rpm = float(rpm or 0)
+        self.tpm = float(tpm or 0)
+        self.max_wait = float(max_wait)
+        self.db_retry = float(db_retry)
+        self._lock = threading.Lock()
+        self._local = {"req": self.rpm, "tok": self.tpm, "at": time.time()}
+        self._waiting = 0
+        self._db_failed_at: float | None = None  # monotonic de la última falla de la BD
+
+    @property
+    def enabled(self) -> bool:
+        return self.rpm > 0 or self.tpm > 0
+
+    # ---------- API ----------
+    def acquire(self, est_tokens: int) -> float:
+        """
+        Bloquea hasta tener presupuesto para 1 request y `est_tokens` tokens.
+        Devuelve los segundos esperados; lanza RateLimitTimeout si supera max_wait.
+        """
+        if not self.enabled:
+            return 0.0
+        cost = min(float(est_tokens or 0), self.tpm) if self.tpm > 0 else 0.0
+        started = time.monotonic()
+        queued = False
+        try:
+            while True:
+                wait = self._try_take(cost)
+                if wait <= 0:
+                    waited = time.monotonic() - started
+                    if waited > 0.05:
+                        logger.info("[AI] rate limit: esperó %.2fs (tokens=%s)", waited, int(cost))
+                    return waited
+                if time.monotonic() - started + wait > self.max_wait:
+                    raise RateLimitTimeout(
+                        f"Presupuesto LLM agotado: espera estimada {wait:.1f}s supera {self.max_wait:.0f}s"
+                    )
+                if not queued:
+                    queued = True
+                    with self._lock:
+                        self._waiting += 1
+                time.sleep(min(wait, 2.0) + random.uniform(0, 0.1))
+        finally:
+            if queued:
+                with self._lock:
+                    self._waiting -= 1
+
+    def snapshot(self) -> dict:
+        """Nivel actual de los buckets y saturación (0 = libre, 1 = agotado)."""
+        if not self.enabled:
+            return {"name": self.name, "enabled": False, "saturation": 0.0, "waiting": 0}
+        req, tok = self._peek()
+        sat = []
+        if self.rpm > 0:
+            sat.append(1.0 - req / self.rpm)
+        if self.tpm > 0:
+            sat.append(1.0 - tok / self.tpm)
+        return {
+            "name": self.name,
+            "enabled": True,
+            "rpm": self.rpm,
+            "tpm": self.tpm,
+            "requests_available": round(req, 2),
+            "tokens_available": int(tok),
+            "saturation": round(max(sat), 3),
+            "waiting": self._waiting,
+            "shared": self._use_db(),
+        }
+
+    # ---------- internals ----------
+    def _refill(self, req: float, tok: float, elapsed: float) -> tuple[float, float]:
+        elapsed = max(elapsed, 0.0)
+        return (
+            min(self.rpm, req + elapsed * self.rpm / 60.0),
+            min(self.tpm, tok + elapsed * self.tpm / 60.0),
+        )
+
+    def _take(self, req: float, tok: float, cost: float) -> tuple[float, float, float]:
+        """Devuelve (req, tok, wait). wait == 0 significa que se consumió el presupuesto."""
+        need_req = 1.0 if self.rpm > 0 else 0.0
+        if req >= need_req and tok >= cost:
+            return req - need_req, tok - cost, 0.0
+        wait = 0.0
+        if self.rpm > 0 and req < need_req:
+            wait = max(wait, (need_req - req) * 60.0 / self.rpm)
+        if self.tpm > 0 and tok < cost:
+            wait = max(wait, (cost - tok) * 60.0 / self.tpm)
+        return req, tok, wait
+
+    def _use_db(self) -> bool:
+        if not has_app_context():
+            return False
+        failed_at = self._db_failed_at
+        return failed_at is None or time.monotonic() - failed_at >= self.db_retry
+
+    def _try_take(self, cost: float) -> float:
+        if self._use_db():
+            try:
+                wait = self._try_take_db(cost)
+            except SQLAlchemyError:
+                self._db_failed_at = time.monotonic()
+                logger.exception("[AI] rate limit compartido no disponible; bucket local por %.0fs",
+                                 self.db_retry)
+            else:
+                if self._db_failed_at is not None:
+                    self._db_failed_at = None
+                    logger.info("[AI] rate limit compartido recuperado")
+                return wait
+        return self._try_take_local(cost)
+
+    def _try_take_local(self, cost: float) -> float:
+        with self._lock:
+            now = time.time()
+            req, tok = self._refill(self._local["req"], self._local["tok"], now - self._local["at"])
+            req, tok, wait = self._take(req, tok, cost)
+            self._local.update(req=req, tok=tok, at=now)
+            return wait
+
+    def _try_take_db(self, cost: float) -> float:
+        table = LLMRateBucket.__table__
+        # Conexión propia: no toca la transacción de db.session del llamador
+        with db.engine.begin() as conn:
+            row = conn.execute(
+                select(table).where(table.c.name == self.name).with_for_update()
+            ).first()
+            now = time.time()
+            if row is None:
+                req, tok = self.rpm, self.tpm
+            else:
+                req, tok = self._refill(row.req_level, row.tok_level, now - row.refilled_at)
+            req, tok, wait = self._take(req, tok, cost)
+            values = {"req_level": req, "tok_level": tok, "refilled_at": now}
+            if row is None:
+                try:
+                    conn.execute(insert(table).values(name=self.name, **values))
+                except IntegrityError:
+                    return 0.05  # otro proceso creó la fila; reintentar
+            else:
+                conn.execute(update(table).where(table.c.name == self.name).values(**values))
+            return wait
+
+    def _peek(self) -> tuple[float, float]:
+        if self._use_db():
+            try:
+                table = LLMRateBucket.__table__
+                with db.engine.connect() as conn:
+                    row = conn.execute(select(table).where(table.c.name == self.name)).first()
+                if row is None:
+                    return self.rpm, self.tpm
+                return self._refill(row.req_level, row.tok_level, time.time() - row.refilled_at)
+            except SQLAlchemyError:
+                logger.exception("[AI] no se pudo leer el bucket compartido")
+        with self._lock:
+            return self._refill(self._local["req"], self._local["tok"], time.time() - self._local["at"])
+
+
+llm_limiter = TokenBucketLimiter()
@@ -0,0 +1,110 @@
+# app/ext/ocr_pool.py
+"""
+Pool de procesos dedicado a OCR (easyocr).
+
+El modelo (y torch) se cargan UNA vez por proceso OCR, recién cuando llega la
+primera página escaneada; los procesos web/API nunca importan easyocr/torch.
+Las imágenes viajan al pool por la cola interna de ProcessPoolExecutor.
+OCR_WORKERS dimensiona la concurrencia de OCR de forma independiente.
+"""
+import os
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, Future
+from concurrent.futures.process import BrokenProcessPool
+
+logger = logging.getLogger(__name__)
+
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", "2"))
+OCR_LANGS = [x.strip() for x in os.getenv("OCR_LANGS", "es").split(",") if x.strip()]
+OCR_PAGE_TIMEOUT_SEC = float(os.getenv("OCR_PAGE_TIMEOUT_SEC", "120"))
+
+# ---- Estado dentro de cada proceso OCR ----
+_reader = None
+
+
+def _init_ocr_process(langs: list[str]) -> None:
+    global _reader
+    try:
+        import easyocr
+        _reader = easyocr.Reader(langs, gpu=False)
+    except Exception:
+        logging.getLogger(__name__).exception("[OCR] no se pudo cargar easyocr")
+        _reader = None
+
+
+def _ocr_in_process(image) -> str:
+    if _reader is None:
+        # Falla (no página vacía): el llamador no debe cachear el resultado
+        raise RuntimeError("easyocr no disponible en el proceso OCR")
+    import numpy as np
+    result = _reader.readtext(np.array(image))
+    return " ".join((frag[1] for frag in result)) if result else ""
+
+
+# ---- Lado cliente (proceso que extrae el PDF) ----
+class OCRPool:
+    """
+    Si un proceso OCR muere, el ProcessPoolExecutor queda roto para siempre:
+    `submit` lo detecta, lo descarta y reintenta una vez en un pool nuevo.
+    `task` es la función que corre en el proceso OCR (picklable).
+    """
+
+    def __init__(self, workers: int = OCR_WORKERS, langs: list[str] | None = None, task=None):
+        self.workers = max(int(workers), 1)
+        self.langs = langs or OCR_LANGS
+        self.task = task or _ocr_in_process
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    # spawn: no heredar hilos/sockets del worker que extrae
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_init_ocr_process,
+                        initargs=(self.langs,),
+                    )
+                    logger.info("[OCR] pool iniciado workers=%s langs=%s", self.workers, self.langs)
+        return self._executor
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        """Descarta `executor` si sigue siendo el vigente (otro hilo pudo haberlo recreado ya)."""
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, image) -> Future:
+        executor = self._get_executor()
+        try:
+            return executor.submit(self.task, image)
+        except BrokenProcessPool:
+            logger.warning("[OCR] pool roto (murió un proceso OCR); se recrea")
+            self._discard(executor)
+            return self._get_executor().submit(self.task, image)
+
+    def ocr_image(self, image, timeout: float | None = OCR_PAGE_TIMEOUT_SEC) -> str | None:
+        """OCR de una imagen PIL; None ante cualquier falla (timeout, pool roto, sin modelo)."""
+        try:
+            return self.submit(image).result(timeout=timeout) or ""
+        except BrokenProcessPool:
+            logger.exception("[OCR] pool roto; se recrea en el próximo submit")
+            return None
+        except Exception:
+            logger.exception("[OCR] fallo OCR de página")
+            return None
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait, cancel_futures=True)
+                self._executor = None
+
+
+ocr_pool = OCRPool()
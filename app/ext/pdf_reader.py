@@ -1,54 +1,186 @@
 # app/ext/pdf_reader.py
+import io
+import os
+import time
+import logging
+from concurrent.futures import FIRST_COMPLETED, wait as _wait_futures
+
 import pdfplumber
-from pdf2image import convert_from_path
-import numpy as np
+from pdf2image import convert_from_bytes, convert_from_path
+
+from app.ext.ocr_pool import ocr_pool
+
+logger = logging.getLogger(__name__)
 
 _OCR_MIN_CHARS = 40          
 _POPPLER_PATH = None        
+_OCR_DPI = 300
+
+# "batch": rasteriza por tramos contiguos y hace OCR en paralelo (default)
+# "sequential": una invocación de poppler + OCR por página, en orden
+PDF_OCR_MODE = os.getenv("PDF_OCR_MODE", "batch").lower()
+OCR_MAX_PAGES = int(os.getenv("OCR_MAX_PAGES", "10"))
+OCR_TIME_BUDGET_SEC = float(os.getenv("OCR_TIME_BUDGET_SEC", "90"))
+
+# Subir cuando cambie la forma de extraer (invalida cv_text_cache)
+EXTRACTOR_VERSION = "plumber-easyocr-1"
+
 
-try:
-    import easyocr
-    _reader = easyocr.Reader(['es'], gpu=False)
-except Exception:
-    _reader = None 
+def _rasterize(source, **kwargs):
+    """pdf2image sobre bytes en memoria o sobre una ruta en disco."""
+    if isinstance(source, (bytes, bytearray)):
+        return convert_from_bytes(bytes(source), **kwargs)
+    return convert_from_path(source, **kwargs)
 
 
-def _ocr_page(file_path: str, page_number: int, dpi: int = 300) -> str:
+def _ocr_page(source, page_number: int, dpi: int = _OCR_DPI) -> str | None:
     """
-    Convierte una página del PDF a imagen y aplica OCR con easyocr.
-    NO usa variables de entorno; usa defaults internos.
+    Convierte una página del PDF (bytes o ruta) a imagen y aplica OCR con easyocr
+    en el pool de procesos OCR (el modelo nunca se carga en este proceso).
+    None si el OCR falló.
     """
     try:
-        images = convert_from_path(
-            file_path,
+        images = _rasterize(
+            source,
             dpi=dpi,
             first_page=page_number,
             last_page=page_number,
             poppler_path=_POPPLER_PATH, 
         )
-        if not images or _reader is None:
+        if not images:
             return ""
-        img = images[0]
-        result = _reader.readtext(np.array(img))
-        return " ".join((frag[1] for frag in result)) if result else ""
+        return ocr_pool.ocr_image(images[0])
     except Exception:
-        return ""
+        return None
 
 
-def extract_text_from_pdf(path: str) -> str:
+def _contiguous_runs(pages: list[int]) -> list[tuple[int, int]]:
+    """[1,2,3,6,7] -> [(1,3), (6,7)]: un rango por invocación de poppler."""
+    runs = []
+    for n in sorted(pages):
+        if runs and n == runs[-1][1] + 1:
+            runs[-1] = (runs[-1][0], n)
+        else:
+            runs.append((n, n))
+    return runs
+
+
+def _rasterized_pages(source, pages: list[int]):
+    """(página, imagen) en orden; cada tramo contiguo se rasteriza (una llamada a poppler) recién cuando hace falta."""
+    for first, last in _contiguous_runs(pages):
+        try:
+            images = _rasterize(source, dpi=_OCR_DPI, first_page=first, last_page=last, poppler_path=_POPPLER_PATH)
+        except Exception:
+            logger.exception("[PDF] no se pudo rasterizar páginas %s-%s", first, last)
+            continue
+        yield from zip(range(first, last + 1), images)
+
+
+def _ocr_pages_batch(source, pages: list[int], deadline: float) -> tuple[dict[int, str], int]:
     """
-    Lee TODO el PDF:
-      1) Intenta texto embebido con pdfplumber.
-      2) Si una página viene vacía o muy corta, hace fallback a OCR de esa página.
+    OCR en paralelo en el pool, con a lo sumo `ocr_pool.workers` páginas en
+    vuelo: se encola una nueva a medida que termina otra. Lo que no termina
+    antes de `deadline` (time.monotonic) se descarta.
+
+    El tope importa porque `cancel()` no detiene una página que ya está
+    corriendo: al agotarse el presupuesto, lo que sigue ocupando el pool es a
+    lo sumo una página por proceso OCR, y el CV siguiente no queda encolado
+    detrás del resto de este (ni agota su propio presupuesto esperando).
+    Devuelve ({página: texto}, páginas cuyo OCR falló); las fallidas no van en el dict.
+    """
+    limit = ocr_pool.workers
+    todo = _rasterized_pages(source, pages)
+    in_flight = {}
+    out = {}
+    failed = 0
+    exhausted = False
+    while True:
+        while not exhausted and len(in_flight) < limit and time.monotonic() < deadline:
+            item = next(todo, None)
+            if item is None:
+                exhausted = True
+                break
+            page_number, img = item
+            try:
+                in_flight[ocr_pool.submit(img)] = page_number
+            except Exception:
+                logger.exception("[PDF] no se pudo encolar OCR página %s", page_number)
+                failed += 1
+        if not in_flight:
+            break
+        done, _ = _wait_futures(list(in_flight), timeout=max(deadline - time.monotonic(), 0),
+                                return_when=FIRST_COMPLETED)
+        if not done:
+            break
+        for fut in done:
+            page_number = in_flight.pop(fut)
+            try:
+                out[page_number] = fut.result() or ""
+            except Exception:
+                logger.exception("[PDF] fallo OCR página %s", page_number)
+                failed += 1
+
+    for fut in in_flight:
+        fut.cancel()
+    if in_flight or not exhausted:
+        logger.warning("[PDF] presupuesto OCR agotado: %s páginas sin OCR", len(pages) - len(out) - failed)
+    return out, failed
+
+
+def extract_pdf(source) -> dict:
+    """
+    Lee TODO el PDF (`source`: bytes en memoria o ruta):
+      1) Intenta texto embebido con pdfplumber en todas las páginas.
+      2) Las páginas vacías o muy cortas pasan a OCR: en modo "batch" se
+         rasterizan juntas y se procesan en paralelo en el pool OCR, con tope de
+         OCR_MAX_PAGES páginas y OCR_TIME_BUDGET_SEC segundos.
+    Devuelve {"text", "page_count", "ocr_pages", "ocr_skipped", "ocr_failed", "ocr_sec"}
+    (ocr_pages: bool por página; ocr_skipped: páginas que quedaron sin OCR por presupuesto;
+    ocr_failed: páginas cuyo OCR falló (timeout, pool roto, sin modelo);
+    ocr_sec: tiempo de pared dedicado a OCR).
     No recorta el resultado final.
     """
+    fp = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+    with pdfplumber.open(fp) as pdf:
+        texts = [(p.extract_text() or "").strip() for p in pdf.pages]
+
+    needs = [idx for idx, txt in enumerate(texts, start=1) if len(txt) < _OCR_MIN_CHARS]
+    selected = needs[:max(OCR_MAX_PAGES, 0)]
+    skipped = len(needs) - len(selected)
+
+    ocr_started = time.monotonic()
+    failed = 0
+    if PDF_OCR_MODE == "sequential":
+        results = {n: _ocr_page(source, n, dpi=_OCR_DPI) for n in selected}
+        ocr_texts = {n: txt for n, txt in results.items() if txt is not None}
+        failed = len(results) - len(ocr_texts)
+    elif selected:
+        ocr_texts, failed = _ocr_pages_batch(source, selected, time.monotonic() + OCR_TIME_BUDGET_SEC)
+        skipped += len(selected) - len(ocr_texts) - failed
+    else:
+        ocr_texts = {}
+    ocr_sec = time.monotonic() - ocr_started if selected else 0.0
+
     parts = []
-    with pdfplumber.open(path) as pdf:
-        for idx, p in enumerate(pdf.pages, start=1):
-            txt = (p.extract_text() or "").strip()
-            if len(txt) < _OCR_MIN_CHARS:
-                ocr_txt = _ocr_page(path, idx)
-                if len(ocr_txt) >= len(txt):
-                    txt = ocr_txt.strip()
-            parts.append(txt)
-    return "\n".join(parts)
+    ocr_pages = []
+    for idx, txt in enumerate(texts, start=1):
+        used_ocr = False
+        ocr_txt = ocr_texts.get(idx)
+        if ocr_txt is not None and len(ocr_txt) >= len(txt):
+            txt = ocr_txt.strip()
+            used_ocr = True
+        parts.append(txt)
+        ocr_pages.append(used_ocr)
+    return {
+        "text": "\n".join(parts),
+        "page_count": len(ocr_pages),
+        "ocr_pages": ocr_pages,
+        "ocr_skipped": skipped,
+        "ocr_failed": failed,
+        "ocr_sec": round(ocr_sec, 4),
+    }
+
+
+def extract_text_from_pdf(source) -> str:
+    """Atajo: solo el texto de extract_pdf()."""
+    return extract_pdf(source)["text"]
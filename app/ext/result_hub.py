@@ -0,0 +1,166 @@
+# app/ext/result_hub.py
+"""
+Hub de notificaciones para resultados de scoring.
+
+El scoring corre en procesos `flask scoring-worker`, no en el proceso web que
+atiende el long-poll de /ai/postulations/<id>/result/wait. Por eso el aviso
+viaja por la BD: `notify(session, postulation_id)` encola un pg_notify en la
+transacción que guarda el resultado (PostgreSQL lo entrega al hacer commit), y
+en cada proceso web un hilo `PgResultListener` con LISTEN sobre una conexión
+propia despierta a los que esperan en ese proceso (`publish`).
+
+Sin PostgreSQL (SQLite en dev/tests) solo hay aviso dentro del proceso. En
+todos los casos quien espera vuelve a consultar la BD cada `recheck_interval`
+segundos, como red de seguridad (avisos perdidos durante una reconexión).
+Cada long-poll retiene un hilo de gunicorn hasta AI_RESULT_WAIT_MAX_SEC.
+"""
+import logging
+import select
+import threading
+import time
+from typing import Callable, TypeVar
+
+from sqlalchemy import text
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "ai_results"
+
+
+class ResultHub:
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._versions: dict[int, int] = {}
+        self._waiters: dict[int, int] = {}
+
+    def publish(self, key: int) -> None:
+        with self._cond:
+            if key in self._waiters:
+                self._versions[key] = self._versions.get(key, 0) + 1
+                self._cond.notify_all()
+
+    def waiting(self) -> int:
+        with self._cond:
+            return sum(self._waiters.values())
+
+    def wait_for(
+        self,
+        key: int,
+        check: Callable[[], T | None],
+        *,
+        timeout: float,
+        recheck_interval: float = 1.0,
+    ) -> T | None:
+        """
+        Bloquea hasta que `check()` devuelva algo distinto de None o venza `timeout`.
+        `check` se evalúa al inicio, tras cada publish de `key` y cada `recheck_interval`.
+        """
+        deadline = time.monotonic() + max(timeout, 0.0)
+        with self._cond:
+            self._waiters[key] = self._waiters.get(key, 0) + 1
+            seen = self._versions.get(key, 0)
+        try:
+            while True:
+                value = check()
+                if value is not None:
+                    return value
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                with self._cond:
+                    self._cond.wait_for(
+                        lambda: self._versions.get(key, 0) != seen,
+                        timeout=min(recheck_interval, remaining),
+                    )
+                    seen = self._versions.get(key, 0)
+        finally:
+            with self._cond:
+                self._waiters[key] -= 1
+                if not self._waiters[key]:
+                    del self._waiters[key]
+                    self._versions.pop(key, None)
+
+    # ---------- aviso entre procesos (PostgreSQL LISTEN/NOTIFY) ----------
+    @staticmethod
+    def notify(session, key: int) -> None:
+        """pg_notify dentro de la transacción de `session`: se entrega solo si hace commit."""
+        if session.get_bind().dialect.name != "postgresql":
+            return
+        session.execute(text("SELECT pg_notify(:channel, :payload)"),
+                        {"channel": NOTIFY_CHANNEL, "payload": str(key)})
+
+    def dispatch(self, payloads) -> int:
+        """Publica en este proceso las claves recibidas por NOTIFY; ignora payloads inválidos."""
+        n = 0
+        for payload in payloads:
+            try:
+                key = int(payload)
+            except (TypeError, ValueError):
+                continue
+            self.publish(key)
+            n += 1
+        return n
+
+
+class PgResultListener(threading.Thread):
+    """
+    Un hilo por proceso web: LISTEN en una conexión psycopg2 propia (autocommit)
+    y reenvía cada NOTIFY al hub local. Ante errores reconecta con backoff.
+    """
+
+    def __init__(self, engine, hub: "ResultHub", *, poll_sec: float = 5.0, reconnect_sec: float = 2.0):
+        super().__init__(daemon=True, name="ai-result-listener")
+        self.engine = engine
+        self.hub = hub
+        self.poll_sec = poll_sec
+        self.reconnect_sec = reconnect_sec
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            try:
+                self._listen()
+            except Exception:
+                logger.exception("[AI] listener de resultados caído; reconectando en %.0fs", self.reconnect_sec)
+                self._stop_event.wait(self.reconnect_sec)
+
+    def _listen(self):
+        raw = self.engine.raw_connection()
+        try:
+            conn = raw.driver_connection
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute(f"LISTEN {NOTIFY_CHANNEL}")
+            logger.info("[AI] escuchando resultados en canal %s", NOTIFY_CHANNEL)
+            while not self._stop_event.is_set():
+                if select.select([conn], [], [], self.poll_sec) == ([], [], []):
+                    continue
+                conn.poll()
+                notifies, conn.notifies[:] = list(conn.notifies), []
+                self.hub.dispatch(n.payload for n in notifies)
+        finally:
+            raw.invalidate()  # no devolver al pool una conexión con LISTEN activo
+
+    def stop(self):
+        self._stop_event.set()
+
+
+_listener_lock = threading.Lock()
+_listener: PgResultListener | None = None
+
+
+def ensure_listener(engine) -> bool:
+    """Arranca (una vez por proceso) el listener si la BD es PostgreSQL. True si está activo."""
+    global _listener
+    if engine.dialect.name != "postgresql":
+        return False
+    with _listener_lock:
+        if _listener is None or not _listener.is_alive():
+            _listener = PgResultListener(engine, result_hub)
+            _listener.start()
+    return True
+
+
+result_hub = ResultHub()
@@ -1,12 +1,27 @@
 import os
+import threading
+import time
+from collections import OrderedDict
 from urllib.parse import urlparse
 import boto3
+from boto3.s3.transfer import TransferConfig
 
 AWS_KEY = os.getenv("AWS_KEY")
 AWS_SECRET = os.getenv("AWS_SECRET")
 AWS_DEFAULT_REGION = os.getenv("AWS_DEFAULT_REGION", "us-east-2")
 AWS_BUCKET = os.getenv("AWS_BUCKET")
 AWS_S3_FOLDER = os.getenv("AWS_S3_FOLDER", "curriculums")
+CV_MAX_BYTES = int(os.getenv("CV_MAX_BYTES", str(25 * 1024 * 1024)))
+CV_UPLOAD_POST_EXPIRES_SEC = int(os.getenv("CV_UPLOAD_POST_EXPIRES_SEC", "600"))
+# Subida en streaming: memoria por subida ~ concurrencia x tamaño de parte (mínimo S3: 5MB)
+S3_UPLOAD_PART_BYTES = max(int(os.getenv("S3_UPLOAD_PART_BYTES", str(8 * 1024 * 1024))), 5 * 1024 * 1024)
+S3_UPLOAD_CONCURRENCY = int(os.getenv("S3_UPLOAD_CONCURRENCY", "2"))
+# URLs firmadas de descarga: LRU en proceso (0 = sin cache); una URL se reutiliza
+# mientras le quede al menos esta fracción de su vigencia
+S3_PRESIGN_CACHE_SIZE = int(os.getenv("S3_PRESIGN_CACHE_SIZE", "4096"))
+S3_PRESIGN_MIN_REMAINING = float(os.getenv("S3_PRESIGN_MIN_REMAINING", "0.75"))
+# Máximo de claves por llamada a delete_objects / por página de list_objects_v2
+S3_BATCH_KEYS = 1000
 
 s3_client = boto3.client(
     "s3",
@@ -17,9 +32,11 @@ s3_client = boto3.client(
 
 def s3_key_for_cv(vacancy_id: int, applicant_id: int, filename: str) -> str:
     import re, time
+    from uuid import uuid4
     safe = re.sub(r"[^A-Za-z0-9_.-]", "_", filename or "cv.pdf")
     ts = int(time.time())
-    return f"{AWS_S3_FOLDER}/vacancy_{vacancy_id}/applicant_{applicant_id}_{ts}_{safe}"
+    # Sufijo aleatorio: dos subidas en el mismo segundo chocarían en cv_uploads.key (único)
+    return f"{AWS_S3_FOLDER}/vacancy_{vacancy_id}/applicant_{applicant_id}_{ts}_{uuid4().hex[:12]}_{safe}"
 
 def public_url_from_key(key: str) -> str:
     return f"https://{AWS_BUCKET}.s3.{AWS_DEFAULT_REGION}.amazonaws.com/{key}"
@@ -45,10 +62,175 @@ def delete_cv_key(key: str) -> None:
         logging.exception("No se pudo eliminar objeto S3: %s", key)
 
 
-def make_presigned_url(key: str, expires_seconds: int = 1200) -> str:
-    """Genera una URL firmada temporal para descargar el CV."""
+def delete_cv_keys(keys) -> list[str]:
+    """
+    Borra varias claves con delete_objects, de a S3_BATCH_KEYS por llamada
+    (sin repetir ni vacías). Devuelve las claves borradas; los errores se loguean.
+    """
+    import logging
+    unique = list(dict.fromkeys(k for k in keys if k))
+    deleted: list[str] = []
+    for i in range(0, len(unique), S3_BATCH_KEYS):
+        batch = unique[i:i + S3_BATCH_KEYS]
+        try:
+            resp = s3_client.delete_objects(
+                Bucket=AWS_BUCKET,
+                Delete={"Objects": [{"Key": k} for k in batch], "Quiet": True},
+            )
+        except Exception:
+            logging.exception("No se pudo eliminar lote S3 (%s objetos)", len(batch))
+            continue
+        failed = set()
+        for err in resp.get("Errors") or []:
+            logging.error("No se pudo eliminar objeto S3: %s (%s)", err.get("Key"), err.get("Code"))
+            failed.add(err.get("Key"))
+        deleted += [k for k in batch if k not in failed]
+    return deleted
+
+
+def iter_cv_pages(prefix: str | None = None):
+    """Objetos bajo `prefix` (default AWS_S3_FOLDER/), una página por vez: [(key, last_modified)]."""
+    paginator = s3_client.get_paginator("list_objects_v2")
+    pages = paginator.paginate(
+        Bucket=AWS_BUCKET,
+        Prefix=prefix or f"{AWS_S3_FOLDER}/",
+        PaginationConfig={"PageSize": S3_BATCH_KEYS},
+    )
+    for page in pages:
+        yield [(obj["Key"], obj["LastModified"]) for obj in page.get("Contents") or []]
+
+
+def cv_transfer_config() -> TransferConfig:
+    return TransferConfig(
+        multipart_threshold=S3_UPLOAD_PART_BYTES,
+        multipart_chunksize=S3_UPLOAD_PART_BYTES,
+        max_concurrency=S3_UPLOAD_CONCURRENCY,
+        max_io_queue=S3_UPLOAD_CONCURRENCY,
+    )
+
+
+def upload_cv_fileobj(fileobj, key: str, content_type: str = "application/pdf") -> None:
+    """
+    Sube un stream (solo necesita `read`) por partes de S3_UPLOAD_PART_BYTES.
+    Si `read` lanza, s3transfer aborta el multipart y la excepción se propaga.
+    """
+    s3_client.upload_fileobj(
+        fileobj,
+        AWS_BUCKET,
+        key,
+        ExtraArgs={
+            "ContentType": content_type,
+            "CacheControl": "max-age=31536000, public",
+        },
+        Config=cv_transfer_config(),
+    )
+
+
+def make_presigned_post(key: str, *, content_type: str = "application/pdf",
+                        max_bytes: int = CV_MAX_BYTES,
+                        expires_seconds: int = CV_UPLOAD_POST_EXPIRES_SEC) -> dict:
+    """
+    Política de POST firmado para que el navegador suba el CV directo a S3.
+    S3 rechaza otra clave, otro Content-Type o un tamaño fuera de 1..max_bytes.
+    Devuelve {"url", "fields"} (los fields van antes del archivo en el form).
+    """
+    return s3_client.generate_presigned_post(
+        Bucket=AWS_BUCKET,
+        Key=key,
+        Fields={"Content-Type": content_type},
+        Conditions=[
+            {"Content-Type": content_type},
+            ["content-length-range", 1, max_bytes],
+        ],
+        ExpiresIn=expires_seconds,
+    )
+
+
+def head_cv_key(key: str) -> dict | None:
+    """HEAD del objeto: {"size", "content_type", "etag"} o None si no existe."""
+    from botocore.exceptions import ClientError
+    try:
+        head = s3_client.head_object(Bucket=AWS_BUCKET, Key=key)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+            return None
+        raise
+    return {
+        "size": int(head.get("ContentLength") or 0),
+        "content_type": head.get("ContentType"),
+        "etag": (head.get("ETag") or "").strip('"') or None,
+    }
+
+
+def read_cv_prefix(key: str, length: int = 8) -> bytes:
+    """Primeros `length` bytes del objeto (GET con Range), p.ej. para validar la firma %PDF."""
+    obj = s3_client.get_object(Bucket=AWS_BUCKET, Key=key, Range=f"bytes=0-{length - 1}")
+    return obj["Body"].read()
+
+
+def _sign_get_url(key: str, expires_seconds: int) -> str:
     return s3_client.generate_presigned_url(
         ClientMethod="get_object",
         Params={"Bucket": AWS_BUCKET, "Key": key},
         ExpiresIn=expires_seconds
-    )
\ No newline at end of file
+    )
+
+
+class PresignedURLCache:
+    """
+    LRU de URLs firmadas con clave (key, vigencia, bucket de expiración).
+
+    El tiempo se corta en ventanas de `vigencia * (1 - min_remaining)` segundos:
+    dentro de una ventana todos reciben la misma URL, y como se firmó dentro de
+    ella le queda al menos `min_remaining` de su vigencia. Al cambiar de ventana
+    la clave cambia, se firma de nuevo y la entrada vieja sale por LRU.
+    Segura entre hilos (el worker y gunicorn corren varios).
+    """
+
+    def __init__(self, max_size: int = S3_PRESIGN_CACHE_SIZE,
+                 min_remaining: float = S3_PRESIGN_MIN_REMAINING, clock=time.time):
+        self.max_size = max_size
+        self.min_remaining = min(max(min_remaining, 0.0), 0.95)
+        self._clock = clock
+        self._items: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _bucket_key(self, key: str, expires_seconds: int) -> tuple[str, int, int]:
+        window = max(int(expires_seconds * (1 - self.min_remaining)), 1)
+        return key, expires_seconds, int(self._clock() // window)
+
+    def get(self, key: str, expires_seconds: int) -> str:
+        if self.max_size <= 0:
+            return _sign_get_url(key, expires_seconds)
+        cache_key = self._bucket_key(key, expires_seconds)
+        with self._lock:
+            url = self._items.get(cache_key)
+            if url is not None:
+                self._items.move_to_end(cache_key)
+                return url
+        url = _sign_get_url(key, expires_seconds)
+        with self._lock:
+            self._items[cache_key] = url
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+        return url
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+presigned_urls = PresignedURLCache()
+
+
+def make_presigned_url(key: str, expires_seconds: int = 1200) -> str:
+    """URL firmada temporal para descargar el CV (cacheada, ver PresignedURLCache)."""
+    return presigned_urls.get(key, expires_seconds)
+
+
+def presign_many(keys, expires_seconds: int = 1200) -> dict[str, str]:
+    """URLs firmadas para varias claves (sin repetir ni vacías): {key: url}."""
+    return {key: make_presigned_url(key, expires_seconds) for key in dict.fromkeys(k for k in keys if k)}
@@ -1,6 +1,18 @@
 # app/models/__init__.py
 
 from .postulation_ai_result import PostulationAIResult
+from .scoring_job import ScoringJob
+from .scoring_batch import ScoringBatch
+from .scoring_run_metric import ScoringRunMetric
+from .cv_text_cache import CVTextCache
+from .cv_parse_memo import CVParseMemo
+from .cv_minhash import CVMinHash, CVLSHBucket
+from .postulation_cv_text import PostulationCVText
+from .postulation_skill_evidence import PostulationSkillEvidence
+from .postulation_skill_scan import PostulationSkillScan
+from .cv_upload import CVUpload
+from .llm_rate_bucket import LLMRateBucket
+from .llm_circuit_breaker import LLMCircuitBreaker
 from .terms_acceptance import TermsAcceptance
 
 # Web portal
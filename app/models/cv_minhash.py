@@ -0,0 +1,40 @@
+from datetime import datetime
+from app.ext.db import db
+
+
+class CVMinHash(db.Model):
+    """
+    Firma MinHash del texto normalizado de un CV (una por texto distinto,
+    clave = cv_text_fingerprint, la misma del memo del parser).
+    """
+    __tablename__ = "cv_minhashes"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    text_sha256   = db.Column(db.String(64), nullable=False, unique=True)
+    signature     = db.Column(db.LargeBinary, nullable=False)   # NUM_PERM x uint32
+    shingle_count = db.Column(db.Integer, nullable=False, default=0)
+
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f"<CVMinHash {self.text_sha256[:12]} shingles={self.shingle_count}>"
+
+
+class CVLSHBucket(db.Model):
+    """
+    Índice LSH por bandas: textos con una banda idéntica comparten (band, bucket)
+    y son candidatos a casi-duplicado. La búsqueda lee solo esos buckets.
+    """
+    __tablename__ = "cv_lsh_buckets"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    band        = db.Column(db.SmallInteger, nullable=False)
+    bucket      = db.Column(db.String(16), nullable=False)
+    text_sha256 = db.Column(db.String(64), nullable=False)
+
+    __table_args__ = (
+        db.Index("ix_cv_lsh_buckets_band_bucket", "band", "bucket"),
+        db.UniqueConstraint("text_sha256", "band", name="uq_cv_lsh_buckets_text_band"),
+    )
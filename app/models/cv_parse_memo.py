@@ -0,0 +1,32 @@
+from datetime import datetime
+from app.ext.db import db
+from app.ext.db_types import JSONBCompat_for
+
+JSONBCompat = JSONBCompat_for(db)
+
+
+class CVParseMemo(db.Model):
+    """
+    CV_JSON producido por summarize_cv_to_json, memoizado por
+    (hash del texto normalizado, modelo, versión del prompt del parser).
+    """
+    __tablename__ = "cv_parse_memo"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    text_sha256    = db.Column(db.String(64), nullable=False)
+    model          = db.Column(db.String(64), nullable=False)
+    prompt_version = db.Column(db.String(32), nullable=False)
+
+    cv_json = db.Column(JSONBCompat, nullable=False)
+
+    hits         = db.Column(db.Integer, nullable=False, default=0)
+    created_at   = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    last_used_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint("text_sha256", "model", "prompt_version", name="uq_cv_parse_memo_key"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<CVParseMemo {self.text_sha256[:12]} {self.model} p={self.prompt_version}>"
@@ -0,0 +1,33 @@
+from datetime import datetime
+from app.ext.db import db
+from app.ext.db_types import JSONBCompat_for
+
+JSONBCompat = JSONBCompat_for(db)
+
+
+class CVTextCache(db.Model):
+    """
+    Texto extraído de un PDF, direccionado por contenido (SHA-256 de los bytes)
+    y versión del extractor. Un hit evita pdfplumber/OCR por completo.
+    """
+    __tablename__ = "cv_text_cache"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    pdf_sha256        = db.Column(db.String(64), nullable=False)
+    extractor_version = db.Column(db.String(32), nullable=False)
+
+    text       = db.Column(db.Text, nullable=False)
+    page_count = db.Column(db.Integer, nullable=False, default=0)
+    ocr_pages  = db.Column(JSONBCompat, nullable=False, default=list)  # [bool] por página
+
+    hits         = db.Column(db.Integer, nullable=False, default=0)
+    created_at   = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    last_used_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint("pdf_sha256", "extractor_version", name="uq_cv_text_cache_sha_version"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<CVTextCache {self.pdf_sha256[:12]} v={self.extractor_version} pages={self.page_count}>"
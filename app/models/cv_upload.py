@@ -0,0 +1,29 @@
+from datetime import datetime
+from app.ext.db import db
+
+
+class CVUpload(db.Model):
+    """
+    CV subido a S3 por un postulante (directo con POST firmado o vía API).
+    `pending` = política emitida; `uploaded` = objeto verificado con HEAD.
+    """
+    __tablename__ = "cv_uploads"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    key          = db.Column(db.String(512), nullable=False, unique=True)
+    applicant_id = db.Column(db.Integer, nullable=False, index=True)
+    vacancy_id   = db.Column(db.Integer, nullable=True)
+    filename     = db.Column(db.String(255), nullable=True)
+    content_type = db.Column(db.String(100), nullable=False, default="application/pdf")
+
+    status     = db.Column(db.String(16), nullable=False, default="pending")  # pending | uploaded
+    size_bytes = db.Column(db.Integer, nullable=True)
+    etag       = db.Column(db.String(128), nullable=True)
+    sha256     = db.Column(db.String(64), nullable=True, index=True)  # calculado al subir en streaming
+
+    created_at   = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    completed_at = db.Column(db.DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<CVUpload {self.key} {self.status}>"
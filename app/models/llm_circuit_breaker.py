@@ -0,0 +1,22 @@
+from app.ext.db import db
+
+
+class LLMCircuitBreaker(db.Model):
+    """
+    Estado compartido del circuit breaker hacia el proveedor LLM.
+    Una fila por dependencia (p.ej. "openai"); se actualiza con SELECT ... FOR UPDATE
+    para que todos los procesos/pods abran y cierren el circuito a la vez.
+    """
+    __tablename__ = "llm_circuit_breakers"
+
+    name = db.Column(db.String(64), primary_key=True)
+
+    state      = db.Column(db.String(16), nullable=False, default="closed")  # closed | open | half_open
+    failures   = db.Column(db.Integer, nullable=False, default=0)           # fallos consecutivos
+    opened_at  = db.Column(db.Float, nullable=True)    # epoch de la última apertura
+    retry_at   = db.Column(db.Float, nullable=True)    # open: fin del enfriamiento; half_open: fin de la sonda
+    last_error = db.Column(db.String(255), nullable=True)
+    updated_at = db.Column(db.Float, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<LLMCircuitBreaker {self.name} {self.state} failures={self.failures}>"
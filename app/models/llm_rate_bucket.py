@@ -0,0 +1,19 @@
+from app.ext.db import db
+
+
+class LLMRateBucket(db.Model):
+    """
+    Estado compartido del token bucket hacia el proveedor LLM.
+    Una fila por límite (p.ej. "openai"); se actualiza con SELECT ... FOR UPDATE
+    para coordinar a todos los procesos/pods.
+    """
+    __tablename__ = "llm_rate_buckets"
+
+    name = db.Column(db.String(64), primary_key=True)
+
+    req_level   = db.Column(db.Float, nullable=False)   # requests disponibles
+    tok_level   = db.Column(db.Float, nullable=False)   # tokens disponibles
+    refilled_at = db.Column(db.Float, nullable=False)   # epoch (segundos) del último rellenado
+
+    def __repr__(self) -> str:
+        return f"<LLMRateBucket {self.name} req={self.req_level:.1f} tok={self.tok_level:.0f}>"
@@ -2,12 +2,28 @@ from datetime import datetime
 from app.ext.db import db
 
 class PostulationAIResult(db.Model):
+    """
+    Historial de resultados de scoring (append-only): una fila por ejecución.
+    Estados: succeeded | failed | provisional (pre-filtro local).
+    El estado vigente es la fila más reciente (índice postulation_id, created_at DESC).
+    """
     __tablename__ = "postulation_ai_results"
 
     id = db.Column(db.Integer, primary_key=True)
     postulation_id = db.Column(db.Integer, nullable=False, index=True)
     vacancy_id     = db.Column(db.Integer, nullable=True, index=True)
-    score          = db.Column(db.Integer, nullable=False)   # 0..100
-    feedback       = db.Column(db.Text, nullable=False)
+    score          = db.Column(db.Integer, nullable=True)    # 0..100; NULL si falló
+    feedback       = db.Column(db.Text, nullable=True)
+
+    status           = db.Column(db.String(16), nullable=False, default="succeeded", server_default="succeeded")
+    error            = db.Column(db.Text, nullable=True)
+    job_id           = db.Column(db.Integer, nullable=True)
+    attempts         = db.Column(db.Integer, nullable=True)
+    pipeline_version = db.Column(db.String(128), nullable=True)
+    started_at       = db.Column(db.DateTime, nullable=True)
 
     created_at     = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        db.Index("ix_postulation_ai_results_latest", "postulation_id", db.text("created_at DESC")),
+    )
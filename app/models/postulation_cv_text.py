@@ -0,0 +1,18 @@
+from datetime import datetime
+from app.ext.db import db
+
+
+class PostulationCVText(db.Model):
+    """Qué texto de CV (cv_text_fingerprint) tiene cada postulación; se llena al extraer."""
+    __tablename__ = "postulation_cv_texts"
+
+    postulation_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    vacancy_id     = db.Column(db.Integer, nullable=True, index=True)
+    applicant_id   = db.Column(db.Integer, nullable=True)
+    text_sha256    = db.Column(db.String(64), nullable=False, index=True)
+
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f"<PostulationCVText {self.postulation_id} {self.text_sha256[:12]}>"
@@ -0,0 +1,37 @@
+from datetime import datetime
+from app.ext.db import db
+from app.ext.db_types import JSONBCompat_for
+
+JSONBCompat = JSONBCompat_for(db)
+
+
+class PostulationSkillEvidence(db.Model):
+    """
+    Skill del catálogo encontrada en el texto del CV de una postulación
+    (matcher local, ver app/services/scoring/skill_matcher.py).
+    """
+    __tablename__ = "postulation_skill_evidence"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    postulation_id = db.Column(db.Integer, nullable=False, index=True)
+    vacancy_id     = db.Column(db.Integer, nullable=True)
+    skill_id       = db.Column(db.Integer, db.ForeignKey("skills.id", ondelete="CASCADE"), nullable=False)
+
+    required  = db.Column(db.Boolean, nullable=False, default=False)  # requisito de la vacante (VacancySkill)
+    hits      = db.Column(db.Integer, nullable=False, default=0)
+    positions = db.Column(JSONBCompat, nullable=False, default=list)  # [[inicio, fin)] en el texto extraído
+    snippet   = db.Column(db.String(255), nullable=True)
+
+    text_sha256     = db.Column(db.String(64), nullable=False)
+    catalog_version = db.Column(db.String(64), nullable=False)
+    created_at      = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    skill = db.relationship("Skill")
+
+    __table_args__ = (
+        db.UniqueConstraint("postulation_id", "skill_id", name="uq_postulation_skill_evidence"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<PostulationSkillEvidence p={self.postulation_id} skill={self.skill_id} hits={self.hits}>"
@@ -0,0 +1,20 @@
+from datetime import datetime
+from app.ext.db import db
+
+
+class PostulationSkillScan(db.Model):
+    """
+    Último escaneo de skills de una postulación: qué texto y qué versión del
+    catálogo. Va aparte de la evidencia para que un CV sin coincidencias
+    (0 filas en postulation_skill_evidence) no se reescanee en cada scoring.
+    """
+    __tablename__ = "postulation_skill_scans"
+
+    postulation_id  = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    text_sha256     = db.Column(db.String(64), nullable=False)
+    catalog_version = db.Column(db.String(64), nullable=False)
+    skills_found    = db.Column(db.Integer, nullable=False, default=0)
+    scanned_at      = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f"<PostulationSkillScan p={self.postulation_id} skills={self.skills_found}>"
@@ -0,0 +1,30 @@
+from datetime import datetime
+from app.ext.db import db
+from app.ext.db_types import JSONBCompat_for
+
+JSONBCompat = JSONBCompat_for(db)
+
+
+class ScoringBatch(db.Model):
+    """
+    Lote de re-scoring (p.ej. todas las postulaciones de una vacante tras editarla).
+    Sus jobs llevan `batch_id`; el reclamo respeta `max_concurrency` por lote.
+    """
+    __tablename__ = "scoring_batches"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    vacancy_id = db.Column(db.Integer, nullable=True, index=True)
+    kind       = db.Column(db.String(32), nullable=False, default="rescore")
+    filters    = db.Column(JSONBCompat, nullable=True)
+
+    max_concurrency = db.Column(db.Integer, nullable=False, default=4)
+    total           = db.Column(db.Integer, nullable=False, default=0)
+    # Postulaciones omitidas al crear el lote (ya tenían un job en curso o listo)
+    skipped         = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+    created_by = db.Column(db.String(128), nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f"<ScoringBatch {self.id} vacancy={self.vacancy_id} total={self.total}>"
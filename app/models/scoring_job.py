@@ -0,0 +1,58 @@
+from datetime import datetime
+from app.ext.db import db
+from app.ext.db_types import JSONBCompat_for
+
+JSONBCompat = JSONBCompat_for(db)
+
+
+class ScoringJob(db.Model):
+    """
+    Cola persistente de scoring IA.
+    Los pods web solo encolan; `flask scoring-worker` reclama (lease) y ejecuta.
+    Estados: queued | running | succeeded | failed
+    Tipos: score (pipeline de una postulación) | preprocess (CV recién subido, sin postulación)
+    """
+    __tablename__ = "scoring_jobs"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    kind = db.Column(db.String(16), nullable=False, default="score", server_default="score")
+
+    postulation_id = db.Column(db.Integer, nullable=True, index=True)
+    vacancy_id     = db.Column(db.Integer, nullable=True, index=True)
+    # Postulaciones del mismo postulante pendientes a la vez se puntúan en una sola llamada
+    applicant_id   = db.Column(db.Integer, nullable=True, index=True)
+
+    payload = db.Column(JSONBCompat, nullable=False)
+
+    # Lote de re-scoring al que pertenece (concurrencia acotada por lote)
+    batch_id = db.Column(db.Integer, db.ForeignKey("scoring_batches.id", ondelete="SET NULL"), nullable=True, index=True)
+
+    status   = db.Column(db.String(16), nullable=False, default="queued", index=True)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=3)
+
+    # Leasing: un job "running" con lease vencido vuelve a ser reclamable
+    locked_by     = db.Column(db.String(128), nullable=True)
+    lease_until   = db.Column(db.DateTime, nullable=True, index=True)
+    heartbeat_at  = db.Column(db.DateTime, nullable=True)
+
+    # No reclamar antes de esta fecha (backoff entre reintentos)
+    run_after  = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
+    last_error = db.Column(db.Text, nullable=True)
+
+    started_at  = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    created_at  = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    updated_at  = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index("ix_scoring_jobs_claim", "status", "run_after"),
+        db.Index("ix_scoring_jobs_latest", "postulation_id", db.text("created_at DESC")),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ScoringJob {self.id} postulation={self.postulation_id} "
+            f"status={self.status} attempts={self.attempts}/{self.max_attempts}>"
+        )
@@ -0,0 +1,54 @@
+from datetime import datetime
+from app.ext.db import db
+
+
+class ScoringRunMetric(db.Model):
+    """
+    Métricas de una ejecución del pipeline de scoring (una fila por intento).
+    Tiempos en ms por etapa, páginas OCR, tokens por llamada LLM y costo estimado.
+    """
+    __tablename__ = "scoring_run_metrics"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    postulation_id = db.Column(db.Integer, nullable=True, index=True)
+    vacancy_id     = db.Column(db.Integer, nullable=True)
+    job_id         = db.Column(db.Integer, nullable=True)
+    attempt        = db.Column(db.Integer, nullable=True)
+
+    status = db.Column(db.String(16), nullable=False)   # succeeded | failed | provisional | parked
+    error  = db.Column(db.String(255), nullable=True)
+
+    # Tiempos por etapa (ms)
+    fetch_ms     = db.Column(db.Integer, nullable=True)
+    extract_ms   = db.Column(db.Integer, nullable=True)
+    ocr_ms       = db.Column(db.Integer, nullable=True)
+    prescreen_ms = db.Column(db.Integer, nullable=True)
+    summarize_ms = db.Column(db.Integer, nullable=True)
+    score_ms     = db.Column(db.Integer, nullable=True)
+    persist_ms   = db.Column(db.Integer, nullable=True)
+    total_ms     = db.Column(db.Integer, nullable=False)
+
+    # Extracción
+    page_count      = db.Column(db.Integer, nullable=True)
+    ocr_pages       = db.Column(db.Integer, nullable=False, default=0)
+    text_cache_hit  = db.Column(db.Boolean, nullable=False, default=False)
+    parse_cache_hit = db.Column(db.Boolean, nullable=False, default=False)
+
+    # LLM
+    summarize_prompt_tokens     = db.Column(db.Integer, nullable=False, default=0)
+    summarize_completion_tokens = db.Column(db.Integer, nullable=False, default=0)
+    score_prompt_tokens         = db.Column(db.Integer, nullable=False, default=0)
+    score_completion_tokens     = db.Column(db.Integer, nullable=False, default=0)
+    llm_calls    = db.Column(db.Integer, nullable=False, default=0)
+    llm_retries  = db.Column(db.Integer, nullable=False, default=0)
+    rate_wait_ms = db.Column(db.Integer, nullable=False, default=0)
+    cost_usd     = db.Column(db.Float, nullable=False, default=0.0)
+
+    model            = db.Column(db.String(64), nullable=True)
+    pipeline_version = db.Column(db.String(128), nullable=True)
+    created_at       = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+    __table_args__ = (
+        db.Index("ix_scoring_run_metrics_vacancy_created", "vacancy_id", "created_at"),
+    )
@@ -0,0 +1,123 @@
+# app/repositories/ai_result_repo.py
+from datetime import datetime
+from sqlalchemy import func
+from app.ext.db import db
+from app.models.postulation_ai_result import PostulationAIResult
+from app.models.scoring_job import ScoringJob
+
+
+class AIResultRepository:
+    """
+    Estado de scoring por postulación = último job + último resultado.
+    Ambos se resuelven con los índices (postulation_id, created_at DESC);
+    para listas se usa ROW_NUMBER() y se consulta una vez por tabla.
+    """
+
+    def add(
+        self,
+        *,
+        postulation_id: int,
+        vacancy_id: int | None,
+        status: str,
+        score: int | None = None,
+        feedback: str | None = None,
+        error: str | None = None,
+        job_id: int | None = None,
+        attempts: int | None = None,
+        pipeline_version: str | None = None,
+        started_at: datetime | None = None,
+    ) -> PostulationAIResult:
+        row = PostulationAIResult(
+            postulation_id=postulation_id,
+            vacancy_id=vacancy_id,
+            status=status,
+            score=score,
+            feedback=feedback,
+            error=error,
+            job_id=job_id,
+            attempts=attempts,
+            pipeline_version=pipeline_version,
+            started_at=started_at,
+            created_at=datetime.utcnow(),
+        )
+        db.session.add(row)
+        return row
+
+    def latest(self, postulation_id: int) -> PostulationAIResult | None:
+        return (
+            PostulationAIResult.query
+            .filter_by(postulation_id=postulation_id)
+            .order_by(PostulationAIResult.created_at.desc(), PostulationAIResult.id.desc())
+            .first()
+        )
+
+    def _latest_many(self, model, postulation_ids: list[int]) -> dict:
+        if not postulation_ids:
+            return {}
+        rn = func.row_number().over(
+            partition_by=model.postulation_id,
+            order_by=(model.created_at.desc(), model.id.desc()),
+        ).label("rn")
+        sub = (
+            db.session.query(model.id.label("id"), rn)
+            .filter(model.postulation_id.in_(postulation_ids))
+            .subquery()
+        )
+        rows = db.session.query(model).join(sub, model.id == sub.c.id).filter(sub.c.rn == 1).all()
+        return {r.postulation_id: r for r in rows}
+
+    def states(self, postulation_ids: list[int]) -> dict[int, dict]:
+        ids = list({int(i) for i in postulation_ids})
+        jobs = self._latest_many(ScoringJob, ids)
+        results = self._latest_many(PostulationAIResult, ids)
+        now = datetime.utcnow()
+        return {pid: self._state(pid, jobs.get(pid), results.get(pid), now) for pid in ids}
+
+    def state(self, postulation_id: int) -> dict:
+        return self.states([postulation_id])[postulation_id]
+
+    @staticmethod
+    def _state(postulation_id: int, job: ScoringJob | None, res: PostulationAIResult | None, now: datetime) -> dict:
+        """
+        Un job en curso (o encolado y vencido) manda sobre el resultado previo;
+        un job diferido (p.ej. tras el pre-filtro) no oculta el resultado provisional.
+        """
+        out = {
+            "postulation_id": postulation_id,
+            "vacancy_id": None,
+            "status": "not_enqueued",
+            "score": None,
+            "feedback": None,
+            "error": None,
+            "job_id": None,
+            "attempts": None,
+            "pipeline_version": None,
+            "started_at": None,
+            "created_at": None,
+        }
+        if res is not None:
+            out.update(
+                id=res.id,
+                vacancy_id=res.vacancy_id,
+                status=res.status,
+                score=res.score,
+                feedback=res.feedback,
+                error=res.error,
+                job_id=res.job_id,
+                attempts=res.attempts,
+                pipeline_version=res.pipeline_version,
+                started_at=res.started_at,
+                created_at=res.created_at,
+            )
+        if job is not None:
+            active = job.status == "running" or (job.status == "queued" and job.run_after <= now)
+            if active or res is None:
+                out.update(
+                    vacancy_id=out["vacancy_id"] or job.vacancy_id,
+                    status=job.status,
+                    job_id=job.id,
+                    attempts=job.attempts,
+                    started_at=job.started_at,
+                    error=job.last_error if job.status == "failed" else out["error"],
+                )
+        return out
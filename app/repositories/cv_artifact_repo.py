@@ -0,0 +1,69 @@
+# app/repositories/cv_artifact_repo.py
+from datetime import datetime
+from sqlalchemy.exc import IntegrityError
+from app.ext.db import db
+from app.models.cv_text_cache import CVTextCache
+from app.models.cv_parse_memo import CVParseMemo
+
+
+class CVArtifactRepository:
+    """Artefactos derivados del CV reutilizables entre postulaciones/rescoring."""
+
+    def get_text(self, pdf_sha256: str, extractor_version: str) -> CVTextCache | None:
+        row = CVTextCache.query.filter_by(
+            pdf_sha256=pdf_sha256, extractor_version=extractor_version
+        ).one_or_none()
+        if row is not None:
+            row.hits = (row.hits or 0) + 1
+            row.last_used_at = datetime.utcnow()
+        return row
+
+    def put_text(
+        self,
+        *,
+        pdf_sha256: str,
+        extractor_version: str,
+        text: str,
+        page_count: int,
+        ocr_pages: list[bool],
+    ) -> CVTextCache | None:
+        """
+        Inserta la entrada; si otro worker la guardó primero (carrera en la
+        restricción única) se conserva la existente.
+        """
+        row = CVTextCache(
+            pdf_sha256=pdf_sha256,
+            extractor_version=extractor_version,
+            text=text,
+            page_count=page_count,
+            ocr_pages=list(ocr_pages),
+        )
+        try:
+            with db.session.begin_nested():
+                db.session.add(row)
+        except IntegrityError:
+            return None
+        return row
+
+    def get_parse(self, text_sha256: str, model: str, prompt_version: str) -> CVParseMemo | None:
+        row = CVParseMemo.query.filter_by(
+            text_sha256=text_sha256, model=model, prompt_version=prompt_version
+        ).one_or_none()
+        if row is not None:
+            row.hits = (row.hits or 0) + 1
+            row.last_used_at = datetime.utcnow()
+        return row
+
+    def put_parse(self, *, text_sha256: str, model: str, prompt_version: str, cv_json: dict) -> CVParseMemo | None:
+        row = CVParseMemo(
+            text_sha256=text_sha256,
+            model=model,
+            prompt_version=prompt_version,
+            cv_json=cv_json,
+        )
+        try:
+            with db.session.begin_nested():
+                db.session.add(row)
+        except IntegrityError:
+            return None
+        return row
@@ -0,0 +1,75 @@
+# app/repositories/cv_similarity_repo.py
+from datetime import datetime
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError
+from app.ext.db import db
+from app.models.cv_minhash import CVMinHash, CVLSHBucket
+from app.models.postulation_cv_text import PostulationCVText
+
+
+class CVSimilarityRepository:
+    """Firmas MinHash, buckets LSH y el vínculo postulación → texto de CV."""
+
+    def has_signature(self, text_sha256: str) -> bool:
+        return db.session.query(CVMinHash.id).filter_by(text_sha256=text_sha256).first() is not None
+
+    def put_signature(self, *, text_sha256: str, signature: bytes, shingle_count: int, buckets: list[str]) -> bool:
+        """Guarda firma + buckets; False si otro worker ya indexó el mismo texto."""
+        try:
+            with db.session.begin_nested():
+                db.session.add(CVMinHash(text_sha256=text_sha256, signature=signature, shingle_count=shingle_count))
+                db.session.add_all([
+                    CVLSHBucket(band=band, bucket=bucket, text_sha256=text_sha256)
+                    for band, bucket in enumerate(buckets)
+                ])
+        except IntegrityError:
+            return False
+        return True
+
+    def signatures(self, text_shas) -> dict[str, bytes]:
+        shas = list(set(text_shas))
+        if not shas:
+            return {}
+        rows = db.session.query(CVMinHash.text_sha256, CVMinHash.signature).filter(
+            CVMinHash.text_sha256.in_(shas)).all()
+        return {sha: bytes(sig) for sha, sig in rows}
+
+    def candidates(self, buckets: list[str], *, exclude: str | None = None) -> set[str]:
+        """Textos que comparten al menos una banda (consulta por índice, sin barrer la tabla)."""
+        cond = or_(*[and_(CVLSHBucket.band == band, CVLSHBucket.bucket == bucket)
+                     for band, bucket in enumerate(buckets)])
+        rows = db.session.query(CVLSHBucket.text_sha256).filter(cond).distinct().all()
+        return {sha for (sha,) in rows if sha != exclude}
+
+    def buckets_for(self, text_shas) -> list[tuple[int, str, str]]:
+        shas = list(set(text_shas))
+        if not shas:
+            return []
+        return db.session.query(CVLSHBucket.band, CVLSHBucket.bucket, CVLSHBucket.text_sha256).filter(
+            CVLSHBucket.text_sha256.in_(shas)).all()
+
+    def link_postulation(self, *, postulation_id: int, vacancy_id: int | None, applicant_id: int | None,
+                         text_sha256: str) -> None:
+        row = db.session.get(PostulationCVText, postulation_id)
+        if row is None:
+            try:
+                with db.session.begin_nested():
+                    db.session.add(PostulationCVText(postulation_id=postulation_id, vacancy_id=vacancy_id,
+                                                     applicant_id=applicant_id, text_sha256=text_sha256))
+                return
+            except IntegrityError:
+                row = db.session.get(PostulationCVText, postulation_id)
+        row.vacancy_id, row.applicant_id, row.text_sha256 = vacancy_id, applicant_id, text_sha256
+        row.updated_at = datetime.utcnow()
+
+    def text_of(self, postulation_id: int) -> PostulationCVText | None:
+        return db.session.get(PostulationCVText, postulation_id)
+
+    def postulations_with(self, text_shas) -> list[PostulationCVText]:
+        shas = list(set(text_shas))
+        if not shas:
+            return []
+        return PostulationCVText.query.filter(PostulationCVText.text_sha256.in_(shas)).all()
+
+    def postulations_of_vacancy(self, vacancy_id: int) -> list[PostulationCVText]:
+        return PostulationCVText.query.filter_by(vacancy_id=vacancy_id).all()
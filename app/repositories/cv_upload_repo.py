@@ -0,0 +1,41 @@
+# app/repositories/cv_upload_repo.py
+from datetime import datetime
+from app.ext.db import db
+from app.models.cv_upload import CVUpload
+
+
+class CVUploadRepository:
+    """Registro de CVs subidos a S3 (clave, dueño, tamaño, estado)."""
+
+    def add(self, *, key: str, applicant_id: int, vacancy_id: int | None, filename: str | None,
+            content_type: str, status: str = "pending", size_bytes: int | None = None,
+            etag: str | None = None, sha256: str | None = None) -> CVUpload:
+        row = CVUpload(
+            key=key,
+            applicant_id=applicant_id,
+            vacancy_id=vacancy_id,
+            filename=filename,
+            content_type=content_type,
+            status=status,
+            size_bytes=size_bytes,
+            etag=etag,
+            sha256=sha256,
+            completed_at=datetime.utcnow() if status == "uploaded" else None,
+        )
+        db.session.add(row)
+        return row
+
+    def get_by_key(self, key: str) -> CVUpload | None:
+        return CVUpload.query.filter_by(key=key).first()
+
+    def sha256_of(self, key: str | None) -> str | None:
+        if not key:
+            return None
+        return db.session.query(CVUpload.sha256).filter(CVUpload.key == key).scalar()
+
+    def mark_uploaded(self, row: CVUpload, *, size_bytes: int, etag: str | None) -> CVUpload:
+        row.status = "uploaded"
+        row.size_bytes = size_bytes
+        row.etag = etag
+        row.completed_at = datetime.utcnow()
+        return row
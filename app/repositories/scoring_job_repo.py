@@ -0,0 +1,212 @@
+# app/repositories/scoring_job_repo.py
+from datetime import datetime, timedelta
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import aliased
+from app.ext.db import db
+from app.models.scoring_batch import ScoringBatch
+from app.models.scoring_job import ScoringJob
+
+
+class ScoringJobRepository:
+    """
+    Acceso a la cola `scoring_jobs`.
+    El reclamo es optimista (UPDATE condicionado), válido en PostgreSQL y SQLite:
+    si otro worker ganó la carrera, el UPDATE afecta 0 filas y se prueba el siguiente.
+    Los jobs de un lote (`batch_id`) solo se reclaman si el lote tiene menos de
+    `max_concurrency` jobs en curso, y ceden el paso a los jobs interactivos.
+    """
+
+    def enqueue(
+        self,
+        *,
+        postulation_id: int | None,
+        vacancy_id: int | None,
+        payload: dict,
+        max_attempts: int = 3,
+        run_after: datetime | None = None,
+        batch_id: int | None = None,
+        applicant_id: int | None = None,
+        kind: str = "score",
+    ) -> ScoringJob:
+        job = ScoringJob(
+            kind=kind,
+            postulation_id=postulation_id,
+            vacancy_id=vacancy_id,
+            applicant_id=applicant_id if applicant_id is not None else (payload or {}).get("applicant_id"),
+            payload=payload,
+            batch_id=batch_id,
+            status="queued",
+            attempts=0,
+            max_attempts=max_attempts,
+            run_after=run_after or datetime.utcnow(),
+        )
+        db.session.add(job)
+        return job
+
+    def _claimable(self, now: datetime):
+        return and_(
+            or_(
+                and_(ScoringJob.status == "queued", ScoringJob.run_after <= now),
+                and_(ScoringJob.status == "running", ScoringJob.lease_until < now),
+            ),
+            self._batch_has_capacity(now),
+        )
+
+    def _batch_has_capacity(self, now: datetime):
+        # Límite blando: dos workers simultáneos pueden excederlo en uno
+        running = aliased(ScoringJob)
+        in_flight = (
+            select(func.count(running.id))
+            .where(running.batch_id == ScoringJob.batch_id)
+            .where(running.status == "running")
+            .where(running.lease_until >= now)
+            .scalar_subquery()
+        )
+        limit = (
+            select(ScoringBatch.max_concurrency)
+            .where(ScoringBatch.id == ScoringJob.batch_id)
+            .scalar_subquery()
+        )
+        return or_(ScoringJob.batch_id.is_(None), in_flight < limit)
+
+    def claim_next(
+        self, *, worker_id: str, lease_seconds: int, scan: int = 10, kinds: tuple[str, ...] | None = None
+    ) -> ScoringJob | None:
+        now = datetime.utcnow()
+        q = db.session.query(ScoringJob.id).filter(self._claimable(now))
+        if kinds is not None:
+            q = q.filter(ScoringJob.kind.in_(kinds))
+        candidates = (
+            q.order_by(ScoringJob.batch_id.isnot(None), ScoringJob.run_after.asc(), ScoringJob.id.asc())
+            .limit(scan)
+            .all()
+        )
+        for (job_id,) in candidates:
+            if self._try_claim(job_id, now, worker_id=worker_id, lease_seconds=lease_seconds):
+                return db.session.get(ScoringJob, job_id, populate_existing=True)
+        return None
+
+    def claim_siblings(self, job: ScoringJob, *, worker_id: str, lease_seconds: int, limit: int) -> list[ScoringJob]:
+        """
+        Reclama además otros jobs reclamables del mismo postulante (hasta `limit`),
+        para puntuar su CV contra varias vacantes en una sola llamada al LLM.
+        """
+        if not job.applicant_id or limit <= 0:
+            return []
+        now = datetime.utcnow()
+        candidates = (
+            db.session.query(ScoringJob.id)
+            .filter(ScoringJob.applicant_id == job.applicant_id)
+            .filter(ScoringJob.kind == "score")
+            .filter(ScoringJob.id != job.id)
+            .filter(self._claimable(now))
+            .order_by(ScoringJob.run_after.asc(), ScoringJob.id.asc())
+            .limit(limit)
+            .all()
+        )
+        claimed = []
+        for (job_id,) in candidates:
+            if self._try_claim(job_id, now, worker_id=worker_id, lease_seconds=lease_seconds):
+                claimed.append(db.session.get(ScoringJob, job_id, populate_existing=True))
+        return claimed
+
+    def _try_claim(self, job_id: int, now: datetime, *, worker_id: str, lease_seconds: int) -> bool:
+        res = db.session.execute(
+            update(ScoringJob)
+            .where(ScoringJob.id == job_id)
+            .where(self._claimable(now))
+            .values(
+                status="running",
+                locked_by=worker_id,
+                lease_until=now + timedelta(seconds=lease_seconds),
+                heartbeat_at=now,
+                started_at=now,
+                attempts=ScoringJob.attempts + 1,
+                updated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        return res.rowcount == 1
+
+    def heartbeat(self, job_id: int, *, worker_id: str, lease_seconds: int) -> bool:
+        """Extiende el lease; False si el job ya no pertenece a este worker."""
+        now = datetime.utcnow()
+        res = db.session.execute(
+            update(ScoringJob)
+            .where(ScoringJob.id == job_id)
+            .where(ScoringJob.locked_by == worker_id)
+            .where(ScoringJob.status == "running")
+            .values(heartbeat_at=now, lease_until=now + timedelta(seconds=lease_seconds))
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        return res.rowcount == 1
+
+    def mark_succeeded(self, job: ScoringJob) -> None:
+        now = datetime.utcnow()
+        job.status = "succeeded"
+        job.finished_at = now
+        job.lease_until = None
+        job.locked_by = None
+        job.last_error = None
+
+    def park(self, job: ScoringJob, *, run_after: datetime, reason: str) -> None:
+        """
+        Devuelve el job a la cola para `run_after` SIN consumir el intento
+        (p.ej. circuito LLM abierto: el fallo es del proveedor, no del job).
+        """
+        job.status = "queued"
+        job.attempts = max((job.attempts or 0) - 1, 0)
+        job.run_after = run_after
+        job.last_error = reason
+        job.lease_until = None
+        job.locked_by = None
+
+    def mark_failed(self, job: ScoringJob, *, error: str, retry_backoff_sec: int) -> bool:
+        """
+        Registra el fallo. Si quedan intentos, reencola con backoff exponencial
+        y devuelve True; si no, deja el job en 'failed' y devuelve False.
+        """
+        now = datetime.utcnow()
+        job.last_error = error
+        job.lease_until = None
+        job.locked_by = None
+        if (job.attempts or 0) < (job.max_attempts or 1):
+            job.status = "queued"
+            job.run_after = now + timedelta(seconds=retry_backoff_sec * (2 ** max(job.attempts - 1, 0)))
+            return True
+        job.status = "failed"
+        job.finished_at = now
+        return False
+
+    _SETTLE_FIELDS = ("status", "attempts", "run_after", "finished_at", "lease_until", "locked_by", "last_error")
+
+    def settle(self, job: ScoringJob, *, worker_id: str, attempts: int) -> bool:
+        """
+        Escribe el estado que dejaron mark_succeeded/park/mark_failed en `job` con
+        un UPDATE condicionado: solo si este worker sigue siendo dueño del lease
+        (mismo locked_by y mismo intento, aún `running`). Si el lease venció y
+        otro worker reclamó el job, descarta los cambios y devuelve False.
+        """
+        values = {f: getattr(job, f) for f in self._SETTLE_FIELDS}
+        values["updated_at"] = datetime.utcnow()
+        db.session.expire(job)  # descarta los cambios sin escribir del objeto
+        res = db.session.execute(
+            update(ScoringJob)
+            .where(ScoringJob.id == job.id)
+            .where(ScoringJob.locked_by == worker_id)
+            .where(ScoringJob.attempts == attempts)
+            .where(ScoringJob.status == "running")
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        return res.rowcount == 1
+
+    def count_by_status(self, *, batch_id: int | None = None) -> dict:
+        q = db.session.query(ScoringJob.status, db.func.count(ScoringJob.id))
+        if batch_id is not None:
+            q = q.filter(ScoringJob.batch_id == batch_id)
+        rows = q.group_by(ScoringJob.status).all()
+        return {status: int(n) for status, n in rows}
@@ -0,0 +1,79 @@
+# app/repositories/scoring_metrics_repo.py
+from datetime import datetime
+from sqlalchemy import case, func
+from app.ext.db import db
+from app.models.scoring_run_metric import ScoringRunMetric as M
+
+_STAGES = ("fetch", "extract", "ocr", "prescreen", "summarize", "score", "persist", "total")
+
+
+class ScoringMetricsRepository:
+    """Persistencia y agregados de `scoring_run_metrics` (por día o por vacante)."""
+
+    def add(self, **values) -> M:
+        row = M(**values)
+        db.session.add(row)
+        return row
+
+    def _aggregates(self):
+        cols = [
+            func.count(M.id).label("runs"),
+            func.sum(case((M.status == "succeeded", 1), else_=0)).label("succeeded"),
+            func.sum(case((M.status == "failed", 1), else_=0)).label("failed"),
+            func.sum(case((M.status == "provisional", 1), else_=0)).label("provisional"),
+            func.sum(case((M.status == "parked", 1), else_=0)).label("parked"),
+        ]
+        cols += [func.avg(getattr(M, f"{s}_ms")).label(f"avg_{s}_ms") for s in _STAGES]
+        cols += [
+            func.max(M.total_ms).label("max_total_ms"),
+            func.sum(M.ocr_pages).label("ocr_pages"),
+            func.sum(case((M.text_cache_hit.is_(True), 1), else_=0)).label("text_cache_hits"),
+            func.sum(case((M.parse_cache_hit.is_(True), 1), else_=0)).label("parse_cache_hits"),
+            func.sum(M.summarize_prompt_tokens + M.score_prompt_tokens).label("prompt_tokens"),
+            func.sum(M.summarize_completion_tokens + M.score_completion_tokens).label("completion_tokens"),
+            func.sum(M.llm_calls).label("llm_calls"),
+            func.sum(M.llm_retries).label("llm_retries"),
+            func.sum(M.rate_wait_ms).label("rate_wait_ms"),
+            func.sum(M.cost_usd).label("cost_usd"),
+        ]
+        return cols
+
+    @staticmethod
+    def _row_to_dict(row, key_name: str) -> dict:
+        out = dict(row._mapping)
+        for k, v in out.items():
+            if k == key_name:
+                continue
+            if k.startswith("avg_"):
+                out[k] = round(float(v), 1) if v is not None else None
+            elif k == "cost_usd":
+                out[k] = round(float(v or 0), 6)
+            else:
+                out[k] = int(v or 0)
+        return out
+
+    def stats(
+        self,
+        *,
+        group_by: str = "day",
+        since: datetime | None = None,
+        until: datetime | None = None,
+        vacancy_id: int | None = None,
+    ) -> list[dict]:
+        """Agregados por `day` (fecha UTC) o por `vacancy`."""
+        key = func.date(M.created_at) if group_by == "day" else M.vacancy_id
+        key_name = "day" if group_by == "day" else "vacancy_id"
+        q = db.session.query(key.label(key_name), *self._aggregates())
+        if since is not None:
+            q = q.filter(M.created_at >= since)
+        if until is not None:
+            q = q.filter(M.created_at < until)
+        if vacancy_id is not None:
+            q = q.filter(M.vacancy_id == vacancy_id)
+        q = q.group_by(key).order_by(key.desc() if group_by == "day" else func.count(M.id).desc())
+        return [self._row_to_dict(r, key_name) for r in q.all()]
+
+    def window(self, since: datetime) -> dict:
+        """Agregado global desde `since` (para el export de métricas)."""
+        row = db.session.query(*self._aggregates()).filter(M.created_at >= since).one()
+        return self._row_to_dict(row, "")
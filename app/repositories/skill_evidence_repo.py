@@ -0,0 +1,74 @@
+# app/repositories/skill_evidence_repo.py
+from datetime import datetime
+
+from app.ext.db import db
+from app.models.admin.skill import Skill
+from app.models.admin.vacancy_skills import VacancySkill
+from app.models.postulation_skill_evidence import PostulationSkillEvidence as E
+from app.models.postulation_skill_scan import PostulationSkillScan
+
+
+class SkillEvidenceRepository:
+    """
+    Evidencia de skills por postulación; cada escaneo reemplaza la anterior y deja
+    su marca en postulation_skill_scans (también cuando no hubo coincidencias).
+    """
+
+    def is_current(self, postulation_id: int, text_sha256: str, catalog_version: str) -> bool:
+        scan = db.session.get(PostulationSkillScan, postulation_id)
+        return scan is not None and (scan.text_sha256, scan.catalog_version) == (text_sha256, catalog_version)
+
+    def required_skill_ids(self, vacancy_id) -> set[int]:
+        if not vacancy_id:
+            return set()
+        rows = db.session.query(VacancySkill.skill_id).filter(VacancySkill.vacancy_id == vacancy_id).all()
+        return {r.skill_id for r in rows}
+
+    def replace(
+        self,
+        *,
+        postulation_id: int,
+        vacancy_id: int | None,
+        text_sha256: str,
+        catalog_version: str,
+        matches: list[dict],
+    ) -> int:
+        """`matches` = [{skill_id, required, hits, positions, snippet}]."""
+        E.query.filter(E.postulation_id == postulation_id).delete(synchronize_session=False)
+        db.session.add_all([
+            E(postulation_id=postulation_id, vacancy_id=vacancy_id, text_sha256=text_sha256,
+              catalog_version=catalog_version, **m)
+            for m in matches
+        ])
+        scan = db.session.get(PostulationSkillScan, postulation_id)
+        if scan is None:
+            scan = PostulationSkillScan(postulation_id=postulation_id)
+            db.session.add(scan)
+        scan.text_sha256, scan.catalog_version = text_sha256, catalog_version
+        scan.skills_found, scan.scanned_at = len(matches), datetime.utcnow()
+        return len(matches)
+
+    def of_postulation(self, postulation_id: int) -> list[dict]:
+        """Requisitos de la vacante primero, luego por cantidad de menciones."""
+        rows = (
+            db.session.query(E, Skill.nombre)
+            .join(Skill, Skill.id == E.skill_id)
+            .filter(E.postulation_id == postulation_id)
+            .order_by(E.required.desc(), E.hits.desc(), Skill.nombre)
+            .all()
+        )
+        return [
+            {
+                "skill_id": e.skill_id,
+                "nombre": nombre,
+                "required": e.required,
+                "hits": e.hits,
+                "positions": e.positions,
+                "snippet": e.snippet,
+                "created_at": e.created_at,
+            }
+            for e, nombre in rows
+        ]
+
+    def hits_by_skill(self, postulation_id: int) -> dict[int, E]:
+        return {e.skill_id: e for e in E.query.filter(E.postulation_id == postulation_id).all()}
@@ -4,6 +4,7 @@ from flask import Flask
 
 # Recursos públicos
 from .health import blp as health_blp
+from .metrics import blp as metrics_blp
 from .web_portal.applicant import blp as applicants_blp
 from .web_portal.vacancies import blp as PublicVacanciesBlp
 from .web_portal.postulation import blp as PublicPostulationsBlp
@@ -23,6 +24,10 @@ from .admin.vacancies import blp as AdminVacanciesBlp
 from .admin.vacancy_stats_resource import blp as AdminVacancyStatsBlp
 from .admin.postulations_by_vacancy import blp as AdminPostulationsVacancyBlp
 from .admin.postulations import blp_admin as AdminPostulationsBlp
+from .admin.scoring_batches import blp as AdminScoringBatchesBlp
+from .admin.scoring_metrics import blp as AdminScoringMetricsBlp
+from .admin.cv_similarity import blp as AdminCVSimilarityBlp
+from .admin.skill_evidence import blp as AdminSkillEvidenceBlp
 
 # Recursos varios
 from .upload_resource import blp as UploadsBlp
@@ -57,6 +62,7 @@ def register_resources(app: Flask) -> None:
 
     # Públicos
     api.register_blueprint(health_blp)
+    api.register_blueprint(metrics_blp)
     api.register_blueprint(applicants_blp, url_prefix="/api/applicants")
     api.register_blueprint(PublicVacanciesBlp, url_prefix="/api/vacancies")
     api.register_blueprint(PublicPostulationsBlp, url_prefix="/api")
@@ -73,6 +79,10 @@ def register_resources(app: Flask) -> None:
     api.register_blueprint(AdminVacancyStatsBlp, url_prefix="/api/admin/vacancies")
     api.register_blueprint(AdminPostulationsVacancyBlp, url_prefix="/api/admin/vacancies")
     api.register_blueprint(AdminPostulationsBlp, url_prefix="/api/admin/postulations")
+    api.register_blueprint(AdminScoringBatchesBlp, url_prefix="/api/admin")
+    api.register_blueprint(AdminScoringMetricsBlp, url_prefix="/api/admin")
+    api.register_blueprint(AdminCVSimilarityBlp, url_prefix="/api/admin")
+    api.register_blueprint(AdminSkillEvidenceBlp, url_prefix="/api/admin")
 
     # Steps (Admin)
     api.register_blueprint(blp_admin_step1, url_prefix="/api/admin/postulations")
@@ -0,0 +1,57 @@
+# app/resources/admin/cv_similarity.py
+from flask import current_app
+from flask.views import MethodView
+from flask_smorest import Blueprint, abort
+from flask_jwt_extended import jwt_required
+
+from ...repositories.cv_similarity_repo import CVSimilarityRepository
+from ...schemas.admin.cv_similarity import (
+    DuplicateCVsArgs,
+    DuplicateCVsOutSchema,
+    SimilarCVsArgs,
+    SimilarCVsOutSchema,
+)
+from ...services.scoring import near_duplicates
+from .vacancies import _require_admin
+
+blp = Blueprint("AdminCVSimilarity", __name__, description="CVs iguales o casi iguales entre postulantes (Admin)")
+
+_repo = CVSimilarityRepository()
+
+
+def _threshold(args) -> float:
+    return args.get("threshold") or float(current_app.config.get("CV_SIMILARITY_THRESHOLD", 0.8))
+
+
+@blp.route("/postulations/<int:postulation_id>/similar-cvs")
+class SimilarCVs(MethodView):
+    @blp.doc(security=[{"BearerAuth": []}])
+    @jwt_required()
+    @blp.arguments(SimilarCVsArgs, location="query")
+    @blp.response(200, SimilarCVsOutSchema)
+    def get(self, args, postulation_id):
+        """Otras postulaciones cuyo CV coincide (o casi) con el de esta, de mayor a menor similitud."""
+        _require_admin()
+        threshold = _threshold(args)
+        items = near_duplicates.similar_postulations(postulation_id, threshold=threshold, limit=args["limit"])
+        if items is None:
+            abort(404, message="El CV de la postulación aún no fue indexado")
+        return {"postulation_id": postulation_id, "threshold": threshold, "items": items}
+
+
+@blp.route("/vacancies/<int:vacancy_id>/duplicate-cvs")
+class DuplicateCVs(MethodView):
+    @blp.doc(security=[{"BearerAuth": []}])
+    @jwt_required()
+    @blp.arguments(DuplicateCVsArgs, location="query")
+    @blp.response(200, DuplicateCVsOutSchema)
+    def get(self, args, vacancy_id):
+        """Grupos de postulaciones de la vacante con CVs iguales o plantillas casi idénticas."""
+        _require_admin()
+        threshold = _threshold(args)
+        return {
+            "vacancy_id": vacancy_id,
+            "threshold": threshold,
+            "indexed": len(_repo.postulations_of_vacancy(vacancy_id)),
+            "clusters": near_duplicates.duplicate_clusters(vacancy_id, threshold=threshold),
+        }
@@ -3,17 +3,25 @@ from flask_smorest import Blueprint
 from flask.views import MethodView
 from flask_jwt_extended import jwt_required
 from ...models.web_portal.postulation import Postulation
-from ...schemas.web_portal.postulation import PostulationSchema
+from ...repositories.ai_result_repo import AIResultRepository
+from ...schemas.web_portal.postulation import PostulationWithAISchema
 
 blp = Blueprint("AdminVacancyPostulations", __name__, description="Postulaciones por vacante (Admin)")
 
+_results = AIResultRepository()
+
 @blp.route("/<int:vacancy_id>/postulations")
 class AdminPostulationsByVacancy(MethodView):
     @blp.doc(security=[{"BearerAuth": []}])
     @jwt_required()
-    @blp.response(200, PostulationSchema(many=True))
+    @blp.response(200, PostulationWithAISchema(many=True))
     def get(self, vacancy_id: int):
+        """Postulaciones de la vacante con su último estado de scoring IA (2 consultas extra en total)."""
         q = (Postulation.query
              .filter_by(vacancy_id=vacancy_id)
              .order_by(Postulation.created_at.desc()))
-        return q.all()
+        items = q.all()
+        states = _results.states([p.id for p in items])
+        for p in items:
+            p.ai = states.get(p.id)  # atributo transitorio, solo para serializar
+        return items
@@ -0,0 +1,48 @@
+# app/resources/admin/scoring_batches.py
+from flask.views import MethodView
+from flask_smorest import Blueprint
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from ...models.admin.vacancy import Vacancy
+from ...models.scoring_batch import ScoringBatch
+from ...schemas.admin.scoring_batch import RescoreRequestSchema, ScoringBatchProgressSchema
+from ...services.scoring.batches import batch_progress, enqueue_rescore
+from .vacancies import _require_admin
+
+blp = Blueprint("AdminScoringBatches", __name__, description="Re-scoring IA por lotes (Admin)")
+
+
+@blp.route("/vacancies/<int:vacancy_id>/rescore")
+class VacancyRescore(MethodView):
+    @blp.doc(security=[{"BearerAuth": []}])
+    @jwt_required()
+    @blp.arguments(RescoreRequestSchema, location="json")
+    @blp.response(202, ScoringBatchProgressSchema)
+    def post(self, payload, vacancy_id: int):
+        """
+        Encola el re-scoring de las postulaciones de la vacante (o del subconjunto
+        filtrado por `postulation_ids` / `statuses`). Responde de inmediato con el lote;
+        el avance se consulta en /scoring-batches/<id>.
+        """
+        _require_admin()
+        vac = Vacancy.query.get_or_404(vacancy_id)
+        batch = enqueue_rescore(
+            vac,
+            postulation_ids=payload.get("postulation_ids"),
+            statuses=payload.get("statuses"),
+            max_concurrency=payload.get("max_concurrency"),
+            created_by=get_jwt_identity(),
+        )
+        return batch_progress(batch)
+
+
+@blp.route("/scoring-batches/<int:batch_id>")
+class ScoringBatchItem(MethodView):
+    @blp.doc(security=[{"BearerAuth": []}])
+    @jwt_required()
+    @blp.response(200, ScoringBatchProgressSchema)
+    def get(self, batch_id: int):
+        """Avance del lote: conteos por estado, % y ETA estimada."""
+        _require_admin()
+        batch = ScoringBatch.query.get_or_404(batch_id)
+        return batch_progress(batch)
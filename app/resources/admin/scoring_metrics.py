@@ -0,0 +1,34 @@
+# app/resources/admin/scoring_metrics.py
+from datetime import datetime, timedelta
+
+from flask.views import MethodView
+from flask_smorest import Blueprint
+from flask_jwt_extended import jwt_required
+
+from ...repositories.scoring_metrics_repo import ScoringMetricsRepository
+from ...schemas.admin.scoring_metrics import ScoringMetricsArgs, ScoringMetricsOutSchema
+from .vacancies import _require_admin
+
+blp = Blueprint("AdminScoringMetrics", __name__, description="Métricas del pipeline de scoring IA (Admin)")
+
+_metrics = ScoringMetricsRepository()
+
+
+@blp.route("/scoring-metrics")
+class ScoringMetrics(MethodView):
+    @blp.doc(security=[{"BearerAuth": []}])
+    @jwt_required()
+    @blp.arguments(ScoringMetricsArgs, location="query")
+    @blp.response(200, ScoringMetricsOutSchema)
+    def get(self, args):
+        """
+        Tiempos promedio por etapa, páginas OCR, tokens, reintentos y costo estimado
+        de las ejecuciones de scoring de los últimos `days` días, por día o por vacante.
+        """
+        _require_admin()
+        since = datetime.utcnow() - timedelta(days=args["days"])
+        items = _metrics.stats(group_by=args["group_by"], since=since, vacancy_id=args.get("vacancy_id"))
+        for item in items:
+            if item.get("day") is not None:
+                item["day"] = str(item["day"])
+        return {"group_by": args["group_by"], "days": args["days"], "since": since, "items": items}
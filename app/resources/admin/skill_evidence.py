@@ -0,0 +1,37 @@
+# app/resources/admin/skill_evidence.py
+from flask.views import MethodView
+from flask_smorest import Blueprint, abort
+from flask_jwt_extended import jwt_required
+
+from ...ext.db import db
+from ...models.web_portal.postulation import Postulation
+from ...repositories.skill_evidence_repo import SkillEvidenceRepository
+from ...schemas.admin.skill_evidence import SkillEvidenceOutSchema
+from .vacancies import _require_admin
+
+blp = Blueprint("AdminSkillEvidence", __name__, description="Evidencia local de skills en el CV (Admin)")
+
+_evidence = SkillEvidenceRepository()
+
+
+@blp.route("/postulations/<int:postulation_id>/skill-evidence")
+class SkillEvidence(MethodView):
+    @blp.doc(security=[{"BearerAuth": []}])
+    @jwt_required()
+    @blp.response(200, SkillEvidenceOutSchema)
+    def get(self, postulation_id):
+        """
+        Skills del catálogo encontradas en el texto del CV (con posiciones y fragmento),
+        primero las que son requisito de la vacante. Se calcula al extraer el CV, sin LLM.
+        """
+        _require_admin()
+        p = db.session.get(Postulation, postulation_id)
+        if p is None:
+            abort(404, message="Postulación no encontrada")
+        items = _evidence.of_postulation(postulation_id)
+        return {
+            "postulation_id": postulation_id,
+            "required_found": sum(1 for i in items if i["required"]),
+            "required_total": len(_evidence.required_skill_ids(p.vacancy_id)),
+            "items": items,
+        }
@@ -12,7 +12,7 @@ from app.models.admin.interview import Interview
 from app.models.admin.skill_grade import SkillGrade
 from app.models.web_portal.postulation import Postulation
 
-from ....schemas.admin.skill import SkillCompactSchema
+from ....schemas.admin.skill import AllowedSkillSchema
 from app.schemas.admin.interview import InterviewCreateSchema, InterviewSchema
 from app.schemas.admin.skill_grade import SkillGradeCreateSchema, SkillGradeSchema
 from ....schemas.web_portal.postulation import PostulationStatusSchema
@@ -206,22 +206,28 @@ class UpdateInterviewNotes(MethodView):
 @blp.route("interview/<int:pid>/allowed-skills", methods=["GET"])
 class AllowedSkillsForPostulation(MethodView):
     @jwt_required()
-    @blp.response(200, SkillCompactSchema(many=True))
+    @blp.response(200, AllowedSkillSchema(many=True))
     def get(self, pid: int):
         p = _load_postulation_or_404(pid)
 
         # FIX: tabla correcta: postulations (plural)
+        # Evidencia en el CV: matcher local de skills (postulation_skill_evidence)
         rows = db.session.execute(text("""
-            SELECT s.id, s.nombre
+            SELECT s.id, s.nombre, COALESCE(e.hits, 0) AS cv_hits, e.snippet AS cv_snippet
             FROM postulation p
             INNER JOIN vacancies v       ON v.id = p.vacancy_id
             INNER JOIN vacancy_skills vs ON vs.vacancy_id = v.id
             INNER JOIN skills s          ON s.id = vs.skill_id
+            LEFT JOIN postulation_skill_evidence e
+                   ON e.postulation_id = p.id AND e.skill_id = s.id
             WHERE p.id = :pid
             ORDER BY s.nombre
         """), {"pid": p.id}).mappings().all()
 
-        return [{"id": r["id"], "nombre": r["nombre"]} for r in rows]
+        return [
+            {"id": r["id"], "nombre": r["nombre"], "cv_hits": r["cv_hits"], "cv_snippet": r["cv_snippet"]}
+            for r in rows
+        ]
     
 
 @blp.route("interview/<int:pid>/complete", methods=["POST"])
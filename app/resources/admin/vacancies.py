@@ -10,10 +10,14 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import joinedload, selectinload
 
 from ...ext.db import db
+from ...ext.s3 import extract_key_from_cv_path
 from ...models.admin.charges import Charges
 from ...models.admin.vacancy import Vacancy
 from ...models.admin.vacancy_skills import VacancySkill
+from ...models.web_portal.postulation import Postulation
 from ...schemas.admin.vacancy import VacancySchema, VacancySkillSchema
+from ...services.cv_sweeper import delete_unreferenced_cvs
+from ...services.scoring.vacancy_prompt import vacancy_prompts
 
 blp = Blueprint("AdminVacancies", __name__, description="CRUD de vacantes para cPanel")
 
@@ -202,6 +206,8 @@ class VacanciesItem(MethodView):
         except IntegrityError as e:
             db.session.rollback()
             abort(400, message="Error de integridad al actualizar vacante", extra=str(e))
+        # Otros procesos lo detectan por el cambio de updated_at
+        vacancy_prompts.invalidate(vacancy.id)
         return vacancy
 
     @jwt_required()
@@ -211,8 +217,12 @@ class VacanciesItem(MethodView):
         vacancy = Vacancy.query.get_or_404(vacancy_id)
 
         # Nota: en fase posterior, bloquear borrado si existen postulaciones asociadas.
+        # Las postulaciones caen en cascada en la BD: sus CVs se juntan antes y se borran en lote,
+        # salvo los que otra postulación (de otra vacante) sigue usando
+        cv_paths = db.session.query(Postulation.cv_path).filter(Postulation.vacancy_id == vacancy.id).all()
         db.session.delete(vacancy)
         db.session.commit()
+        delete_unreferenced_cvs(extract_key_from_cv_path(p) for (p,) in cv_paths)
         return None
 
 
@@ -1,9 +1,12 @@
+import logging
+
 from flask_smorest import Blueprint
 from flask.views import MethodView
 from flask_jwt_extended import jwt_required
 from sqlalchemy import desc, func
 
 from ...ext.db import db
+from ...ext.s3 import extract_key_from_cv_path, presign_many
 from ...models.admin.vacancy import Vacancy
 from ...models.web_portal.postulation import Postulation
 from ...models.web_portal.applicant import Applicant 
@@ -55,7 +58,8 @@ class AdminPostulationsByVacancy(MethodView):
     @blp.response(200, AdminPostulationRowSchema(many=True))
     def get(self, vacancy_id: int):
         """
-        Postulaciones de la vacante con nombre/email del applicant + credential/number.
+        Postulaciones de la vacante con nombre/email del applicant + credential/number
+        y `cv_url` (URL firmada, cacheada: no se firma de nuevo en cada listado).
         """
         q = (
             db.session.query(
@@ -87,5 +91,13 @@ class AdminPostulationsByVacancy(MethodView):
             .filter(Postulation.vacancy_id == vacancy_id)
             .order_by(desc(Postulation.created_at))
         )
-        rows = q.all()
-        return [dict(r._mapping) for r in rows]
\ No newline at end of file
+        rows = [dict(r._mapping) for r in q.all()]
+        keys = {r["id"]: extract_key_from_cv_path(r["cv_path"]) for r in rows}
+        try:
+            urls = presign_many(keys.values())
+        except Exception:
+            logging.exception("No se pudieron firmar las URLs de CV")
+            urls = {}
+        for r in rows:
+            r["cv_url"] = urls.get(keys[r["id"]])
+        return rows
\ No newline at end of file
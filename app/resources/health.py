@@ -1,6 +1,8 @@
 from flask.views import MethodView
 from flask_smorest import Blueprint
-from ..schemas.health import HealthOut  
+from ..ext.llm_circuit_breaker import llm_breaker
+from ..ext.llm_rate_limiter import llm_limiter
+from ..schemas.health import HealthOut, LLMHealthOut
 
 blp = Blueprint("health", "health", url_prefix="/api/v1/health", description="Health check")
 
@@ -9,3 +11,21 @@ class Health(MethodView):
     @blp.response(200, HealthOut)
     def get(self):
         return {"status": "ok"}
+
+
+@blp.route("/llm")
+class LLMHealth(MethodView):
+    @blp.response(200, LLMHealthOut)
+    def get(self):
+        """Estado del circuit breaker y saturación del limitador global hacia el LLM."""
+        snap = llm_limiter.snapshot()
+        breaker = llm_breaker.snapshot()
+        # Endpoint público: el último error del proveedor puede traer detalles internos
+        breaker.pop("last_error", None)
+        if breaker["state"] != "closed":
+            status = "degraded"
+        elif snap.get("saturation", 0) >= 1.0 or snap.get("waiting"):
+            status = "saturated"
+        else:
+            status = "ok"
+        return {"status": status, "rate_limit": snap, "circuit_breaker": breaker}
@@ -0,0 +1,108 @@
+# app/resources/metrics.py
+"""
+Export de métricas del scoring IA en formato de texto de Prometheus.
+
+Los gauges `scoring_window_*` agregan las ejecuciones de los últimos
+SCORING_METRICS_WINDOW_MIN minutos (tabla scoring_run_metrics), así que cualquier
+réplica responde lo mismo; `scoring_jobs` es el tamaño de la cola por estado.
+
+No es público: acepta un JWT de admin o, para el scraper de Prometheus,
+`Authorization: Bearer <METRICS_SCRAPE_TOKEN>` (si el token está configurado).
+"""
+import hmac
+from datetime import datetime, timedelta
+
+from flask import Response, current_app, request
+from flask.views import MethodView
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+from flask_smorest import Blueprint, abort
+
+from ..ext.llm_circuit_breaker import llm_breaker
+from ..repositories.scoring_job_repo import ScoringJobRepository
+from ..repositories.scoring_metrics_repo import ScoringMetricsRepository
+
+blp = Blueprint("metrics", "metrics", url_prefix="/api/v1/metrics", description="Métricas (Prometheus)")
+
+_jobs = ScoringJobRepository()
+_metrics = ScoringMetricsRepository()
+
+_STAGES = ("fetch", "extract", "ocr", "prescreen", "summarize", "score", "persist", "total")
+_COUNTERS = (
+    ("ocr_pages", "Páginas procesadas con OCR"),
+    ("text_cache_hits", "Ejecuciones con texto de CV en cache"),
+    ("parse_cache_hits", "Ejecuciones con CV_JSON en cache"),
+    ("prompt_tokens", "Tokens de prompt enviados al LLM"),
+    ("completion_tokens", "Tokens de respuesta del LLM"),
+    ("llm_calls", "Llamadas al LLM"),
+    ("llm_retries", "Reintentos de llamadas al LLM"),
+    ("rate_wait_ms", "Espera acumulada en el limitador del LLM (ms)"),
+    ("cost_usd", "Costo estimado del LLM (USD)"),
+)
+
+
+def render_scoring_metrics(window: dict, queue: dict, window_min: int, breaker: dict | None = None) -> str:
+    lines = [
+        "# HELP scoring_window_runs Ejecuciones del pipeline en la ventana, por estado",
+        "# TYPE scoring_window_runs gauge",
+    ]
+    for status in ("succeeded", "failed", "provisional", "parked"):
+        lines.append(f'scoring_window_runs{{status="{status}"}} {window.get(status, 0)}')
+    lines += [
+        "# HELP scoring_window_stage_avg_ms Duración promedio por etapa en la ventana (ms)",
+        "# TYPE scoring_window_stage_avg_ms gauge",
+    ]
+    for stage in _STAGES:
+        value = window.get(f"avg_{stage}_ms")
+        if value is not None:
+            lines.append(f'scoring_window_stage_avg_ms{{stage="{stage}"}} {value}')
+    lines += [
+        "# HELP scoring_window_total_max_ms Duración máxima de una ejecución en la ventana (ms)",
+        "# TYPE scoring_window_total_max_ms gauge",
+        f"scoring_window_total_max_ms {window.get('max_total_ms', 0)}",
+    ]
+    for key, help_text in _COUNTERS:
+        lines += [
+            f"# HELP scoring_window_{key} {help_text} en la ventana",
+            f"# TYPE scoring_window_{key} gauge",
+            f"scoring_window_{key} {window.get(key, 0)}",
+        ]
+    lines += [
+        "# HELP scoring_window_minutes Tamaño de la ventana de los gauges scoring_window_*",
+        "# TYPE scoring_window_minutes gauge",
+        f"scoring_window_minutes {window_min}",
+        "# HELP scoring_jobs Jobs de scoring en la cola, por estado",
+        "# TYPE scoring_jobs gauge",
+    ]
+    for status in ("queued", "running", "succeeded", "failed"):
+        lines.append(f'scoring_jobs{{status="{status}"}} {queue.get(status, 0)}')
+    if breaker is not None:
+        lines += [
+            "# HELP llm_circuit_state Estado del circuit breaker LLM (1 en el estado vigente)",
+            "# TYPE llm_circuit_state gauge",
+        ]
+        for state in ("closed", "open", "half_open"):
+            lines.append(f'llm_circuit_state{{state="{state}"}} {int(breaker.get("state") == state)}')
+    return "\n".join(lines) + "\n"
+
+
+def _require_scraper_or_admin():
+    token = current_app.config.get("METRICS_SCRAPE_TOKEN")
+    if token and hmac.compare_digest(request.headers.get("Authorization", "").encode(),
+                                     f"Bearer {token}".encode()):
+        return
+    verify_jwt_in_request()
+    identity = get_jwt_identity()
+    if not (isinstance(identity, str) and identity.startswith("admin:")):
+        abort(403, message="Token no válido para métricas")
+
+
+@blp.route("/scoring")
+class ScoringMetricsExport(MethodView):
+    @blp.doc(security=[{"BearerAuth": []}])
+    def get(self):
+        _require_scraper_or_admin()
+        window_min = int(current_app.config.get("SCORING_METRICS_WINDOW_MIN", 15))
+        since = datetime.utcnow() - timedelta(minutes=window_min)
+        body = render_scoring_metrics(_metrics.window(since), _jobs.count_by_status(), window_min,
+                                      llm_breaker.snapshot())
+        return Response(body, mimetype="text/plain; version=0.0.4")
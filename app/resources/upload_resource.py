@@ -1,14 +1,84 @@
-import mimetypes, os
 from flask import request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from werkzeug.utils import secure_filename
 from flask_smorest import Blueprint
 from botocore.exceptions import ClientError
 
-from ..ext.s3 import s3_client, s3_key_for_cv, public_url_from_key, AWS_BUCKET
+from ..ext.s3 import public_url_from_key, AWS_BUCKET
+from ..services.cv_uploads import (
+    CVUploadError,
+    complete_cv_upload,
+    presign_cv_upload,
+    stream_cv_upload,
+    upload_payload,
+)
 
 blp = Blueprint("Uploads", __name__, description="Carga de CVs a S3")
 
+
+def _vacancy_id(raw) -> int:
+    try:
+        return int(raw or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+@blp.route("/cv/presign", methods=["POST"])
+@jwt_required()
+def presign_cv():
+    """
+    POST firmado para subir el CV directo del navegador a S3 (sin pasar por la API).
+    Body: {"filename", "vacancy_id"?, "size"?}. El form a S3 lleva `fields` + el archivo
+    en el campo `file`; al terminar, llamar a /cv/complete con la `key`.
+    """
+    if not AWS_BUCKET:
+        return jsonify({"message": "Config error: AWS_BUCKET no seteado"}), 500
+
+    body = request.get_json(silent=True) or {}
+    try:
+        out = presign_cv_upload(
+            applicant_id=int(get_jwt_identity()),
+            vacancy_id=_vacancy_id(body.get("vacancy_id")),
+            filename=body.get("filename"),
+            size=body.get("size") if isinstance(body.get("size"), int) else None,
+        )
+    except CVUploadError as e:
+        return jsonify({"message": e.message}), e.status
+    except ClientError:
+        current_app.logger.exception("S3 presign error")
+        return jsonify({"message": "No se pudo preparar la subida del CV"}), 500
+    return jsonify(out), 201
+
+
+@blp.route("/cv/complete", methods=["POST"])
+@jwt_required()
+def complete_cv():
+    """Confirma una subida directa: verifica el objeto en S3 (HEAD) y lo registra."""
+    body = request.get_json(silent=True) or {}
+    try:
+        row = complete_cv_upload(applicant_id=int(get_jwt_identity()), key=body.get("key") or "")
+    except CVUploadError as e:
+        return jsonify({"message": e.message}), e.status
+    except ClientError as e:
+        current_app.logger.exception("S3 head error")
+        err = e.response.get("Error", {})
+        return jsonify({"message": "No se pudo verificar el CV", "code": err.get("Code")}), 500
+    return jsonify(upload_payload(row)), 200
+
+
+@blp.route("/cv/stream", methods=["POST"])
+@jwt_required()
+def upload_cv_stream():
+    """
+    Subida por la API sin bufferizar: el cuerpo es el PDF crudo (Content-Type:
+    application/pdf), `filename` y `vacancy_id` van en la query. Se reenvía a S3
+    por partes mientras llega; memoria por subida ~ S3_UPLOAD_CONCURRENCY partes.
+    """
+    if not AWS_BUCKET:
+        return jsonify({"message": "Config error: AWS_BUCKET no seteado"}), 500
+    return _stream_to_s3(request.stream, request.args.get("filename"), request.args.get("vacancy_id"),
+                         request.content_length)
+
+
 @blp.route("/cv", methods=["POST"])
 @jwt_required()
 def upload_cv():
@@ -19,36 +89,20 @@ def upload_cv():
         return jsonify({"message": "No se envió archivo en el campo 'cv'"}), 400
 
     f = request.files["cv"]
-    filename = secure_filename(f.filename or "")
-    if not filename.lower().endswith(".pdf"):
-        return jsonify({"message": "El CV debe ser un PDF"}), 400
-
-    # límite 25MB
-    f.seek(0, 2)
-    size = f.tell()
-    f.seek(0)
-    if size > 25 * 1024 * 1024:
-        return jsonify({"message": "El CV no debe superar 5MB"}), 400
-
-    applicant_id = int(get_jwt_identity())
-    try:
-        vacancy_id = int(request.form.get("vacancy_id") or 0)
-    except ValueError:
-        vacancy_id = 0
+    return _stream_to_s3(f.stream, f.filename, request.form.get("vacancy_id"), None)
 
-    key = s3_key_for_cv(vacancy_id or 0, applicant_id, filename)
-    content_type = mimetypes.guess_type(filename)[0] or "application/pdf"
 
+def _stream_to_s3(raw, filename, vacancy_id, content_length):
     try:
-        s3_client.upload_fileobj(
-            f,
-            AWS_BUCKET,
-            key,
-            ExtraArgs={
-                "ContentType": content_type,
-                "CacheControl": "max-age=31536000, public",
-            },
+        row = stream_cv_upload(
+            raw,
+            applicant_id=int(get_jwt_identity()),
+            vacancy_id=_vacancy_id(vacancy_id),
+            filename=filename,
+            content_length=content_length,
         )
+    except CVUploadError as e:
+        return jsonify({"message": e.message}), e.status
     except ClientError as e:
         current_app.logger.exception("S3 upload error")
         err = e.response.get("Error", {})
@@ -61,4 +115,4 @@ def upload_cv():
         current_app.logger.exception("Error subiendo CV a S3")
         return jsonify({"message": "No se pudo subir el CV", "error": str(e)}), 500
 
-    return jsonify({"key": key, "url": public_url_from_key(key)}), 201
+    return jsonify({"key": row.key, "url": public_url_from_key(row.key), "sha256": row.sha256}), 201
@@ -1,8 +1,5 @@
 # app/resources/web_portal/postulation.py
-import os
 from datetime import datetime
-import datetime as _dt
-from decimal import Decimal
 import logging
 
 from flask import request
@@ -13,7 +10,7 @@ from sqlalchemy import and_
 from sqlalchemy.exc import IntegrityError
 
 from ...ext.db import db
-from ...ext.s3 import delete_cv_key, extract_key_from_cv_path, make_presigned_url
+from ...ext.s3 import delete_cv_key, extract_key_from_cv_path
 from ...models.web_portal.postulation import Postulation
 from ...models.admin.vacancy import Vacancy
 from ...schemas.web_portal.postulation import (
@@ -23,24 +20,12 @@ from ...schemas.web_portal.postulation import (
     PostulationWithVacancySchema,
 )
 from app.resources.ai_scoring import trigger_scoring_async
+from app.services.scoring.payloads import build_scoring_payload
 
 logger = logging.getLogger(__name__)
 
 blp = Blueprint("Postulations", __name__, description="CRUD de postulaciones (Applicant)")
 
-# ----------------------- Utils -----------------------
-def _to_jsonable(x):
-    if isinstance(x, Decimal):
-        return int(x) if x == int(x) else float(x)
-    if isinstance(x, (_dt.datetime, _dt.date)):
-        return x.isoformat()
-    if isinstance(x, dict):
-        return {k: _to_jsonable(v) for k, v in x.items()}
-    if isinstance(x, (list, tuple, set)):
-        return [_to_jsonable(v) for v in x]
-    return x
-
-
 # ----------------------- Collection -----------------------
 @blp.route("/postulations")
 class PostulationCollection(MethodView):
@@ -87,40 +72,7 @@ class PostulationCollection(MethodView):
 
             try:
                 logger.info("[AI] Preparando scoring para postulation_id=%s vacancy_id=%s", post.id, post.vacancy_id)
-                cv_key = post.cv_path
-                try:
-                    presigned = make_presigned_url(cv_key, expires_seconds=1200)
-                    cv_payload = {"storage": "url", "presigned_url": presigned}
-                except Exception:
-                    cv_payload = {"storage": "s3", "s3_bucket": os.getenv("AWS_BUCKET"), "s3_key": cv_key}
-
-                applicant_profile = {
-                    "residence_addr": post.residence_addr,
-                    "age": post.age,
-                    "role_exp_years": post.role_exp_years,
-                    "expected_salary": post.expected_salary,
-                    "name": None, "email": None, "phone": post.number, "credential": post.credential,
-                }
-                vacancy_profile = {
-                    "location": getattr(vac, "location", None),
-                    "modality": getattr(vac, "modality", None),
-                    "role_objective": getattr(vac, "role_objective", None),
-                    "responsibilities": getattr(vac, "responsibilities", None),
-                    "req_education": getattr(vac, "req_education", None),
-                    "req_experience": getattr(vac, "req_experience", None),
-                    "req_knowledge": getattr(vac, "req_knowledge", None),
-                    "charge_title": getattr(vac, "title", None),
-                    "charge_description": getattr(vac, "description", None),
-                    "charge_area": getattr(vac, "area", None),
-                }
-                trigger_scoring_async(_to_jsonable({
-                    "postulation_id": post.id,
-                    "vacancy_id": post.vacancy_id,
-                    "position": vacancy_profile["charge_title"] or getattr(vac, "title", None),
-                    "cv": cv_payload,
-                    "applicant_profile": applicant_profile,
-                    "vacancy_profile": vacancy_profile,
-                }))
+                trigger_scoring_async(build_scoring_payload(post, vac))
                 logger.info("[AI] scoring interno encolado postulation_id=%s", post.id)
             except Exception as e:
                 logger.exception("[AI] Error al preparar/enviar scoring: %s", e)
@@ -0,0 +1,40 @@
+# app/schemas/admin/cv_similarity.py
+from marshmallow import Schema, fields, validate
+
+
+class SimilarCVsArgs(Schema):
+    threshold = fields.Float(required=False, validate=validate.Range(min=0.1, max=1.0))
+    limit = fields.Int(load_default=20, validate=validate.Range(min=1, max=200))
+
+
+class DuplicateCVsArgs(Schema):
+    threshold = fields.Float(required=False, validate=validate.Range(min=0.1, max=1.0))
+
+
+class SimilarCVSchema(Schema):
+    postulation_id = fields.Int()
+    vacancy_id = fields.Int(allow_none=True)
+    applicant_id = fields.Int(allow_none=True)
+    similarity = fields.Float()
+    exact = fields.Bool()
+
+
+class SimilarCVsOutSchema(Schema):
+    postulation_id = fields.Int()
+    threshold = fields.Float()
+    items = fields.List(fields.Nested(SimilarCVSchema))
+
+
+class DuplicateClusterSchema(Schema):
+    size = fields.Int()
+    distinct_texts = fields.Int()
+    min_similarity = fields.Float()
+    postulation_ids = fields.List(fields.Int())
+    applicant_ids = fields.List(fields.Int())
+
+
+class DuplicateCVsOutSchema(Schema):
+    vacancy_id = fields.Int()
+    threshold = fields.Float()
+    indexed = fields.Int()
+    clusters = fields.List(fields.Nested(DuplicateClusterSchema))
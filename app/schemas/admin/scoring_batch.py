@@ -0,0 +1,26 @@
+# app/schemas/admin/scoring_batch.py
+from marshmallow import Schema, fields, validate
+
+
+class RescoreRequestSchema(Schema):
+    postulation_ids = fields.List(fields.Int(), required=False)
+    statuses = fields.List(fields.Str(validate=validate.Length(max=32)), required=False)
+    max_concurrency = fields.Int(required=False, validate=validate.Range(min=1, max=64))
+
+
+class ScoringBatchProgressSchema(Schema):
+    id = fields.Int()
+    vacancy_id = fields.Int(allow_none=True)
+    kind = fields.Str()
+    max_concurrency = fields.Int()
+    total = fields.Int()
+    skipped = fields.Int()
+    queued = fields.Int()
+    running = fields.Int()
+    succeeded = fields.Int()
+    failed = fields.Int()
+    progress = fields.Float()
+    elapsed_sec = fields.Float()
+    eta_sec = fields.Float(allow_none=True)
+    finished = fields.Bool()
+    created_at = fields.DateTime()
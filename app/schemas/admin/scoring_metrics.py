@@ -0,0 +1,43 @@
+# app/schemas/admin/scoring_metrics.py
+from marshmallow import Schema, fields, validate
+
+
+class ScoringMetricsArgs(Schema):
+    group_by = fields.Str(load_default="day", validate=validate.OneOf(["day", "vacancy"]))
+    days = fields.Int(load_default=7, validate=validate.Range(min=1, max=365))
+    vacancy_id = fields.Int(required=False)
+
+
+class ScoringMetricsRowSchema(Schema):
+    day = fields.Str(allow_none=True)
+    vacancy_id = fields.Int(allow_none=True)
+    runs = fields.Int()
+    succeeded = fields.Int()
+    failed = fields.Int()
+    provisional = fields.Int()
+    parked = fields.Int()
+    avg_fetch_ms = fields.Float(allow_none=True)
+    avg_extract_ms = fields.Float(allow_none=True)
+    avg_ocr_ms = fields.Float(allow_none=True)
+    avg_prescreen_ms = fields.Float(allow_none=True)
+    avg_summarize_ms = fields.Float(allow_none=True)
+    avg_score_ms = fields.Float(allow_none=True)
+    avg_persist_ms = fields.Float(allow_none=True)
+    avg_total_ms = fields.Float(allow_none=True)
+    max_total_ms = fields.Int()
+    ocr_pages = fields.Int()
+    text_cache_hits = fields.Int()
+    parse_cache_hits = fields.Int()
+    prompt_tokens = fields.Int()
+    completion_tokens = fields.Int()
+    llm_calls = fields.Int()
+    llm_retries = fields.Int()
+    rate_wait_ms = fields.Int()
+    cost_usd = fields.Float()
+
+
+class ScoringMetricsOutSchema(Schema):
+    group_by = fields.Str()
+    days = fields.Int()
+    since = fields.DateTime()
+    items = fields.List(fields.Nested(ScoringMetricsRowSchema))
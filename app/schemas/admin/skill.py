@@ -69,4 +69,9 @@ class SkillListSchema(Schema):
 
 class SkillCompactSchema(Schema):
     id = fields.Int()
-    nombre = fields.Str()
\ No newline at end of file
+    nombre = fields.Str()
+
+class AllowedSkillSchema(SkillCompactSchema):
+    # Evidencia local en el CV (postulation_skill_evidence); 0/None si no se encontró
+    cv_hits = fields.Int()
+    cv_snippet = fields.Str(allow_none=True)
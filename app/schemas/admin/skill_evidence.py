@@ -0,0 +1,19 @@
+# app/schemas/admin/skill_evidence.py
+from marshmallow import Schema, fields
+
+
+class SkillEvidenceSchema(Schema):
+    skill_id = fields.Int()
+    nombre = fields.Str()
+    required = fields.Bool()
+    hits = fields.Int()
+    positions = fields.List(fields.List(fields.Int()))
+    snippet = fields.Str(allow_none=True)
+    created_at = fields.DateTime()
+
+
+class SkillEvidenceOutSchema(Schema):
+    postulation_id = fields.Int()
+    required_found = fields.Int()
+    required_total = fields.Int()
+    items = fields.List(fields.Nested(SkillEvidenceSchema))
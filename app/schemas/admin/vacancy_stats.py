@@ -22,6 +22,7 @@ class AdminPostulationRowSchema(Schema):
     role_exp_years = fields.Int(allow_none=True)
     expected_salary = fields.Int(allow_none=True)
     cv_path = fields.Str()
+    cv_url = fields.Str(allow_none=True)  # URL firmada de descarga (20 min)
     status = fields.Str()
     created_at = fields.DateTime()
     updated_at = fields.DateTime()
@@ -2,3 +2,9 @@ from marshmallow import Schema, fields
 
 class HealthOut(Schema):
     status = fields.Str(required=True, example="ok")
+
+
+class LLMHealthOut(Schema):
+    status = fields.Str(required=True, example="ok")
+    rate_limit = fields.Dict(required=True)
+    circuit_breaker = fields.Dict(required=True)
@@ -1,6 +1,8 @@
 # app/schemas/web_portal/postulation.py
 from marshmallow import Schema, fields, validate
 
+from .postulation_ai_result import PostulationAIResultSchema
+
 class PostulationCreateSchema(Schema):
     vacancy_id = fields.Int(required=True)
     residence_addr = fields.Str(required=False, validate=validate.Length(min=3))
@@ -30,6 +32,10 @@ class PostulationSchema(Schema):
     created_at = fields.DateTime()
     updated_at = fields.DateTime()
 
+class PostulationWithAISchema(PostulationSchema):
+    """Postulación + último estado de scoring IA (listas de admin)."""
+    ai = fields.Nested(PostulationAIResultSchema, dump_only=True)
+
 class PostulationUpdateSchema(Schema):
     residence_addr = fields.Str(validate=validate.Length(min=1, max=255))
     credential = fields.Str(required=False, validate=validate.Length(max=20))
@@ -1,9 +1,19 @@
-from marshmallow import Schema, fields
+from marshmallow import Schema, fields, validate
 
 class PostulationAIResultSchema(Schema):
     id = fields.Int()
     postulation_id = fields.Int(required=True)
     vacancy_id = fields.Int(allow_none=True)
-    score = fields.Int(required=True)
-    feedback = fields.Str(required=True)
-    created_at = fields.DateTime()
+    status = fields.Str()  # not_enqueued | queued | running | succeeded | failed | provisional
+    score = fields.Int(allow_none=True)
+    feedback = fields.Str(allow_none=True)
+    error = fields.Str(allow_none=True)
+    job_id = fields.Int(allow_none=True)
+    attempts = fields.Int(allow_none=True)
+    pipeline_version = fields.Str(allow_none=True)
+    started_at = fields.DateTime(allow_none=True)
+    created_at = fields.DateTime(allow_none=True)
+
+
+class PostulationAIResultWaitArgs(Schema):
+    timeout = fields.Float(load_default=25.0, validate=validate.Range(min=0, max=60))
@@ -0,0 +1,83 @@
+# app/services/cv_sweeper.py
+"""
+Barrido de CVs huérfanos en S3.
+
+Recorre el prefijo de CVs (AWS_S3_FOLDER/) página por página y compara cada
+página contra el conjunto de claves referenciadas por `Postulation.cv_path`
+(una sola consulta, diferencia de conjuntos en memoria). Los objetos sin
+postulación y más viejos que CV_SWEEP_GRACE_HOURS (una subida reciente puede
+estar por adjuntarse) se borran con delete_objects en lotes de 1000, junto con
+su registro en cv_uploads.
+"""
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from flask import current_app
+
+from app.ext.db import db
+from app.ext.s3 import AWS_S3_FOLDER, delete_cv_keys, extract_key_from_cv_path, iter_cv_pages
+from app.models.cv_upload import CVUpload
+from app.models.web_portal.postulation import Postulation
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SweepResult:
+    scanned: int = 0
+    orphans: int = 0
+    deleted: int = 0
+
+
+def is_cv_key(key: str | None) -> bool:
+    return bool(key) and key.startswith(f"{AWS_S3_FOLDER}/")
+
+
+def referenced_cv_keys() -> set[str]:
+    rows = db.session.query(Postulation.cv_path).filter(Postulation.cv_path.isnot(None))
+    return {key for (path,) in rows.yield_per(5000) if (key := extract_key_from_cv_path(path))}
+
+
+def delete_cvs(keys) -> int:
+    """
+    Borra de S3 las claves de CVs (ignora las que no son del prefijo) y el registro
+    de subida de las que S3 confirmó; las que fallaron quedan para el próximo barrido.
+    """
+    keys = [k for k in dict.fromkeys(keys) if is_cv_key(k)]
+    if not keys:
+        return 0
+    deleted = delete_cv_keys(keys)
+    if deleted:
+        CVUpload.query.filter(CVUpload.key.in_(deleted)).delete(synchronize_session=False)
+        db.session.commit()
+    return len(deleted)
+
+
+def delete_unreferenced_cvs(keys) -> int:
+    """Como delete_cvs, pero conserva los CVs que otra postulación todavía usa (mismo cv_path)."""
+    keys = [k for k in dict.fromkeys(keys) if is_cv_key(k)]
+    if not keys:
+        return 0
+    referenced = referenced_cv_keys()
+    return delete_cvs(k for k in keys if k not in referenced)
+
+
+def sweep_orphan_cvs(*, grace_hours: int | None = None, dry_run: bool = False,
+                     now: datetime | None = None) -> SweepResult:
+    if grace_hours is None:
+        grace_hours = current_app.config.get("CV_SWEEP_GRACE_HOURS", 48)
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(hours=grace_hours)
+    referenced = referenced_cv_keys()
+
+    result = SweepResult()
+    for page in iter_cv_pages():
+        result.scanned += len(page)
+        orphans = [key for key, modified in page if modified < cutoff and key not in referenced]
+        result.orphans += len(orphans)
+        if orphans and not dry_run:
+            result.deleted += delete_cvs(orphans)
+
+    logger.info("Barrido de CVs: %s objetos, %s huérfanos, %s borrados%s",
+                result.scanned, result.orphans, result.deleted, " (dry-run)" if dry_run else "")
+    return result
@@ -0,0 +1,182 @@
+# app/services/cv_uploads.py
+"""
+Subida directa de CVs del navegador a S3 (POST firmado).
+
+1) `presign_cv_upload`: emite una política acotada a una clave `s3_key_for_cv`
+   del postulante, con Content-Type PDF y tamaño 1..CV_MAX_BYTES, y registra la
+   subida como `pending`.
+2) El navegador sube el archivo directo a S3: los bytes no pasan por la API.
+3) `complete_cv_upload`: HEAD del objeto (existe, tamaño, tipo) + firma %PDF con
+   un GET de 8 bytes; si todo cuadra la subida queda `uploaded`.
+
+Toda subida terminada encola el pre-procesamiento del CV (ver scoring/preprocess.py).
+
+Cuando la subida debe pasar por la API, `stream_cv_upload` lee el cuerpo por
+partes (CVStreamReader) y las reenvía como partes multipart de S3: calcula el
+SHA-256 al vuelo y corta apenas se excede el tamaño o falta la firma %PDF.
+"""
+import hashlib
+import logging
+import mimetypes
+
+from werkzeug.utils import secure_filename
+
+from app.ext.db import db
+from app.ext.s3 import (
+    CV_MAX_BYTES,
+    CV_UPLOAD_POST_EXPIRES_SEC,
+    delete_cv_key,
+    head_cv_key,
+    make_presigned_post,
+    public_url_from_key,
+    read_cv_prefix,
+    s3_key_for_cv,
+    upload_cv_fileobj,
+)
+from app.models.cv_upload import CVUpload
+from app.repositories.cv_upload_repo import CVUploadRepository
+from app.services.scoring.preprocess import enqueue_preprocess
+
+logger = logging.getLogger(__name__)
+
+PDF_MAGIC = b"%PDF-"
+PDF_CONTENT_TYPE = "application/pdf"
+
+_uploads = CVUploadRepository()
+
+
+class CVUploadError(ValueError):
+    """Error de validación de la subida; `status` es el código HTTP a devolver."""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+def _pdf_filename(filename: str | None) -> str:
+    name = secure_filename(filename or "")
+    if not name.lower().endswith(".pdf"):
+        raise CVUploadError("El CV debe ser un PDF")
+    return name
+
+
+def presign_cv_upload(*, applicant_id: int, vacancy_id: int | None, filename: str | None,
+                      size: int | None = None) -> dict:
+    name = _pdf_filename(filename)
+    if size is not None and size > CV_MAX_BYTES:
+        raise CVUploadError(f"El CV no debe superar {CV_MAX_BYTES // (1024 * 1024)}MB")
+
+    key = s3_key_for_cv(vacancy_id or 0, applicant_id, name)
+    content_type = mimetypes.guess_type(name)[0] or PDF_CONTENT_TYPE
+    post = make_presigned_post(key, content_type=content_type, max_bytes=CV_MAX_BYTES,
+                               expires_seconds=CV_UPLOAD_POST_EXPIRES_SEC)
+    _uploads.add(key=key, applicant_id=applicant_id, vacancy_id=vacancy_id or None,
+                 filename=name, content_type=content_type)
+    db.session.commit()
+    return {
+        "key": key,
+        "url": post["url"],
+        "fields": post["fields"],
+        "expires_in": CV_UPLOAD_POST_EXPIRES_SEC,
+        "max_bytes": CV_MAX_BYTES,
+    }
+
+
+def complete_cv_upload(*, applicant_id: int, key: str) -> CVUpload:
+    """Verifica el objeto subido y marca la subida como `uploaded` (idempotente)."""
+    row = _uploads.get_by_key(key or "")
+    if row is None or row.applicant_id != applicant_id:
+        raise CVUploadError("Subida no encontrada", 404)
+    if row.status == "uploaded":
+        return row
+
+    head = head_cv_key(key)
+    if head is None:
+        raise CVUploadError("El archivo aún no está en S3", 409)
+    if head["size"] <= 0 or head["size"] > CV_MAX_BYTES or head["content_type"] != row.content_type:
+        delete_cv_key(key)
+        raise CVUploadError("El archivo subido no cumple tamaño o tipo")
+    if not read_cv_prefix(key, len(PDF_MAGIC)).startswith(PDF_MAGIC):
+        delete_cv_key(key)
+        raise CVUploadError("El CV debe ser un PDF")
+
+    _uploads.mark_uploaded(row, size_bytes=head["size"], etag=head["etag"])
+    db.session.commit()
+    logger.info("CV subido directo a S3 key=%s size=%s", key, head["size"])
+    enqueue_preprocess(row)
+    return row
+
+
+class CVStreamReader:
+    """
+    Envoltorio de solo lectura sobre el cuerpo de la petición: cuenta bytes,
+    calcula el SHA-256 y valida la firma %PDF en los primeros bytes.
+    Sin `seek`: boto3 lo trata como stream y lee parte por parte.
+    """
+
+    def __init__(self, raw, *, max_bytes: int = CV_MAX_BYTES):
+        self._raw = raw
+        self._max_bytes = max_bytes
+        self._sha = hashlib.sha256()
+        self._head = b""
+        self.size = 0
+
+    def _read_full(self, size: int) -> bytes:
+        """`size` bytes o hasta EOF: s3transfer toma cada `read` como una parte entera (mín. 5MB)."""
+        if size is None or size < 0:
+            return self._raw.read()
+        parts = []
+        missing = size
+        while missing > 0:
+            part = self._raw.read(missing)
+            if not part:
+                break
+            parts.append(part)
+            missing -= len(part)
+        return b"".join(parts)
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._read_full(size)
+        if not chunk:
+            if self.size < len(PDF_MAGIC):
+                raise CVUploadError("El CV debe ser un PDF")
+            return b""
+        self.size += len(chunk)
+        if self.size > self._max_bytes:
+            raise CVUploadError(f"El CV no debe superar {self._max_bytes // (1024 * 1024)}MB", 413)
+        if len(self._head) < len(PDF_MAGIC):
+            self._head += chunk[:len(PDF_MAGIC) - len(self._head)]
+            if not PDF_MAGIC.startswith(self._head[:len(PDF_MAGIC)]):
+                raise CVUploadError("El CV debe ser un PDF")
+        self._sha.update(chunk)
+        return chunk
+
+    @property
+    def sha256(self) -> str:
+        return self._sha.hexdigest()
+
+
+def stream_cv_upload(raw, *, applicant_id: int, vacancy_id: int | None, filename: str | None,
+                     content_length: int | None = None) -> CVUpload:
+    """Sube a S3 el CV que llega en `raw` sin bufferizarlo entero y registra la subida."""
+    name = _pdf_filename(filename)
+    if content_length is not None and content_length > CV_MAX_BYTES:
+        raise CVUploadError(f"El CV no debe superar {CV_MAX_BYTES // (1024 * 1024)}MB", 413)
+
+    key = s3_key_for_cv(vacancy_id or 0, applicant_id, name)
+    content_type = mimetypes.guess_type(name)[0] or PDF_CONTENT_TYPE
+    reader = CVStreamReader(raw)
+    upload_cv_fileobj(reader, key, content_type)
+
+    row = _uploads.add(key=key, applicant_id=applicant_id, vacancy_id=vacancy_id or None, filename=name,
+                       content_type=content_type, status="uploaded", size_bytes=reader.size,
+                       sha256=reader.sha256)
+    db.session.commit()
+    logger.info("CV subido por streaming key=%s size=%s", key, reader.size)
+    enqueue_preprocess(row)
+    return row
+
+
+def upload_payload(row: CVUpload) -> dict:
+    return {"key": row.key, "url": public_url_from_key(row.key), "size": row.size_bytes}
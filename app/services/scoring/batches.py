@@ -0,0 +1,124 @@
+# app/services/scoring/batches.py
+"""
+Re-scoring por lotes: encola un job por postulación de una vacante (o un
+subconjunto) bajo un `ScoringBatch` con concurrencia acotada. Los workers
+reutilizan el texto y el CV_JSON cacheados, así que un re-scoring solo repite
+la llamada de comparación contra la vacante actualizada.
+"""
+from datetime import datetime
+
+from flask import current_app
+
+from app.ext.db import db
+from app.models.admin.vacancy import Vacancy
+from app.models.scoring_batch import ScoringBatch
+from app.models.scoring_job import ScoringJob
+from app.models.web_portal.postulation import Postulation
+from app.repositories.scoring_job_repo import ScoringJobRepository
+from .payloads import build_scoring_payload
+
+_jobs = ScoringJobRepository()
+
+
+def enqueue_rescore(
+    vac: Vacancy,
+    *,
+    postulation_ids: list[int] | None = None,
+    statuses: list[str] | None = None,
+    max_concurrency: int | None = None,
+    created_by: str | None = None,
+) -> ScoringBatch:
+    """
+    Crea el lote y sus jobs en una sola transacción. Se omiten (y se cuentan en
+    `skipped`) las postulaciones con un job en curso o listo para reclamarse.
+    Un job diferido (run_after futuro: prescreen, circuito abierto, backoff) no
+    cuenta como ocupado: el lote lo adopta con el payload nuevo y lo adelanta.
+    """
+    cfg = current_app.config
+    q = Postulation.query.filter(Postulation.vacancy_id == vac.id)
+    if postulation_ids:
+        q = q.filter(Postulation.id.in_(postulation_ids))
+    if statuses:
+        q = q.filter(Postulation.status.in_(statuses))
+    posts = q.order_by(Postulation.id.asc()).all()
+
+    now = datetime.utcnow()
+    pending = ScoringJob.query.filter(
+        ScoringJob.postulation_id.in_([p.id for p in posts]),
+        ScoringJob.kind == "score",
+        ScoringJob.status.in_(("queued", "running")),
+    ).all() if posts else []
+    busy = {j.postulation_id for j in pending if j.status == "running" or j.run_after <= now}
+    deferred = {j.postulation_id: j for j in pending if j.postulation_id not in busy}
+
+    batch = ScoringBatch(
+        vacancy_id=vac.id,
+        kind="rescore",
+        filters={"postulation_ids": postulation_ids or None, "statuses": statuses or None},
+        max_concurrency=max(int(max_concurrency or cfg.get("SCORING_BATCH_CONCURRENCY", 4)), 1),
+        created_by=created_by,
+    )
+    db.session.add(batch)
+    db.session.flush()
+
+    max_attempts = int(cfg.get("SCORING_MAX_ATTEMPTS", 3))
+    total = 0
+    for post in posts:
+        if post.id in busy:
+            continue
+        payload = build_scoring_payload(post, vac, presign=False)
+        job = deferred.get(post.id)
+        if job is not None:
+            # Un solo job por postulación: el diferido pasa al lote con el payload vigente
+            job.payload = payload
+            job.vacancy_id = vac.id
+            job.batch_id = batch.id
+            job.run_after = now
+            job.attempts = 0
+            job.max_attempts = max_attempts
+            job.last_error = None
+        else:
+            _jobs.enqueue(
+                postulation_id=post.id,
+                vacancy_id=vac.id,
+                payload=payload,
+                max_attempts=max_attempts,
+                batch_id=batch.id,
+            )
+        total += 1
+    batch.total = total
+    batch.skipped = len(busy)
+    db.session.commit()
+    return batch
+
+
+def batch_progress(batch: ScoringBatch) -> dict:
+    """
+    Conteos por estado + ETA según el ritmo observado desde la creación del lote.
+    No usa ScoringJob.started_at: cada reintento lo pisa y el ritmo parecería mejor.
+    """
+    counts = _jobs.count_by_status(batch_id=batch.id)
+    done = counts.get("succeeded", 0) + counts.get("failed", 0)
+    remaining = max(batch.total - done, 0)
+
+    now = datetime.utcnow()
+    elapsed = max((now - batch.created_at).total_seconds(), 0.0) if batch.created_at else 0.0
+    eta = round(remaining * elapsed / done, 1) if done and remaining else (0.0 if not remaining else None)
+
+    return {
+        "id": batch.id,
+        "vacancy_id": batch.vacancy_id,
+        "kind": batch.kind,
+        "max_concurrency": batch.max_concurrency,
+        "total": batch.total,
+        "skipped": batch.skipped,
+        "queued": counts.get("queued", 0),
+        "running": counts.get("running", 0),
+        "succeeded": counts.get("succeeded", 0),
+        "failed": counts.get("failed", 0),
+        "progress": round(done / batch.total, 4) if batch.total else 1.0,
+        "elapsed_sec": round(elapsed, 1),
+        "eta_sec": eta,
+        "finished": remaining == 0,
+        "created_at": batch.created_at,
+    }
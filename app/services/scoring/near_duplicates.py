@@ -0,0 +1,232 @@
+# app/services/scoring/near_duplicates.py
+"""
+Detección de CVs casi idénticos entre postulantes (MinHash + LSH).
+
+Al extraer el texto, cada CV se reduce a shingles de SHINGLE_WORDS palabras y a
+una firma MinHash de NUM_PERM valores; la firma se parte en BANDS bandas de ROWS
+filas y cada banda se indexa como bucket en `cv_lsh_buckets`. Dos textos con
+Jaccard s comparten alguna banda con probabilidad 1-(1-s^ROWS)^BANDS (~0.7 de
+umbral efectivo con 16x8), así que una búsqueda lee solo los buckets propios y
+compara pocas firmas: el costo no crece con el tamaño del corpus.
+
+Usos: "CVs similares" por postulación, clusters de duplicados por vacante y
+reutilizar el CV_JSON de un texto casi exacto en lugar de llamar al parser.
+"""
+import copy
+import hashlib
+import logging
+import re
+import unicodedata
+import zlib
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.ext.ai_scorer import _normalize_cv_text, cv_text_fingerprint
+from app.ext.cv_heuristics import extract_local
+from app.models.cv_parse_memo import CVParseMemo
+from app.repositories.cv_similarity_repo import CVSimilarityRepository
+
+logger = logging.getLogger(__name__)
+
+NUM_PERM = 128
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_WORDS = 5
+
+_MERSENNE = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+_rng = np.random.RandomState(1)
+# Permutaciones fijas: cambiarlas invalida todas las firmas guardadas
+_PERM_A = _rng.randint(1, np.iinfo(np.int64).max, size=NUM_PERM, dtype=np.int64).astype(np.uint64)
+_PERM_B = _rng.randint(0, np.iinfo(np.int64).max, size=NUM_PERM, dtype=np.int64).astype(np.uint64)
+
+_WORD_RE = re.compile(r"\w+")
+
+_repo = CVSimilarityRepository()
+
+
+@dataclass(frozen=True)
+class Similar:
+    text_sha256: str
+    similarity: float
+
+
+def _words(text: str) -> list[str]:
+    folded = unicodedata.normalize("NFKD", (text or "").lower())
+    folded = "".join(ch for ch in folded if not unicodedata.combining(ch))
+    return _WORD_RE.findall(folded)
+
+
+def shingles(text: str) -> set[int]:
+    """Hashes (crc32) de los n-gramas de SHINGLE_WORDS palabras; textos cortos = 1 shingle."""
+    words = _words(text)
+    if not words:
+        return set()
+    n = min(SHINGLE_WORDS, len(words))
+    return {zlib.crc32(" ".join(words[i:i + n]).encode("utf-8")) for i in range(len(words) - n + 1)}
+
+
+def signature(text: str) -> tuple[np.ndarray, int] | None:
+    """Firma MinHash (uint32[NUM_PERM]) y cantidad de shingles; None si no hay palabras."""
+    sh = shingles(text)
+    if not sh:
+        return None
+    hv = np.fromiter(sh, dtype=np.uint64, count=len(sh))
+    # Overflow de uint64 intencional (mismo esquema que datasketch); es determinista
+    with np.errstate(over="ignore"):
+        phv = ((_PERM_A[:, None] * hv[None, :] + _PERM_B[:, None]) % _MERSENNE) & _MAX_HASH
+    return phv.min(axis=1).astype(np.uint32), len(sh)
+
+
+def band_buckets(sig: np.ndarray) -> list[str]:
+    return [
+        hashlib.blake2b(sig[b * ROWS:(b + 1) * ROWS].tobytes(), digest_size=8).hexdigest()
+        for b in range(BANDS)
+    ]
+
+
+def _from_bytes(raw: bytes) -> np.ndarray:
+    return np.frombuffer(raw, dtype=np.uint32)
+
+
+def estimate_jaccard(a: np.ndarray, b: np.ndarray) -> float:
+    return float(np.count_nonzero(a == b)) / NUM_PERM
+
+
+# ---------- indexado ----------
+def index_cv_text(text: str, *, postulation_id=None, vacancy_id=None, applicant_id=None) -> str | None:
+    """
+    Indexa el texto (una sola vez por texto distinto) y lo vincula a la postulación.
+    Devuelve la huella del texto (cv_text_fingerprint) o None si no tiene palabras.
+    """
+    text_sha = cv_text_fingerprint(text)
+    if not _repo.has_signature(text_sha):
+        signed = signature(_normalize_cv_text(text))
+        if signed is None:
+            return None
+        sig, count = signed
+        _repo.put_signature(text_sha256=text_sha, signature=sig.tobytes(), shingle_count=count,
+                            buckets=band_buckets(sig))
+    if postulation_id:
+        _repo.link_postulation(postulation_id=postulation_id, vacancy_id=vacancy_id,
+                               applicant_id=applicant_id, text_sha256=text_sha)
+    return text_sha
+
+
+# ---------- consultas ----------
+def similar_texts(text_sha: str, *, threshold: float) -> list[Similar]:
+    """Textos con Jaccard estimado >= threshold (sin incluir el propio), de mayor a menor."""
+    own = _repo.signatures([text_sha]).get(text_sha)
+    if own is None:
+        return []
+    sig = _from_bytes(own)
+    candidates = _repo.candidates(band_buckets(sig), exclude=text_sha)
+    out = []
+    for sha, raw in _repo.signatures(candidates).items():
+        sim = estimate_jaccard(sig, _from_bytes(raw))
+        if sim >= threshold:
+            out.append(Similar(sha, sim))
+    return sorted(out, key=lambda s: (-s.similarity, s.text_sha256))
+
+
+def similar_postulations(postulation_id: int, *, threshold: float, limit: int) -> list[dict] | None:
+    """Otras postulaciones con CV igual o casi igual; None si la postulación no está indexada."""
+    link = _repo.text_of(postulation_id)
+    if link is None:
+        return None
+    sims = {link.text_sha256: 1.0}
+    sims.update({s.text_sha256: s.similarity for s in similar_texts(link.text_sha256, threshold=threshold)})
+    rows = [r for r in _repo.postulations_with(sims) if r.postulation_id != postulation_id]
+    rows.sort(key=lambda r: (-sims[r.text_sha256], r.postulation_id))
+    return [
+        {
+            "postulation_id": r.postulation_id,
+            "vacancy_id": r.vacancy_id,
+            "applicant_id": r.applicant_id,
+            "similarity": round(sims[r.text_sha256], 3),
+            "exact": r.text_sha256 == link.text_sha256,
+        }
+        for r in rows[:limit]
+    ]
+
+
+def duplicate_clusters(vacancy_id: int, *, threshold: float) -> list[dict]:
+    """
+    Grupos de postulaciones de la vacante con CVs iguales o casi iguales.
+    Dos consultas (buckets y firmas de los textos de la vacante) + union-find en memoria.
+    """
+    links = _repo.postulations_of_vacancy(vacancy_id)
+    shas = {r.text_sha256 for r in links}
+    parent = {sha: sha for sha in shas}
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    buckets: dict[tuple[int, str], list[str]] = {}
+    for band, bucket, sha in _repo.buckets_for(shas):
+        buckets.setdefault((band, bucket), []).append(sha)
+    sigs = {sha: _from_bytes(raw) for sha, raw in _repo.signatures(shas).items()}
+    min_sim: dict[tuple[str, str], float] = {}
+    for members in buckets.values():
+        for i, a in enumerate(members):
+            for b in members[i + 1:]:
+                pair = (a, b) if a < b else (b, a)
+                if pair in min_sim or a not in sigs or b not in sigs:
+                    continue
+                sim = estimate_jaccard(sigs[a], sigs[b])
+                min_sim[pair] = sim
+                if sim >= threshold:
+                    parent[find(a)] = find(b)
+
+    groups: dict[str, list] = {}
+    for r in links:
+        groups.setdefault(find(r.text_sha256), []).append(r)
+    clusters = []
+    for members in groups.values():
+        if len(members) < 2:
+            continue
+        texts = {r.text_sha256 for r in members}
+        sims = [s for (a, b), s in min_sim.items() if a in texts and b in texts and s >= threshold]
+        clusters.append({
+            "size": len(members),
+            "distinct_texts": len(texts),
+            "min_similarity": round(min(sims), 3) if sims else 1.0,
+            "postulation_ids": sorted(r.postulation_id for r in members),
+            "applicant_ids": sorted({r.applicant_id for r in members if r.applicant_id is not None}),
+        })
+    return sorted(clusters, key=lambda c: (-c["size"], c["postulation_ids"][0]))
+
+
+def reuse_parse(text: str, text_sha: str, *, model: str, prompt_version: str, threshold: float) -> dict | None:
+    """
+    CV_JSON de un texto casi exacto (Jaccard >= threshold) ya parseado con el mismo
+    modelo/prompt. La identidad y los links del donante se vacían: en CVs plantilla
+    es justo lo que cambia. Email/teléfono/links se recalculan del texto propio;
+    nombre y ubicación quedan en null.
+    """
+    near = similar_texts(text_sha, threshold=threshold)
+    if not near:
+        return None
+    by_sha = {s.text_sha256: s for s in near}
+    memos = CVParseMemo.query.filter(
+        CVParseMemo.text_sha256.in_(list(by_sha)),
+        CVParseMemo.model == model,
+        CVParseMemo.prompt_version == prompt_version,
+    ).all()
+    if not memos:
+        return None
+    best = max(memos, key=lambda m: by_sha[m.text_sha256].similarity)
+    cv_json = copy.deepcopy(best.cv_json)
+    if "_raw" in cv_json:
+        return None
+    # merge_into conserva lo que ya trae el JSON si el texto propio no lo tiene
+    cv_json["identidad"] = dict.fromkeys(("nombre", "email", "telefono", "ubicacion"))
+    cv_json["links"] = dict.fromkeys(("linkedin", "github"))
+    cv_json = extract_local(_normalize_cv_text(text)).merge_into(cv_json)
+    logger.info("[AI] CV_JSON reutilizado de texto casi idéntico sha=%s sim=%.2f",
+                best.text_sha256[:12], by_sha[best.text_sha256].similarity)
+    return cv_json
@@ -0,0 +1,61 @@
+# app/services/scoring/payloads.py
+"""
+Construcción del payload de scoring de una postulación.
+Lo usan la creación de postulaciones (web) y el re-scoring por lotes (admin/CLI).
+"""
+import os
+import datetime as _dt
+from decimal import Decimal
+
+from app.ext.s3 import extract_key_from_cv_path, make_presigned_url
+from app.models.admin.vacancy import Vacancy
+from app.models.web_portal.postulation import Postulation
+from .vacancy_prompt import vacancy_prompts
+
+
+def to_jsonable(x):
+    if isinstance(x, Decimal):
+        return int(x) if x == int(x) else float(x)
+    if isinstance(x, (_dt.datetime, _dt.date)):
+        return x.isoformat()
+    if isinstance(x, dict):
+        return {k: to_jsonable(v) for k, v in x.items()}
+    if isinstance(x, (list, tuple, set)):
+        return [to_jsonable(v) for v in x]
+    return x
+
+
+def cv_source(cv_key: str, *, presign: bool = True) -> dict:
+    """
+    URL firmada (20 min) para el scoring inmediato; referencia S3 directa para
+    jobs que pueden correr más tarde (lotes), donde la URL ya habría vencido.
+    La clave va siempre: con ella el pipeline usa el texto pre-procesado al subir.
+    """
+    if presign:
+        try:
+            return {"storage": "url", "presigned_url": make_presigned_url(cv_key, expires_seconds=1200),
+                    "s3_key": cv_key}
+        except Exception:
+            pass
+    return {"storage": "s3", "s3_bucket": os.getenv("AWS_BUCKET"), "s3_key": cv_key}
+
+
+def build_scoring_payload(post: Postulation, vac: Vacancy, *, presign: bool = True) -> dict:
+    applicant_profile = {
+        "residence_addr": post.residence_addr,
+        "age": post.age,
+        "role_exp_years": post.role_exp_years,
+        "expected_salary": post.expected_salary,
+        "name": None, "email": None, "phone": post.number, "credential": post.credential,
+    }
+    vacancy_profile = vacancy_prompts.for_vacancy(vac).profile
+    return to_jsonable({
+        "postulation_id": post.id,
+        "vacancy_id": post.vacancy_id,
+        "applicant_id": post.applicant_id,
+        "position": vacancy_profile["charge_title"] or getattr(vac, "title", None),
+        # cv_path puede ser la clave o una URL pública (postulaciones antiguas)
+        "cv": cv_source(extract_key_from_cv_path(post.cv_path), presign=presign),
+        "applicant_profile": applicant_profile,
+        "vacancy_profile": vacancy_profile,
+    })
@@ -0,0 +1,690 @@
+# app/services/scoring/pipeline.py
+"""
+Pipeline de scoring IA (fuera de banda respecto a la petición HTTP).
+Lo ejecuta `flask scoring-worker` (ver app/services/scoring/worker.py)
+o, de forma bloqueante, `trigger_scoring_sync`.
+"""
+import io
+import json
+import os
+import copy
+import time
+import hashlib
+import logging
+import threading
+import requests
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from flask import current_app
+
+from app.ext.db import db
+from app.ext.llm_circuit_breaker import CircuitOpenError
+from app.ext.pdf_reader import extract_pdf, EXTRACTOR_VERSION
+from app.ext.result_hub import result_hub
+from app.ext.s3 import s3_client
+from app.ext.ai_scorer import (
+    AI_MODEL,
+    CV_PARSER_PROMPT_VERSION,
+    cv_text_fingerprint,
+    pop_call_stats,
+    summarize_cv_to_json,
+    score_candidate_v3,
+    score_candidate_v3_multi,
+    score_candidate_v2,
+    score_candidate,
+)
+from app.models.postulation_ai_result import PostulationAIResult
+from app.models.admin.skill import Skill
+from app.models.admin.vacancy_skills import VacancySkill
+from app.repositories.ai_result_repo import AIResultRepository
+from app.repositories.cv_artifact_repo import CVArtifactRepository
+from app.repositories.cv_upload_repo import CVUploadRepository
+from app.repositories.scoring_job_repo import ScoringJobRepository
+from app.repositories.scoring_metrics_repo import ScoringMetricsRepository
+from . import near_duplicates
+from .skill_matcher import record_skill_evidence
+from .prescreen import requirement_terms, prescreen_coverage
+from .vacancy_prompt import vacancy_prompts
+
+logger = logging.getLogger(__name__)
+
+_artifacts = CVArtifactRepository()
+_uploads = CVUploadRepository()
+_jobs = ScoringJobRepository()
+_results = AIResultRepository()
+_metrics = ScoringMetricsRepository()
+
+# Se guarda en cada resultado: qué extractor/prompt/modelo lo produjo
+PIPELINE_VERSION = f"{EXTRACTOR_VERSION}/{CV_PARSER_PROMPT_VERSION}/{AI_MODEL}"[:128]
+
+MAX_CV_BYTES = 25 * 1024 * 1024
+_CHUNK_BYTES = 256 * 1024
+
+_stage_log = threading.local()
+
+# Etapas que llaman al LLM: sus llamadas (tokens, reintentos) se atribuyen a la etapa
+_LLM_STAGES = ("summarize", "score")
+
+
+def _reset_run() -> None:
+    _stage_log.timings = {}
+    _stage_log.counters = {}
+    pop_call_stats()
+
+
+def _record_stage(name: str, seconds: float) -> None:
+    timings = getattr(_stage_log, "timings", None)
+    if timings is None:
+        timings = _stage_log.timings = {}
+    timings[name] = round(timings.get(name, 0.0) + seconds, 4)
+
+
+def _count(name: str, value) -> None:
+    counters = getattr(_stage_log, "counters", None)
+    if counters is None:
+        counters = _stage_log.counters = {}
+    counters[name] = counters.get(name, 0) + value
+
+
+def _attribute_llm_calls(stage: str) -> None:
+    for call in pop_call_stats():
+        _count(f"{stage}_prompt_tokens", call.get("prompt_tokens") or 0)
+        _count(f"{stage}_completion_tokens", call.get("completion_tokens") or 0)
+        _count("llm_calls", 1)
+        _count("llm_retries", max((call.get("attempts") or 1) - 1, 0))
+        _count("rate_wait_ms", call.get("rate_wait_ms") or 0)
+
+
+@contextmanager
+def _stage(name: str):
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        _record_stage(name, time.monotonic() - started)
+        if name in _LLM_STAGES:
+            _attribute_llm_calls(name)
+
+
+def pop_stage_timings() -> dict:
+    """
+    Devuelve y limpia los segundos por etapa del último payload procesado en ESTE hilo:
+    fetch, extract (incluye OCR), ocr, prescreen, summarize, score, persist, total.
+    """
+    timings = getattr(_stage_log, "timings", None) or {}
+    _stage_log.timings = {}
+    return timings
+
+
+def pop_run_counters() -> dict:
+    """Contadores del último payload de ESTE hilo (tokens, reintentos, páginas OCR, cache hits)."""
+    counters = getattr(_stage_log, "counters", None) or {}
+    _stage_log.counters = {}
+    return counters
+
+
+def _ms(seconds) -> int | None:
+    return None if seconds is None else int(round(seconds * 1000))
+
+
+def _save_run_metrics(data: dict, status: str, error: str | None) -> None:
+    """Persiste la fila de métricas de la ejecución; nunca rompe el pipeline."""
+    timings = dict(getattr(_stage_log, "timings", None) or {})
+    counters = dict(getattr(_stage_log, "counters", None) or {})
+    cfg = current_app.config
+    prompt = counters.get("summarize_prompt_tokens", 0) + counters.get("score_prompt_tokens", 0)
+    completion = counters.get("summarize_completion_tokens", 0) + counters.get("score_completion_tokens", 0)
+    cost = (prompt * float(cfg.get("AI_PRICE_INPUT_PER_MTOK", 0))
+            + completion * float(cfg.get("AI_PRICE_OUTPUT_PER_MTOK", 0))) / 1_000_000
+    job = data.get("_job") or {}
+    try:
+        if error is not None:
+            db.session.rollback()
+        _metrics.add(
+            postulation_id=data.get("postulation_id"),
+            vacancy_id=data.get("vacancy_id"),
+            job_id=job.get("job_id"),
+            attempt=job.get("attempts"),
+            status=status,
+            error=(error or None) and error[:255],
+            **{f"{name}_ms": _ms(timings.get(name)) for name in
+               ("fetch", "extract", "ocr", "prescreen", "summarize", "score", "persist")},
+            total_ms=_ms(timings.get("total", 0.0)),
+            page_count=counters.get("page_count"),
+            ocr_pages=counters.get("ocr_pages", 0),
+            text_cache_hit=bool(counters.get("text_cache_hit")),
+            parse_cache_hit=bool(counters.get("parse_cache_hit")),
+            summarize_prompt_tokens=counters.get("summarize_prompt_tokens", 0),
+            summarize_completion_tokens=counters.get("summarize_completion_tokens", 0),
+            score_prompt_tokens=counters.get("score_prompt_tokens", 0),
+            score_completion_tokens=counters.get("score_completion_tokens", 0),
+            llm_calls=counters.get("llm_calls", 0),
+            llm_retries=counters.get("llm_retries", 0),
+            rate_wait_ms=counters.get("rate_wait_ms", 0),
+            cost_usd=round(cost, 6),
+            model=AI_MODEL,
+            pipeline_version=PIPELINE_VERSION,
+        )
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        logger.exception("[AI] no se pudieron guardar las métricas postulation_id=%s", data.get("postulation_id"))
+
+
+def process_payload(data: dict) -> dict:
+    """
+    Ejecuta el pipeline (ver `_run_pipeline`) y persiste una fila de
+    `scoring_run_metrics` por ejecución, también cuando falla.
+    """
+    _reset_run()
+    started = time.monotonic()
+    outcome = None
+    try:
+        outcome = _run_pipeline(data)
+        return outcome
+    except Exception as e:
+        outcome = e
+        raise
+    finally:
+        _finish_run(data, started, outcome)
+
+
+def _take_run() -> tuple[dict, dict]:
+    """Saca (timings, counters) del hilo para retomarlos luego con `_restore_run`."""
+    return pop_stage_timings(), pop_run_counters()
+
+
+def _restore_run(run: tuple[dict, dict]) -> None:
+    _stage_log.timings, _stage_log.counters = dict(run[0]), dict(run[1])
+
+
+def _finish_run(data: dict, started: float, outcome) -> None:
+    """Cierra la ejecución en curso del hilo: total + fila de scoring_run_metrics."""
+    if isinstance(outcome, CircuitOpenError):
+        status, error = "parked", f"{type(outcome).__name__}: {outcome}"
+    elif isinstance(outcome, BaseException) or outcome is None:
+        status, error = "failed", f"{type(outcome).__name__}: {outcome}"
+    else:
+        status, error = ("provisional" if outcome.get("provisional") else "succeeded"), None
+    _record_stage("total", time.monotonic() - started)
+    _save_run_metrics(data, status, error)
+
+
+def _run_pipeline(data: dict) -> dict:
+    """
+    Orquesta:
+      1) Descarga/lee el CV y extrae texto.
+      2) Pin-Pon: resume a JSON estructurado SOLO con evidencia del CV.
+      3) Scoring v3 usando applicant_profile + vacancy_profile + CV_JSON.
+      4) Fallbacks: v2 (si faltan perfiles) o legacy (si hay 'position' + lists).
+      5) Persiste PostulationAIResult.
+    Propaga las excepciones: quien llama decide si reintentar o registrar el error.
+    El worker agrega `_job` (job_id, attempts, started_at) para trazar el resultado.
+    """
+    postulation_id = data.get("postulation_id")
+    vacancy_id = data.get("vacancy_id")
+    logger.info("[AI] procesando postulation_id=%s vacancy_id=%s", postulation_id, vacancy_id)
+
+    cv = data.get("cv") or {}
+
+    # 1) Extraer texto CV
+    text = fetch_cv_text(cv)
+    logger.info("[AI] CV extraído len=%s postulation_id=%s", len(text or ""), postulation_id)
+    _index_text(data, text)
+    _record_skill_evidence(data, text)
+
+    # 1b) Pre-filtro local: CVs sin cobertura de requisitos no pasan por el LLM
+    with _stage("prescreen"):
+        provisional = prescreen(data, text)
+    if provisional is not None:
+        return provisional
+    return _score_and_persist(data, text)
+
+
+def _score_and_persist(data: dict, text: str) -> dict:
+    """Pasos 2-4 del pipeline sobre el texto ya extraído y pre-filtrado."""
+    postulation_id = data.get("postulation_id")
+    vacancy_id = data.get("vacancy_id")
+
+    # 2) Paso Pin-Pon 1: Resumen estructurado (solo evidencia del PDF)
+    with _stage("summarize"):
+        cv_json = summarize_cv_cached(text)
+    logger.info("[AI] CV JSON listo (keys=%s) postulation_id=%s", list(cv_json.keys()), postulation_id)
+
+    # 3) Elegir scoring según disponibilidad de perfiles
+    with _stage("score"):
+        applicant_profile = data.get("applicant_profile")
+        vacancy_profile   = data.get("vacancy_profile")
+
+        if isinstance(applicant_profile, dict) and isinstance(vacancy_profile, dict):
+            # v3 (Pin-Pon): usa JSON del CV como fuente de verdad; fragmento de vacante precalculado
+            vp = vacancy_prompts.get(vacancy_id) if vacancy_id else None
+            if vp is not None:
+                result = score_candidate_v3(applicant_profile, vp.profile, cv_json, vacancy_block=vp.fragment)
+            else:
+                result = score_candidate_v3(applicant_profile, vacancy_profile, cv_json)
+            logger.info("[AI] v3 OK postulation_id=%s score=%s vacancy_prompt=%s",
+                        postulation_id, result.get("score"), vp.fingerprint if vp else None)
+        elif isinstance(applicant_profile, dict) or isinstance(vacancy_profile, dict):
+            # Si solo hay un perfil, v2 con texto crudo (mantener compatibilidad)
+            result = score_candidate_v2(applicant_profile or {}, vacancy_profile or {}, text)
+            logger.info("[AI] v2 (perfil incompleto) OK postulation_id=%s score=%s", postulation_id, result.get("score"))
+        else:
+            # Legacy: posición + skills si existen; de lo contrario, v2 con texto crudo
+            position         = data.get("position")
+            required_skills  = data.get("required_skills", [])
+            nice_to_haves    = data.get("nice_to_haves", [])
+            min_years        = data.get("min_years_experience", 0)
+            applicant_legacy = data.get("applicant", {})
+
+            if position:
+                result = score_candidate(position, required_skills, nice_to_haves, min_years, applicant_legacy, text)
+                logger.info("[AI] legacy OK postulation_id=%s score=%s", postulation_id, result.get("score"))
+            else:
+                result = score_candidate_v2({}, {}, text)
+                logger.info("[AI] v2 (sin perfiles) OK postulation_id=%s score=%s", postulation_id, result.get("score"))
+
+    # 4) Persistir resultado
+    with _stage("persist"):
+        row = save_result(postulation_id, vacancy_id, result.get("score"), result.get("feedback"), job=data.get("_job"))
+    logger.info("[AI] guardado OK postulation_id=%s id=%s", postulation_id, row.id)
+    return result
+
+
+def _index_text(data: dict, text: str) -> None:
+    """Indexa el texto en MinHash/LSH (CVs casi idénticos). Un fallo no frena el scoring."""
+    try:
+        near_duplicates.index_cv_text(
+            text,
+            postulation_id=data.get("postulation_id"),
+            vacancy_id=data.get("vacancy_id"),
+            applicant_id=data.get("applicant_id"),
+        )
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        logger.warning("[AI] no se pudo indexar el CV postulation_id=%s", data.get("postulation_id"), exc_info=True)
+
+
+def _record_skill_evidence(data: dict, text: str) -> None:
+    """Skills del catálogo encontradas en el CV (autómata local, sin LLM). Un fallo no frena el scoring."""
+    postulation_id = data.get("postulation_id")
+    if not postulation_id:
+        return
+    try:
+        found = record_skill_evidence(
+            text,
+            postulation_id=postulation_id,
+            vacancy_id=data.get("vacancy_id"),
+            text_sha256=cv_text_fingerprint(text),
+        )
+        db.session.commit()
+        if found is not None:
+            logger.info("[AI] evidencia de skills postulation_id=%s skills=%s", postulation_id, found)
+    except Exception:
+        db.session.rollback()
+        logger.warning("[AI] no se pudo registrar evidencia de skills postulation_id=%s", postulation_id, exc_info=True)
+
+
+def _is_v3(data: dict) -> bool:
+    return isinstance(data.get("applicant_profile"), dict) and isinstance(data.get("vacancy_profile"), dict)
+
+
+def process_payload_group(payloads: list[dict]) -> list:
+    """
+    Puntúa varias postulaciones pendientes del mismo postulante. Las que comparten
+    texto de CV (mismo hash) y perfil de postulante se evalúan con UN solo CV_JSON
+    y UNA llamada multi-vacante (score_candidate_v3_multi); el resultado se reparte
+    en un PostulationAIResult por postulación. El resto sigue `process_payload`.
+    No propaga: devuelve, en orden, el resultado o la excepción de cada payload.
+    """
+    outcomes: list = [None] * len(payloads)
+    runs: dict[int, tuple[float, tuple[dict, dict]]] = {}
+    groups: dict[tuple, list[tuple[int, dict, str]]] = {}
+
+    for i, data in enumerate(payloads):
+        if not _is_v3(data):
+            try:
+                outcomes[i] = process_payload(data)
+            except Exception as e:
+                outcomes[i] = e
+            continue
+        _reset_run()
+        started = time.monotonic()
+        try:
+            text = fetch_cv_text(data.get("cv") or {})
+            _index_text(data, text)
+            _record_skill_evidence(data, text)
+            with _stage("prescreen"):
+                provisional = prescreen(data, text)
+        except Exception as e:
+            outcomes[i] = e
+            _finish_run(data, started, e)
+            continue
+        if provisional is not None:
+            outcomes[i] = provisional
+            _finish_run(data, started, provisional)
+            continue
+        runs[i] = (started, _take_run())
+        key = (cv_text_fingerprint(text), json.dumps(data["applicant_profile"], sort_keys=True, default=str))
+        groups.setdefault(key, []).append((i, data, text))
+
+    for members in groups.values():
+        if len(members) == 1:
+            i, data, text = members[0]
+            started, run = runs[i]
+            _restore_run(run)
+            try:
+                outcomes[i] = _score_and_persist(data, text)
+            except Exception as e:
+                outcomes[i] = e
+            _finish_run(data, started, outcomes[i])
+        else:
+            _score_group(members, runs, outcomes)
+    return outcomes
+
+
+def _score_group(members: list[tuple[int, dict, str]], runs: dict, outcomes: list) -> None:
+    """Un CV_JSON + una llamada para N vacantes; tokens y llamadas se atribuyen al primer miembro."""
+    lead_i, lead, text = members[0]
+    _restore_run(runs[lead_i][1])
+    prompts = {}
+    try:
+        with _stage("summarize"):
+            cv_json = summarize_cv_cached(text)
+        targets = []
+        for _, data, _ in members:
+            vacancy_id = data.get("vacancy_id")
+            vp = vacancy_prompts.get(vacancy_id) if vacancy_id else None
+            prompts[data["postulation_id"]] = vp
+            targets.append({
+                "key": str(data["postulation_id"]),
+                "vacancy_profile": vp.profile if vp else data["vacancy_profile"],
+                "vacancy_block": vp.fragment if vp else None,
+            })
+        with _stage("score"):
+            scored = score_candidate_v3_multi(lead["applicant_profile"], targets, cv_json)
+        logger.info("[AI] v3 multi OK applicant_id=%s postulaciones=%s", lead.get("applicant_id"),
+                    [d["postulation_id"] for _, d, _ in members])
+    except Exception as e:
+        for i, data, _ in members:
+            _restore_run(runs[i][1] if i != lead_i else _take_run())
+            outcomes[i] = e
+            _finish_run(data, runs[i][0], e)
+        return
+
+    shared_timings, shared_counters = _take_run()
+    llm_timings = {k: v for k, v in shared_timings.items() if k in _LLM_STAGES}
+    for i, data, _ in members:
+        timings, counters = (shared_timings, shared_counters) if i == lead_i else runs[i][1]
+        _restore_run(({**timings, **llm_timings}, counters))
+        postulation_id, vacancy_id = data["postulation_id"], data.get("vacancy_id")
+        try:
+            result = scored.get(str(postulation_id))
+            if result is None:
+                # La respuesta omitió esta vacante: evaluación individual con el mismo CV_JSON
+                vp = prompts.get(postulation_id)
+                with _stage("score"):
+                    if vp is not None:
+                        result = score_candidate_v3(data["applicant_profile"], vp.profile, cv_json,
+                                                    vacancy_block=vp.fragment)
+                    else:
+                        result = score_candidate_v3(data["applicant_profile"], data["vacancy_profile"], cv_json)
+            with _stage("persist"):
+                save_result(postulation_id, vacancy_id, result.get("score"), result.get("feedback"),
+                            job=data.get("_job"))
+            outcomes[i] = result
+        except Exception as e:
+            outcomes[i] = e
+        _finish_run(data, runs[i][0], outcomes[i])
+
+
+def _vacancy_skill_names(vacancy_id) -> list[str]:
+    if not vacancy_id:
+        return []
+    rows = (
+        db.session.query(Skill.nombre)
+        .join(VacancySkill, VacancySkill.skill_id == Skill.id)
+        .filter(VacancySkill.vacancy_id == vacancy_id)
+        .all()
+    )
+    return [r.nombre for r in rows]
+
+
+def prescreen(data: dict, text: str) -> dict | None:
+    """
+    Si la cobertura local de requisitos queda bajo AI_PRESCREEN_MIN_COVERAGE,
+    guarda un resultado provisional y devuelve ese resultado (no se llama al LLM).
+    Con AI_PRESCREEN_MODE="defer" además reencola el scoring completo para más tarde.
+    """
+    cfg = current_app.config
+    threshold = float(cfg.get("AI_PRESCREEN_MIN_COVERAGE", 0.0))
+    if threshold <= 0 or data.get("prescreen") is False:
+        return None
+
+    postulation_id, vacancy_id = data.get("postulation_id"), data.get("vacancy_id")
+    terms = requirement_terms(data.get("vacancy_profile"), _vacancy_skill_names(vacancy_id))
+    verdict = prescreen_coverage(text, terms)
+    if not verdict.evaluated or verdict.coverage >= threshold:
+        logger.info("[AI] pre-filtro OK postulation_id=%s cobertura=%.2f", postulation_id, verdict.coverage)
+        return None
+
+    result = {"score": verdict.score, "feedback": verdict.feedback(), "provisional": True}
+    save_result(postulation_id, vacancy_id, result["score"], result["feedback"],
+                status="provisional", job=data.get("_job"))
+    logger.info("[AI] pre-filtro bajo umbral postulation_id=%s cobertura=%.2f (< %.2f)",
+                postulation_id, verdict.coverage, threshold)
+
+    if cfg.get("AI_PRESCREEN_MODE", "defer") == "defer":
+        delay = int(cfg.get("AI_PRESCREEN_DEFER_SEC", 6 * 3600))
+        _jobs.enqueue(
+            postulation_id=postulation_id,
+            vacancy_id=vacancy_id,
+            payload={**{k: v for k, v in data.items() if k != "_job"}, "prescreen": False},
+            max_attempts=int(cfg.get("SCORING_MAX_ATTEMPTS", 3)),
+            run_after=datetime.utcnow() + timedelta(seconds=delay),
+        )
+        db.session.commit()
+    return result
+
+
+def summarize_cv_cached(text: str) -> dict:
+    """
+    summarize_cv_to_json memoizado por (texto normalizado, AI_MODEL, versión del
+    prompt). Rescoring o el mismo CV en otra vacante reutilizan el CV_JSON.
+    Los fallbacks por JSON inválido (llevan '_raw') no se memoizan.
+    Sin memo exacto, un texto casi idéntico (Jaccard >= AI_NEAR_DUP_REUSE_MIN)
+    ya parseado presta su CV_JSON (ver near_duplicates.reuse_parse).
+    """
+    text_sha = cv_text_fingerprint(text)
+    memo = _artifacts.get_parse(text_sha, AI_MODEL, CV_PARSER_PROMPT_VERSION)
+    if memo is not None:
+        db.session.commit()
+        _count("parse_cache_hit", 1)
+        logger.info("[AI] cache hit CV_JSON sha=%s", text_sha[:12])
+        return copy.deepcopy(memo.cv_json)
+
+    cv_json = None
+    reuse_min = float(current_app.config.get("AI_NEAR_DUP_REUSE_MIN", 0) or 0)
+    if reuse_min > 0:
+        try:
+            cv_json = near_duplicates.reuse_parse(
+                text, text_sha, model=AI_MODEL, prompt_version=CV_PARSER_PROMPT_VERSION, threshold=reuse_min
+            )
+        except Exception:
+            db.session.rollback()
+            logger.warning("[AI] reuso por similitud falló sha=%s", text_sha[:12], exc_info=True)
+    if cv_json is not None:
+        _count("parse_cache_hit", 1)
+    else:
+        cv_json = summarize_cv_to_json(text)
+    if "_raw" not in cv_json:
+        _artifacts.put_parse(
+            text_sha256=text_sha,
+            model=AI_MODEL,
+            prompt_version=CV_PARSER_PROMPT_VERSION,
+            cv_json=copy.deepcopy(cv_json),
+        )
+        db.session.commit()
+    return cv_json
+
+
+def save_result(
+    postulation_id,
+    vacancy_id,
+    score,
+    feedback,
+    *,
+    status: str = "succeeded",
+    error: str | None = None,
+    job: dict | None = None,
+) -> PostulationAIResult:
+    """
+    Agrega una fila al historial de resultados (append-only); la vigente es la
+    más reciente. `job` = {"job_id", "attempts", "started_at"} si viene del worker.
+    """
+    job = job or {}
+    started_at = job.get("started_at")
+    if isinstance(started_at, str):
+        started_at = datetime.fromisoformat(started_at)
+    row = _results.add(
+        postulation_id=postulation_id,
+        vacancy_id=vacancy_id,
+        status=status,
+        score=score,
+        feedback=feedback,
+        error=error,
+        job_id=job.get("job_id"),
+        attempts=job.get("attempts"),
+        pipeline_version=PIPELINE_VERSION,
+        started_at=started_at,
+    )
+    # Aviso a los long-poll de otros procesos (se entrega con el commit) y a los de este
+    result_hub.notify(db.session, postulation_id)
+    db.session.commit()
+    result_hub.publish(postulation_id)
+    return row
+
+
+def record_failure(postulation_id, vacancy_id, error: Exception | str, *, job: dict | None = None) -> None:
+    """
+    Registra el fallo definitivo (status='failed', score NULL: no entra en la
+    distribución de puntajes) sin propagar fallos propios.
+    """
+    db.session.rollback()
+    try:
+        row = save_result(postulation_id, vacancy_id, None, f"Error: {error}",
+                          status="failed", error=str(error), job=job)
+        logger.info("[AI] error registrado en BD postulation_id=%s id=%s", postulation_id, row.id)
+    except Exception:
+        db.session.rollback()
+        logger.exception("[AI] error al registrar el error postulation_id=%s", postulation_id)
+
+
+def fetch_cv_text(cv: dict) -> str:
+    """
+    Descarga el PDF y devuelve su texto. El texto se cachea por SHA-256 de los
+    bytes + EXTRACTOR_VERSION: re-postulaciones con el mismo archivo, rescoring
+    o el mismo CV en varias vacantes no vuelven a pasar por pdfplumber/OCR.
+    Si el CV se pre-procesó al subirlo, ni siquiera se descarga.
+    """
+    with _stage("extract"):
+        text = uploaded_cv_text(cv)
+    if text is not None:
+        return text
+    with _stage("fetch"):
+        data = fetch_cv_bytes(cv)
+    with _stage("extract"):
+        return extract_cv_text(data)
+
+
+def uploaded_cv_text(cv: dict) -> str | None:
+    """
+    Texto ya pre-procesado al subir el CV (job `preprocess`): el hash del objeto
+    está en cv_uploads.sha256, así que no hace falta descargarlo. None si no hay.
+    """
+    sha = _uploads.sha256_of(cv.get("s3_key"))
+    return _cached_text(sha) if sha else None
+
+
+def _cached_text(sha: str) -> str | None:
+    cached = _artifacts.get_text(sha, EXTRACTOR_VERSION)
+    if cached is None:
+        return None
+    db.session.commit()
+    _count("text_cache_hit", 1)
+    _count("page_count", cached.page_count or 0)
+    _count("ocr_pages", sum(1 for used in (cached.ocr_pages or []) if used))
+    logger.info("[AI] cache hit texto CV sha=%s pages=%s", sha[:12], cached.page_count)
+    return cached.text
+
+
+def extract_cv_text(data: bytes) -> str:
+    """Extrae en memoria (sin archivos compartidos en /tmp), con cache por SHA-256."""
+    sha = hashlib.sha256(data).hexdigest()
+    cached = _cached_text(sha)
+    if cached is not None:
+        return cached
+
+    extracted = extract_pdf(data)
+    _record_stage("ocr", extracted.get("ocr_sec", 0.0))
+    _count("page_count", extracted["page_count"])
+    _count("ocr_pages", sum(1 for used in extracted["ocr_pages"] if used))
+    if extracted.get("ocr_skipped") or extracted.get("ocr_failed"):
+        # Resultado parcial (presupuesto de OCR o falla transitoria): se usa, pero no se cachea
+        logger.warning("[AI] texto CV parcial sha=%s (%s páginas sin OCR, %s con OCR fallido); no se cachea",
+                       sha[:12], extracted.get("ocr_skipped", 0), extracted.get("ocr_failed", 0))
+        return extracted["text"]
+
+    _artifacts.put_text(
+        pdf_sha256=sha,
+        extractor_version=EXTRACTOR_VERSION,
+        text=extracted["text"],
+        page_count=extracted["page_count"],
+        ocr_pages=extracted["ocr_pages"],
+    )
+    db.session.commit()
+    logger.info("[AI] texto CV cacheado sha=%s pages=%s ocr=%s",
+                sha[:12], extracted["page_count"], sum(extracted["ocr_pages"]))
+    return extracted["text"]
+
+
+def _read_stream(chunks, limit: int = MAX_CV_BYTES) -> bytes:
+    """Acumula el cuerpo por chunks en un buffer en memoria, con tope de tamaño."""
+    buf = io.BytesIO()
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buf.write(chunk)
+        if buf.tell() > limit:
+            raise RuntimeError(f"CV supera el máximo de {limit} bytes")
+    return buf.getvalue()
+
+
+def fetch_cv_bytes(cv: dict) -> bytes:
+    """
+    Soporta lectura por presigned URL (storage='url', presigned_url)
+    o descarga directa desde S3 (storage='s3', s3_bucket, s3_key).
+    El cuerpo se lee en streaming a memoria: nada se escribe a disco.
+    """
+    presigned = cv.get("presigned_url")
+    if presigned:
+        with requests.get(presigned, timeout=(5, 60), stream=True) as r:
+            r.raise_for_status()
+            return _read_stream(r.iter_content(chunk_size=_CHUNK_BYTES))
+
+    if cv.get("storage") == "s3":
+        bucket = cv.get("s3_bucket") or os.getenv("AWS_BUCKET")
+        if not bucket:
+            raise RuntimeError("Falta 's3_bucket' o AWS_BUCKET")
+        key = cv.get("s3_key")
+        if not key:
+            raise RuntimeError("Falta 's3_key'")
+        body = s3_client.get_object(Bucket=bucket, Key=key)["Body"]
+        try:
+            return _read_stream(body.iter_chunks(chunk_size=_CHUNK_BYTES))
+        finally:
+            body.close()
+
+    raise RuntimeError("No se pudo obtener el CV (falta presigned_url o s3_key).")
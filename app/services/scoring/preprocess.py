@@ -0,0 +1,75 @@
+# app/services/scoring/preprocess.py
+"""
+Pre-procesamiento del CV al subirlo (job `preprocess` en `scoring_jobs`).
+
+Apenas el objeto queda en S3 se encola un job que descarga los bytes, calcula
+el SHA-256, cuenta páginas, detecta cuáles necesitan OCR y cachea el texto
+(`extract_cv_text` -> cv_text_cache). El hash queda en `cv_uploads.sha256`:
+cuando el postulante termina el formulario, el scoring de la postulación
+encuentra el texto por la clave del CV sin descargar ni extraer de nuevo.
+"""
+import hashlib
+import logging
+
+from flask import current_app
+
+from app.ext.db import db
+from app.ext.s3 import AWS_BUCKET
+from app.models.cv_upload import CVUpload
+from app.repositories.cv_upload_repo import CVUploadRepository
+from app.repositories.scoring_job_repo import ScoringJobRepository
+from .pipeline import extract_cv_text, fetch_cv_bytes, pop_run_counters, pop_stage_timings, uploaded_cv_text
+
+logger = logging.getLogger(__name__)
+
+PREPROCESS_KIND = "preprocess"
+
+_jobs = ScoringJobRepository()
+_uploads = CVUploadRepository()
+
+
+def enqueue_preprocess(upload: CVUpload) -> None:
+    """Encola el pre-procesamiento (no falla la subida si la cola no responde)."""
+    if not current_app.config.get("CV_PREPROCESS_ON_UPLOAD", True):
+        return
+    try:
+        _jobs.enqueue(
+            postulation_id=None,
+            vacancy_id=upload.vacancy_id,
+            applicant_id=upload.applicant_id,
+            payload={
+                "upload_id": upload.id,
+                "cv": {"storage": "s3", "s3_bucket": AWS_BUCKET, "s3_key": upload.key},
+            },
+            max_attempts=int(current_app.config.get("SCORING_MAX_ATTEMPTS", 3)),
+            kind=PREPROCESS_KIND,
+        )
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        logger.exception("[AI] no se pudo encolar el pre-procesamiento key=%s", upload.key)
+
+
+def preprocess_upload(payload: dict) -> dict:
+    """Handler del job: deja el texto del CV cacheado y el hash en cv_uploads."""
+    cv = payload.get("cv") or {}
+    pop_stage_timings(), pop_run_counters()
+    if uploaded_cv_text(cv) is not None:
+        return {"sha256": _uploads.sha256_of(cv.get("s3_key")), "cached": True}
+
+    upload = _uploads.get_by_key(cv.get("s3_key") or "")
+    data = fetch_cv_bytes(cv)
+    sha = hashlib.sha256(data).hexdigest()
+    extract_cv_text(data)
+    if upload is not None:
+        if upload.sha256 and upload.sha256 != sha:
+            logger.warning("[AI] hash distinto al subido key=%s", upload.key)
+        upload.sha256 = sha
+    db.session.commit()
+
+    counters = pop_run_counters()
+    timings = pop_stage_timings()
+    logger.info("[AI] CV pre-procesado sha=%s pages=%s ocr=%s ocr_sec=%s",
+                sha[:12], counters.get("page_count"), counters.get("ocr_pages"), timings.get("ocr"))
+    return {"sha256": sha, "cached": bool(counters.get("text_cache_hit")),
+            "page_count": counters.get("page_count"), "ocr_pages": counters.get("ocr_pages")}
@@ -0,0 +1,81 @@
+# app/services/scoring/prescreen.py
+"""
+Pre-filtro local y determinista (sin LLM).
+
+Cruza los tokens canonicalizados del CV con los términos de requisitos de la
+vacante (req_knowledge + nombres de skills de VacancySkill) y calcula una
+cobertura 0..1. Por debajo de AI_PRESCREEN_MIN_COVERAGE el pipeline guarda un
+resultado provisional y omite (o difiere) las dos llamadas al LLM.
+"""
+import re
+import unicodedata
+from dataclasses import dataclass, field
+
+from app.ext.ai_scorer import _canonicalize_terms, _normalize_cv_text
+
+# Palabras vacías ES/EN: no aportan evidencia de requisitos
+_STOPWORDS = {
+    "a", "al", "and", "con", "de", "del", "el", "en", "for", "in", "la", "las", "los",
+    "o", "of", "or", "para", "por", "the", "to", "un", "una", "y", "e", "u", "with",
+    "conocimiento", "conocimientos", "manejo", "experiencia", "nivel", "uso", "dominio",
+    "basico", "basicos", "intermedio", "avanzado", "deseable", "knowledge",
+}
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+
+def _fold(s: str) -> str:
+    """Minúsculas y sin tildes (á -> a, ñ -> n)."""
+    s = unicodedata.normalize("NFKD", (s or "").lower())
+    return "".join(ch for ch in s if not unicodedata.combining(ch))
+
+
+def _tokens(s: str) -> list[str]:
+    return [t for t in _TOKEN_RE.findall(_fold(s)) if t not in _STOPWORDS]
+
+
+@dataclass
+class PrescreenResult:
+    coverage: float
+    matched: list[str] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+
+    @property
+    def evaluated(self) -> bool:
+        return bool(self.matched or self.missing)
+
+    @property
+    def score(self) -> int:
+        return int(round(self.coverage * 100))
+
+    def feedback(self) -> str:
+        shown = ", ".join(self.missing[:5]) or "—"
+        return (
+            f"[Provisional] Pre-filtro local: cobertura de requisitos {self.score}%. "
+            f"Sin evidencia en el CV de: {shown}."
+        )
+
+
+def requirement_terms(vacancy_profile: dict | None, skill_names: list[str] | None) -> list[str]:
+    items = list((vacancy_profile or {}).get("req_knowledge") or []) + list(skill_names or [])
+    return _canonicalize_terms([str(x) for x in items if x])
+
+
+def prescreen_coverage(cv_text: str, terms: list[str]) -> PrescreenResult:
+    """
+    Cobertura = promedio, por término, de la fracción de sus tokens presentes en el CV.
+    Un término sin tokens útiles no cuenta.
+    """
+    cv_terms = _canonicalize_terms(_normalize_cv_text(cv_text).splitlines())
+    cv_tokens = {t for term in cv_terms for t in _tokens(term)}
+
+    matched, missing, scores = [], [], []
+    for term in terms:
+        toks = _tokens(term)
+        if not toks:
+            continue
+        hit = sum(1 for t in toks if t in cv_tokens) / len(toks)
+        scores.append(hit)
+        (matched if hit >= 0.5 else missing).append(term)
+
+    coverage = sum(scores) / len(scores) if scores else 1.0
+    return PrescreenResult(coverage=round(coverage, 4), matched=matched, missing=missing)
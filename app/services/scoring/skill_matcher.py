@@ -0,0 +1,203 @@
+# app/services/scoring/skill_matcher.py
+"""
+Evidencia local de skills en el CV (sin LLM).
+
+Un autómata Aho-Corasick con los `Skill.nombre` activos (minúsculas, sin tildes,
+espacios colapsados) recorre el texto extraído UNA vez, en tiempo lineal sin
+importar cuántas skills tenga el catálogo. Cada coincidencia respeta límites de
+palabra ("java" no matchea "javascript") y guarda sus posiciones en el texto
+original. El autómata se reconstruye solo cuando cambia el catálogo: la versión
+es (cantidad de skills activas, último updated_at), igual en todos los procesos.
+"""
+import threading
+import unicodedata
+from collections import deque
+from dataclasses import dataclass, field
+
+from sqlalchemy import func
+
+from app.ext.db import db
+from app.models.admin.skill import Skill
+from app.repositories.skill_evidence_repo import SkillEvidenceRepository
+
+# Posiciones guardadas por skill (los hits se cuentan todos)
+MAX_POSITIONS = 20
+SNIPPET_CHARS = 40
+
+
+def _fold_char(ch: str) -> str:
+    if ch.isspace():
+        return " "
+    folded = unicodedata.normalize("NFKD", ch.lower())
+    return "".join(c for c in folded if not unicodedata.combining(c))
+
+
+def fold_with_offsets(text: str) -> tuple[str, list[int]]:
+    """Texto plegado (minúsculas, sin tildes, espacios colapsados) y, por carácter, su índice original."""
+    out: list[str] = []
+    offsets: list[int] = []
+    for i, ch in enumerate(text or ""):
+        folded = _fold_char(ch)
+        if folded == " " and out and out[-1] == " ":
+            continue
+        for c in folded:
+            out.append(c)
+            offsets.append(i)
+    return "".join(out), offsets
+
+
+def fold(text: str) -> str:
+    return fold_with_offsets(text)[0].strip()
+
+
+def _is_word(ch: str) -> bool:
+    return ch.isalnum()
+
+
+@dataclass
+class SkillMatch:
+    skill_id: int
+    nombre: str
+    positions: list[tuple[int, int]] = field(default_factory=list)  # [inicio, fin) en el texto original
+    hits: int = 0
+
+    def snippet(self, text: str) -> str | None:
+        if not self.positions:
+            return None
+        start, end = self.positions[0]
+        frag = text[max(start - SNIPPET_CHARS, 0):end + SNIPPET_CHARS]
+        return " ".join(frag.split())
+
+
+class SkillAutomaton:
+    """Aho-Corasick sobre los nombres plegados; varias skills pueden compartir patrón."""
+
+    def __init__(self, skills: list[tuple[int, str]], version: str = ""):
+        self.version = version
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[tuple[int, int]]] = [[]]  # (skill_id, largo del patrón)
+        self._names: dict[int, str] = {}
+        for skill_id, nombre in skills:
+            pattern = fold(nombre)
+            if pattern:
+                self._names[skill_id] = nombre
+                self._add(pattern, skill_id)
+        self._link()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _add(self, pattern: str, skill_id: int) -> None:
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append((skill_id, len(pattern)))
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def scan(self, text: str) -> list[SkillMatch]:
+        """Skills presentes en `text`, en orden de primera aparición."""
+        folded, offsets = fold_with_offsets(text)
+        found: dict[int, SkillMatch] = {}
+        state = 0
+        n = len(folded)
+        for i, ch in enumerate(folded):
+            while state and ch not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(ch, 0)
+            for skill_id, length in self._out[state]:
+                start = i - length + 1
+                # Límite de palabra solo donde el patrón empieza/termina en letra o dígito (C++, .NET)
+                if start > 0 and _is_word(folded[start - 1]) and _is_word(folded[start]):
+                    continue
+                if i + 1 < n and _is_word(folded[i + 1]) and _is_word(folded[i]):
+                    continue
+                match = found.get(skill_id)
+                if match is None:
+                    match = found[skill_id] = SkillMatch(skill_id, self._names[skill_id])
+                match.hits += 1
+                if len(match.positions) < MAX_POSITIONS:
+                    match.positions.append((offsets[start], offsets[i] + 1))
+        return list(found.values())
+
+
+def catalog_version() -> str:
+    count, last = (
+        db.session.query(func.count(Skill.id), func.max(Skill.updated_at))
+        .filter(Skill.is_active.is_(True))
+        .one()
+    )
+    return f"{count}:{last.isoformat() if last else ''}"
+
+
+class SkillMatcherCache:
+    """Un autómata vivo por proceso; segura entre hilos (el worker corre varios)."""
+
+    def __init__(self):
+        self._automaton: SkillAutomaton | None = None
+        self._lock = threading.Lock()
+
+    def current(self) -> SkillAutomaton:
+        version = catalog_version()
+        automaton = self._automaton
+        if automaton is not None and automaton.version == version:
+            return automaton
+        rows = db.session.query(Skill.id, Skill.nombre).filter(Skill.is_active.is_(True)).all()
+        automaton = SkillAutomaton([(r.id, r.nombre) for r in rows], version=version)
+        with self._lock:
+            self._automaton = automaton
+        return automaton
+
+    def clear(self) -> None:
+        with self._lock:
+            self._automaton = None
+
+
+skill_matcher = SkillMatcherCache()
+_evidence = SkillEvidenceRepository()
+
+
+def record_skill_evidence(text: str, *, postulation_id: int, vacancy_id: int | None, text_sha256: str) -> int | None:
+    """
+    Escanea el texto y reemplaza la evidencia de la postulación. None si ya estaba
+    al día (mismo texto y misma versión del catálogo); si no, cuántas skills matchearon.
+    """
+    automaton = skill_matcher.current()
+    if _evidence.is_current(postulation_id, text_sha256, automaton.version):
+        return None
+    required = _evidence.required_skill_ids(vacancy_id)
+    matches = automaton.scan(text)
+    return _evidence.replace(
+        postulation_id=postulation_id,
+        vacancy_id=vacancy_id,
+        text_sha256=text_sha256,
+        catalog_version=automaton.version,
+        matches=[
+            {
+                "skill_id": m.skill_id,
+                "required": m.skill_id in required,
+                "hits": m.hits,
+                "positions": [list(p) for p in m.positions],
+                "snippet": (m.snippet(text) or "")[:255] or None,
+            }
+            for m in matches
+        ],
+    )
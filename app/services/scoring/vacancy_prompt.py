@@ -0,0 +1,114 @@
+# app/services/scoring/vacancy_prompt.py
+"""
+Fragmentos de prompt precalculados por vacante.
+
+El perfil de la vacante (`vacancy_profile`) y su bloque [PERFIL DEL CARGO] se
+construyen una sola vez por versión, con clave (Vacancy.id, Vacancy.updated_at),
+y todos los jobs de esa vacante los reutilizan byte a byte. Como updated_at
+forma parte de la clave, editar la vacante invalida la entrada también en los
+procesos worker; el PATCH de admin además la descarta localmente.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from app.ext.db import db
+from app.ext.ai_scorer import render_vacancy_block
+from app.models.admin.vacancy import Vacancy
+
+VACANCY_PROMPT_CACHE_SIZE = 512
+
+
+@dataclass(frozen=True)
+class VacancyPrompt:
+    vacancy_id: int
+    version: str
+    profile: dict
+    fragment: str
+
+    @property
+    def fingerprint(self) -> str:
+        return hashlib.sha256(self.fragment.encode("utf-8")).hexdigest()[:16]
+
+
+def build_vacancy_profile(vac: Vacancy) -> dict:
+    """Perfil de la vacante que consume el scoring (mismas claves que el payload histórico)."""
+    return {
+        "location": vac.location,
+        "modality": vac.modality,
+        "role_objective": vac.role_objective,
+        "responsibilities": list(vac.responsibilities or []),
+        "req_education": list(vac.req_education or []),
+        "req_experience": list(vac.req_experience or []),
+        "req_knowledge": list(vac.req_knowledge or []),
+        "charge_title": vac.title,
+        "charge_description": vac.description,
+        "charge_area": getattr(vac, "area", None),
+    }
+
+
+def _version(updated_at) -> str:
+    return updated_at.isoformat() if updated_at else ""
+
+
+class VacancyPromptCache:
+    """LRU en proceso, segura entre hilos (el worker corre varios hilos)."""
+
+    def __init__(self, max_size: int = VACANCY_PROMPT_CACHE_SIZE):
+        self.max_size = max_size
+        self._items: OrderedDict[tuple[int, str], VacancyPrompt] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _lookup(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                self._items.move_to_end(key)
+            return item
+
+    def _store(self, item: VacancyPrompt) -> VacancyPrompt:
+        with self._lock:
+            # Una sola versión viva por vacante
+            for key in [k for k in self._items if k[0] == item.vacancy_id]:
+                del self._items[key]
+            self._items[(item.vacancy_id, item.version)] = item
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+        return item
+
+    def for_vacancy(self, vac: Vacancy) -> VacancyPrompt:
+        key = (vac.id, _version(vac.updated_at))
+        item = self._lookup(key)
+        if item is not None:
+            return item
+        profile = build_vacancy_profile(vac)
+        return self._store(VacancyPrompt(
+            vacancy_id=vac.id,
+            version=key[1],
+            profile=profile,
+            fragment=render_vacancy_block(profile),
+        ))
+
+    def get(self, vacancy_id: int) -> VacancyPrompt | None:
+        """Versión vigente: solo lee updated_at y carga la vacante completa si falta en cache."""
+        updated_at = db.session.query(Vacancy.updated_at).filter(Vacancy.id == vacancy_id).scalar()
+        if updated_at is None:
+            return None
+        item = self._lookup((vacancy_id, _version(updated_at)))
+        if item is not None:
+            return item
+        vac = db.session.get(Vacancy, vacancy_id)
+        return self.for_vacancy(vac) if vac is not None else None
+
+    def invalidate(self, vacancy_id: int) -> None:
+        with self._lock:
+            for key in [k for k in self._items if k[0] == vacancy_id]:
+                del self._items[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+vacancy_prompts = VacancyPromptCache()
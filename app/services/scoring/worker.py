@@ -0,0 +1,232 @@
+# app/services/scoring/worker.py
+"""
+Worker de scoring fuera de banda (`flask scoring-worker`).
+Reclama jobs de `scoring_jobs` con lease, mantiene heartbeat mientras el
+pipeline corre y reintenta con backoff hasta agotar `max_attempts`.
+Con el circuito LLM abierto no reclama jobs, y los que fallan por el circuito
+se estacionan hasta su reapertura sin consumir intentos.
+Si el postulante tiene otras postulaciones pendientes, las reclama junto al job
+y las puntúa en grupo (una llamada multi-vacante por CV, ver process_payload_group).
+Los jobs `preprocess` (CV recién subido) no usan el LLM: corren aun con el circuito abierto.
+Escala agregando procesos/pods worker, no réplicas de la API.
+"""
+import os
+import random
+import socket
+import logging
+import threading
+from typing import Callable
+
+from datetime import datetime, timedelta
+
+from flask import Flask
+
+from app.ext.db import db
+from app.ext.llm_circuit_breaker import CircuitOpenError, llm_breaker
+from app.models.scoring_job import ScoringJob
+from app.repositories.scoring_job_repo import ScoringJobRepository
+from .pipeline import process_payload, process_payload_group, record_failure
+from .preprocess import PREPROCESS_KIND, preprocess_upload
+
+logger = logging.getLogger(__name__)
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class _Heartbeat(threading.Thread):
+    """Extiende periódicamente el lease del job mientras el pipeline trabaja."""
+
+    def __init__(self, app: Flask, repo: ScoringJobRepository, job_id: int, worker_id: str, lease_seconds: int):
+        super().__init__(daemon=True, name=f"scoring-hb-{job_id}")
+        self.app = app
+        self.repo = repo
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self._stop_event = threading.Event()
+
+    def run(self):
+        interval = max(self.lease_seconds / 3.0, 1.0)
+        with self.app.app_context():
+            try:
+                while not self._stop_event.wait(interval):
+                    try:
+                        if not self.repo.heartbeat(self.job_id, worker_id=self.worker_id, lease_seconds=self.lease_seconds):
+                            logger.warning("[AI-WORKER] lease perdido job_id=%s", self.job_id)
+                            return
+                    except Exception:
+                        db.session.rollback()
+                        logger.exception("[AI-WORKER] heartbeat falló job_id=%s", self.job_id)
+            finally:
+                db.session.remove()
+
+    def stop(self):
+        self._stop_event.set()
+
+
+class ScoringWorker:
+    def __init__(
+        self,
+        app: Flask,
+        *,
+        worker_id: str | None = None,
+        concurrency: int | None = None,
+        poll_interval: float | None = None,
+        lease_seconds: int | None = None,
+        retry_backoff_sec: int | None = None,
+        repo: ScoringJobRepository | None = None,
+        handler: Callable[[dict], dict] = process_payload,
+        group_handler: Callable[[list[dict]], list] | None = process_payload_group,
+        multi_max: int | None = None,
+        preprocess_handler: Callable[[dict], dict] = preprocess_upload,
+    ):
+        def _opt(value, key, default):
+            return app.config.get(key, default) if value is None else value
+
+        self.app = app
+        self.worker_id = worker_id or default_worker_id()
+        self.concurrency = max(int(_opt(concurrency, "SCORING_WORKER_CONCURRENCY", 2)), 1)
+        self.poll_interval = float(_opt(poll_interval, "SCORING_POLL_INTERVAL_SEC", 2.0))
+        self.lease_seconds = int(_opt(lease_seconds, "SCORING_LEASE_SECONDS", 300))
+        self.retry_backoff_sec = int(_opt(retry_backoff_sec, "SCORING_RETRY_BACKOFF_SEC", 30))
+        self.repo = repo or ScoringJobRepository()
+        self.handler = handler
+        self.group_handler = group_handler
+        self.multi_max = int(_opt(multi_max, "AI_MULTI_SCORE_MAX", 5))
+        self.preprocess_handler = preprocess_handler
+        self.stop_event = threading.Event()
+
+    # ---------- ciclo ----------
+    def run_once(self) -> bool:
+        """Reclama y procesa un job. Devuelve False si la cola estaba vacía."""
+        with self.app.app_context():
+            try:
+                # Circuito abierto: solo jobs que no llaman al LLM
+                kinds = (PREPROCESS_KIND,) if llm_breaker.retry_after() is not None else None
+                job = self.repo.claim_next(worker_id=self.worker_id, lease_seconds=self.lease_seconds, kinds=kinds)
+                if job is None:
+                    return False
+                self._execute(job)
+                return True
+            finally:
+                db.session.remove()
+
+    def _loop(self):
+        while not self.stop_event.is_set():
+            try:
+                worked = self.run_once()
+            except Exception:
+                logger.exception("[AI-WORKER] error inesperado en el ciclo")
+                worked = False
+            if not worked:
+                self.stop_event.wait(self.poll_interval)
+
+    def run_forever(self) -> None:
+        logger.info("[AI-WORKER] iniciado worker_id=%s concurrency=%s", self.worker_id, self.concurrency)
+        threads = [
+            threading.Thread(target=self._loop, name=f"scoring-worker-{i}", daemon=True)
+            for i in range(self.concurrency)
+        ]
+        for t in threads:
+            t.start()
+        try:
+            while any(t.is_alive() for t in threads):
+                for t in threads:
+                    t.join(timeout=1.0)
+        except KeyboardInterrupt:
+            self.stop()
+            for t in threads:
+                t.join()
+        logger.info("[AI-WORKER] detenido worker_id=%s", self.worker_id)
+
+    def stop(self) -> None:
+        """Termina tras el job en curso (el lease permite recuperar lo abandonado)."""
+        self.stop_event.set()
+
+    # ---------- ejecución ----------
+    @staticmethod
+    def _job_meta(job: ScoringJob) -> dict:
+        return {
+            "job_id": job.id,
+            "attempts": job.attempts,
+            "started_at": job.started_at.isoformat() if job.started_at else None,
+        }
+
+    def _execute(self, job: ScoringJob) -> None:
+        siblings = []
+        preprocess = job.kind == PREPROCESS_KIND
+        handler = self.preprocess_handler if preprocess else self.handler
+        if not preprocess and self.group_handler is not None and self.multi_max > 1:
+            siblings = self.repo.claim_siblings(job, worker_id=self.worker_id, lease_seconds=self.lease_seconds,
+                                                limit=self.multi_max - 1)
+        if siblings:
+            self._execute_group([job, *siblings])
+            return
+
+        job_id = job.id
+        logger.info("[AI-WORKER] job_id=%s postulation_id=%s intento=%s/%s",
+                    job_id, job.postulation_id, job.attempts, job.max_attempts)
+        job_meta = self._job_meta(job)
+        hb = _Heartbeat(self.app, self.repo, job_id, self.worker_id, self.lease_seconds)
+        hb.start()
+        try:
+            handler({**(job.payload or {}), "_job": job_meta})
+        except Exception as e:
+            db.session.rollback()
+            self._settle(job_id, job_meta, e)
+            return
+        finally:
+            hb.stop()
+        self._settle(job_id, job_meta, None)
+
+    def _commit_settle(self, job: ScoringJob, job_meta: dict) -> bool:
+        if self.repo.settle(job, worker_id=self.worker_id, attempts=job_meta["attempts"]):
+            return True
+        logger.warning("[AI-WORKER] job_id=%s: lease perdido (otro worker lo reclamó); estado descartado",
+                       job_meta["job_id"])
+        return False
+
+    def _execute_group(self, jobs: list[ScoringJob]) -> None:
+        """Jobs del mismo postulante: el handler de grupo devuelve resultado o excepción por job."""
+        logger.info("[AI-WORKER] grupo applicant_id=%s jobs=%s", jobs[0].applicant_id, [j.id for j in jobs])
+        metas = [self._job_meta(j) for j in jobs]
+        hbs = [_Heartbeat(self.app, self.repo, j.id, self.worker_id, self.lease_seconds) for j in jobs]
+        for hb in hbs:
+            hb.start()
+        try:
+            outcomes = self.group_handler([{**(j.payload or {}), "_job": m} for j, m in zip(jobs, metas)])
+        except Exception as e:
+            outcomes = [e] * len(jobs)
+        finally:
+            for hb in hbs:
+                hb.stop()
+        db.session.rollback()
+        for meta, outcome in zip(metas, outcomes):
+            self._settle(meta["job_id"], meta, outcome if isinstance(outcome, Exception) else None)
+
+    def _settle(self, job_id: int, job_meta: dict, error: Exception | None) -> None:
+        """Estado final del job, solo si este worker sigue siendo dueño del lease."""
+        job = db.session.get(ScoringJob, job_id)
+        if error is None:
+            self.repo.mark_succeeded(job)
+            if self._commit_settle(job, job_meta):
+                logger.info("[AI-WORKER] job_id=%s OK", job_id)
+            return
+        if isinstance(error, CircuitOpenError):
+            # Escalonado para que la cola no despierte toda junta al reabrirse el circuito
+            delay = error.retry_after + random.uniform(0, max(self.poll_interval, 1.0) * self.concurrency)
+            self.repo.park(job, run_after=datetime.utcnow() + timedelta(seconds=delay),
+                           reason=f"CircuitOpenError: {error}")
+            if self._commit_settle(job, job_meta):
+                logger.warning("[AI-WORKER] job_id=%s estacionado %.0fs: circuito LLM abierto", job_id, delay)
+            return
+        logger.error("[AI-WORKER] job_id=%s falló: %s", job_id, error, exc_info=error)
+        postulation_id, vacancy_id = job.postulation_id, job.vacancy_id
+        will_retry = self.repo.mark_failed(job, error=f"{type(error).__name__}: {error}",
+                                           retry_backoff_sec=self.retry_backoff_sec)
+        if not self._commit_settle(job, job_meta):
+            return
+        if not will_retry and postulation_id is not None:
+            record_failure(postulation_id, vacancy_id, error, job=job_meta)
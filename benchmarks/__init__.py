@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+"""Banco de pruebas offline del pipeline de scoring (ver benchmarks/README.md)."""
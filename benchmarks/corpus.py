@@ -0,0 +1,97 @@
+# benchmarks/corpus.py
+"""
+Corpus sintético de CVs en PDF: con texto embebido (ruta pdfplumber) y
+escaneados (solo imagen, ruta OCR). Cada CV es distinto para que los caches
+por contenido no oculten el costo real, salvo que se pida repetir (`distinct`).
+"""
+import io
+import random
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFont
+
+_NAMES = ["Ana Torres", "Luis Mora", "Carla Vega", "Jorge Paz", "María León", "Diego Ruiz"]
+_ROLES = ["Desarrollador backend", "Analista de datos", "Contador", "Asistente administrativo", "Ingeniero QA"]
+_SKILLS = ["Python", "Flask", "SQL", "Excel", "Power BI", "Docker", "NIIF", "SAP", "Scrum", "Selenium", "Git"]
+
+
+def cv_lines(i: int, rng: random.Random) -> list[str]:
+    skills = rng.sample(_SKILLS, 5)
+    return [
+        f"{rng.choice(_NAMES)} - CV #{i}",
+        f"Email: postulante{i}@example.com  Tel: 09{rng.randint(10_000_000, 99_999_999)}",
+        "EXPERIENCIA",
+        f"{rng.choice(_ROLES)} en Empresa {i % 17} ({2015 + i % 6}-2024)",
+        f"- Responsable de procesos con {skills[0]} y {skills[1]}",
+        f"- Mejoras continuas usando {skills[2]}",
+        "EDUCACIÓN",
+        f"Ingeniería, Universidad {i % 5} (2010-2015)",
+        "HABILIDADES",
+        ", ".join(skills),
+    ]
+
+
+def _pdf_escape(s: str) -> str:
+    return s.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def text_pdf(lines: list[str]) -> bytes:
+    """PDF mínimo de una página con texto embebido (Helvetica, WinAnsi)."""
+    ops = ["BT", "/F1 11 Tf", "14 TL", "50 780 Td"]
+    for line in lines:
+        ops.append(f"({_pdf_escape(line)}) Tj T*")
+    ops.append("ET")
+    stream = "\n".join(ops).encode("cp1252", errors="replace")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+        b"/Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>",
+        b"<< /Length " + str(len(stream)).encode() + b" >>\nstream\n" + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for n, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(f"{n} 0 obj\n".encode() + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode())
+    for off in offsets:
+        out.write(f"{off:010d} 00000 n \n".encode())
+    out.write(f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode())
+    return out.getvalue()
+
+
+def scanned_pdf(lines: list[str], *, pages: int = 1) -> bytes:
+    """PDF solo-imagen (sin capa de texto), como un CV escaneado."""
+    font = ImageFont.load_default()
+    images = []
+    for _ in range(pages):
+        img = Image.new("L", (1240, 1754), color=255)
+        draw = ImageDraw.Draw(img)
+        for n, line in enumerate(lines):
+            draw.text((100, 120 + n * 40), line, fill=0, font=font)
+        images.append(img)
+    out = io.BytesIO()
+    images[0].save(out, format="PDF", save_all=True, append_images=images[1:], resolution=150)
+    return out.getvalue()
+
+
+def build_corpus(target: Path, *, count: int, scanned_ratio: float = 0.2,
+                 distinct: int | None = None, seed: int = 7) -> list[Path]:
+    """Escribe `count` PDFs en `target`; con `distinct` < count se repite contenido (cache hits)."""
+    rng = random.Random(seed)
+    target.mkdir(parents=True, exist_ok=True)
+    uniques = max(min(distinct or count, count), 1)
+    blobs = []
+    for i in range(uniques):
+        lines = cv_lines(i, rng)
+        blobs.append(scanned_pdf(lines) if rng.random() < scanned_ratio else text_pdf(lines))
+    paths = []
+    for i in range(count):
+        path = target / f"cv_{i:05d}.pdf"
+        path.write_bytes(blobs[i % uniques])
+        paths.append(path)
+    return paths
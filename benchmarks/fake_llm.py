@@ -0,0 +1,153 @@
+# benchmarks/fake_llm.py
+"""
+Servidor local que imita /v1/chat/completions.
+
+Latencia configurable (con jitter), tasa de errores 5xx y de 429 con Retry-After.
+Responde JSON válido para el parser de CV y para el scoring, de modo que el
+pipeline real recorre todas sus ramas sin salir a la red.
+
+Uso suelto:  python -m benchmarks.fake_llm --port 8765 --latency-ms 800 --rate-429 0.05
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_CV_JSON = {
+    "identidad": {"nombre": "Postulante Bench", "email": "bench@example.com", "telefono": None, "ubicacion": "Quito"},
+    "educacion": [{"titulo": "Ingeniería en Sistemas", "institucion": "Universidad", "periodo": "2015-2020"}],
+    "experiencia": [{"puesto": "Desarrollador", "empresa": "Acme", "periodo": "2020-2024",
+                     "funciones": ["APIs REST con Python", "Modelado de datos SQL"]}],
+    "habilidades": ["Python", "Flask", "SQL", "Docker"],
+    "certificaciones": [],
+    "idiomas": [{"idioma": "Inglés", "nivel": "B2"}],
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "FakeLLMServer"
+
+    def log_message(self, *_):
+        pass
+
+    def _reply(self, status: int, body: dict, headers: dict | None = None):
+        raw = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            return self._reply(404, {"error": {"message": "not found"}})
+        length = int(self.headers.get("Content-Length") or 0)
+        req = json.loads(self.rfile.read(length) or b"{}")
+        srv = self.server
+        srv.count("requests")
+
+        roll = srv.rng_random()
+        if roll < srv.rate_429:
+            srv.count("429")
+            return self._reply(429, {"error": {"message": "rate limited"}},
+                               {"Retry-After": f"{srv.retry_after:.2f}"})
+        if roll < srv.rate_429 + srv.error_rate:
+            srv.count("5xx")
+            return self._reply(503, {"error": {"message": "overloaded"}})
+
+        time.sleep(max(srv.latency_ms + srv.rng_uniform(-srv.jitter_ms, srv.jitter_ms), 0) / 1000.0)
+
+        system = next((m.get("content", "") for m in req.get("messages", []) if m.get("role") == "system"), "")
+        if "PARSER" in system:
+            content = _CV_JSON
+        else:
+            content = {"score": int(srv.rng_uniform(20, 95)), "feedback": "Respuesta simulada (benchmark)."}
+        prompt_chars = sum(len(m.get("content") or "") for m in req.get("messages", []))
+        completion = json.dumps(content, ensure_ascii=False)
+        srv.count("ok")
+        return self._reply(200, {
+            "id": "bench",
+            "object": "chat.completion",
+            "model": req.get("model"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": completion}, "finish_reason": "stop"}],
+            "usage": {
+                "prompt_tokens": prompt_chars // 4,
+                "completion_tokens": len(completion) // 4,
+                "total_tokens": prompt_chars // 4 + len(completion) // 4,
+            },
+        })
+
+
+class FakeLLMServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        latency_ms: float = 500,
+        jitter_ms: float = 100,
+        error_rate: float = 0.0,
+        rate_429: float = 0.0,
+        retry_after: float = 0.5,
+        seed: int | None = None,
+    ):
+        super().__init__((host, port), _Handler)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats: dict[str, int] = {}
+        self._thread: threading.Thread | None = None
+
+    def rng_random(self) -> float:
+        with self._lock:
+            return self._rng.random()
+
+    def rng_uniform(self, a: float, b: float) -> float:
+        with self._lock:
+            return self._rng.uniform(a, b)
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] = self.stats.get(key, 0) + 1
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "FakeLLMServer":
+        self._thread = threading.Thread(target=self.serve_forever, name="fake-llm", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Servidor falso de chat completions")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--latency-ms", type=float, default=500)
+    ap.add_argument("--jitter-ms", type=float, default=100)
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--rate-429", type=float, default=0.0)
+    args = ap.parse_args()
+    srv = FakeLLMServer(port=args.port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                        error_rate=args.error_rate, rate_429=args.rate_429)
+    print(f"Fake LLM en {srv.base_url}")
+    srv.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
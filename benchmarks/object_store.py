@@ -0,0 +1,45 @@
+# benchmarks/object_store.py
+"""
+Almacén de objetos local: sirve los PDFs del corpus por HTTP con latencia
+configurable. El pipeline los descarga por la misma ruta que en producción
+(`cv.presigned_url` con requests en streaming).
+"""
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+
+class _Handler(SimpleHTTPRequestHandler):
+    def log_message(self, *_):
+        pass
+
+    def do_GET(self):
+        delay = self.server.latency_ms / 1000.0
+        if delay:
+            time.sleep(delay)
+        return super().do_GET()
+
+
+class LocalObjectStore(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, root: Path, host: str = "127.0.0.1", port: int = 0, *, latency_ms: float = 20):
+        super().__init__((host, port), partial(_Handler, directory=str(root)))
+        self.root = Path(root)
+        self.latency_ms = latency_ms
+        self._thread: threading.Thread | None = None
+
+    def url_for(self, path: Path) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/{Path(path).relative_to(self.root).as_posix()}"
+
+    def start(self) -> "LocalObjectStore":
+        self._thread = threading.Thread(target=self.serve_forever, name="object-store", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,162 @@
+# benchmarks/run_pipeline.py
+"""
+Benchmark offline del pipeline de scoring (`process_payload`), sin OpenAI ni S3.
+
+Levanta el LLM falso y el almacén local, genera el corpus de PDFs y ejecuta el
+pipeline real con N hilos (igual que el worker). Reporta p50/p95/p99 por etapa
+(fetch, extract, ocr, prescreen, summarize, score, persist), total y jobs/seg.
+
+    python -m benchmarks.run_pipeline --jobs 200 --concurrency 8 --llm-latency-ms 800 --rate-429 0.05
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from benchmarks.corpus import build_corpus
+from benchmarks.fake_llm import FakeLLMServer
+from benchmarks.object_store import LocalObjectStore
+
+STAGES = ("fetch", "extract", "ocr", "prescreen", "summarize", "score", "persist", "total")
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Percentil por rango más cercano (sin numpy)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = max(math.ceil(pct / 100.0 * len(ordered)) - 1, 0)
+    return ordered[min(k, len(ordered) - 1)]
+
+
+def summarize(samples: list[dict], wall_sec: float, errors: int) -> dict:
+    report = {"jobs": len(samples) + errors, "ok": len(samples), "errors": errors,
+              "wall_sec": round(wall_sec, 3),
+              "jobs_per_sec": round(len(samples) / wall_sec, 3) if wall_sec else 0.0,
+              "stages": {}}
+    for stage in STAGES:
+        values = [s[stage] * 1000 for s in samples if stage in s]
+        if values:
+            report["stages"][stage] = {
+                "n": len(values),
+                "p50_ms": round(percentile(values, 50), 1),
+                "p95_ms": round(percentile(values, 95), 1),
+                "p99_ms": round(percentile(values, 99), 1),
+                "max_ms": round(max(values), 1),
+            }
+    return report
+
+
+def print_report(report: dict) -> None:
+    print(f"\njobs={report['jobs']} ok={report['ok']} errores={report['errors']} "
+          f"pared={report['wall_sec']}s throughput={report['jobs_per_sec']} jobs/s")
+    print(f"{'etapa':<10} {'n':>5} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'max ms':>10}")
+    for stage, row in report["stages"].items():
+        print(f"{stage:<10} {row['n']:>5} {row['p50_ms']:>10} {row['p95_ms']:>10} {row['p99_ms']:>10} {row['max_ms']:>10}")
+    if report.get("llm"):
+        print(f"LLM falso: {report['llm']}")
+    if report.get("llm_calls"):
+        print(f"Llamadas LLM: {report['llm_calls']}")
+
+
+def _payload(i: int, url: str) -> dict:
+    return {
+        "postulation_id": i + 1,
+        "vacancy_id": None,
+        "cv": {"storage": "url", "presigned_url": url},
+        "applicant_profile": {"residence_addr": "Quito", "age": 30, "role_exp_years": 4,
+                              "expected_salary": 1200, "phone": None, "credential": None},
+        "vacancy_profile": {"charge_title": "Desarrollador backend", "charge_area": "TI",
+                            "modality": "hybrid", "location": "Quito",
+                            "req_knowledge": ["Python", "SQL", "Docker"],
+                            "req_experience": ["3 años en desarrollo backend"],
+                            "req_education": ["Ingeniería en Sistemas"]},
+    }
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--jobs", type=int, default=50)
+    ap.add_argument("--concurrency", type=int, default=4)
+    ap.add_argument("--scanned-ratio", type=float, default=0.2, help="Fracción de CVs escaneados (ruta OCR).")
+    ap.add_argument("--distinct", type=int, default=None, help="CVs distintos (< jobs ejercita los caches).")
+    ap.add_argument("--llm-latency-ms", type=float, default=500)
+    ap.add_argument("--llm-jitter-ms", type=float, default=100)
+    ap.add_argument("--llm-error-rate", type=float, default=0.0)
+    ap.add_argument("--rate-429", type=float, default=0.0)
+    ap.add_argument("--store-latency-ms", type=float, default=20)
+    ap.add_argument("--database-url", default=None, help="Default: SQLite temporal.")
+    ap.add_argument("--json", dest="json_out", default=None, help="Escribe el reporte en este archivo.")
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args(argv)
+
+    workdir = Path(tempfile.mkdtemp(prefix="scoring-bench-"))
+    llm = FakeLLMServer(latency_ms=args.llm_latency_ms, jitter_ms=args.llm_jitter_ms,
+                        error_rate=args.llm_error_rate, rate_429=args.rate_429, seed=args.seed).start()
+    store = LocalObjectStore(workdir / "store", latency_ms=args.store_latency_ms)
+
+    # La app lee su configuración de entorno al importarse: apuntarla a los dobles locales
+    os.environ["AI_API_BASE"] = llm.base_url
+    os.environ.setdefault("OPENAI_API_KEY", "bench")
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{workdir / 'bench.db'}?timeout=30"
+
+    from app import create_app
+    from app.ext.db import db
+    from app.services.scoring.pipeline import pop_run_counters, pop_stage_timings, process_payload
+
+    app = create_app()
+    logging.getLogger().setLevel(logging.WARNING)
+    with app.app_context():
+        db.create_all()
+
+    paths = build_corpus(workdir / "store", count=args.jobs, scanned_ratio=args.scanned_ratio,
+                         distinct=args.distinct, seed=args.seed)
+    store.start()
+
+    def run_one(i: int, path: Path):
+        with app.app_context():
+            try:
+                process_payload(_payload(i, store.url_for(path)))
+                return pop_stage_timings(), pop_run_counters()
+            finally:
+                db.session.remove()
+
+    samples, counters, errors = [], [], 0
+    t0 = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max(args.concurrency, 1)) as pool:
+        futures = [pool.submit(run_one, i, p) for i, p in enumerate(paths)]
+        for fut in as_completed(futures):
+            try:
+                sample, job_counters = fut.result()
+                samples.append(sample)
+                counters.append(job_counters)
+            except Exception as e:
+                errors += 1
+                print(f"error: {type(e).__name__}: {e}", file=sys.stderr)
+    wall = time.monotonic() - t0
+
+    report = summarize(samples, wall, errors)
+    report["llm"] = dict(llm.stats)
+    report["llm_calls"] = {
+        "n": sum(c.get("llm_calls", 0) for c in counters),
+        "retries": sum(c.get("llm_retries", 0) for c in counters),
+        "rate_wait_ms": sum(c.get("rate_wait_ms", 0) for c in counters),
+    }
+    report["params"] = vars(args)
+    print_report(report)
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(report, indent=2, ensure_ascii=False))
+
+    store.stop()
+    llm.stop()
+    return 0 if not errors else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
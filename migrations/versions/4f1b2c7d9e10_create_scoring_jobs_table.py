@@ -0,0 +1,57 @@
+"""create scoring jobs table
+
+Revision ID: 4f1b2c7d9e10
+Revises: bf602b7ef9d6
+Create Date: 2026-10-18 09:12:31.418220
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4f1b2c7d9e10'
+down_revision = 'bf602b7ef9d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('scoring_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('postulation_id', sa.Integer(), nullable=False),
+    sa.Column('vacancy_id', sa.Integer(), nullable=True),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('status', sa.String(length=16), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('max_attempts', sa.Integer(), nullable=False),
+    sa.Column('locked_by', sa.String(length=128), nullable=True),
+    sa.Column('lease_until', sa.DateTime(), nullable=True),
+    sa.Column('heartbeat_at', sa.DateTime(), nullable=True),
+    sa.Column('run_after', sa.DateTime(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('scoring_jobs', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_scoring_jobs_postulation_id'), ['postulation_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_scoring_jobs_vacancy_id'), ['vacancy_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_scoring_jobs_status'), ['status'], unique=False)
+        batch_op.create_index(batch_op.f('ix_scoring_jobs_lease_until'), ['lease_until'], unique=False)
+        batch_op.create_index(batch_op.f('ix_scoring_jobs_run_after'), ['run_after'], unique=False)
+        batch_op.create_index('ix_scoring_jobs_claim', ['status', 'run_after'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('scoring_jobs', schema=None) as batch_op:
+        batch_op.drop_index('ix_scoring_jobs_claim')
+        batch_op.drop_index(batch_op.f('ix_scoring_jobs_run_after'))
+        batch_op.drop_index(batch_op.f('ix_scoring_jobs_lease_until'))
+        batch_op.drop_index(batch_op.f('ix_scoring_jobs_status'))
+        batch_op.drop_index(batch_op.f('ix_scoring_jobs_vacancy_id'))
+        batch_op.drop_index(batch_op.f('ix_scoring_jobs_postulation_id'))
+
+    op.drop_table('scoring_jobs')
@@ -0,0 +1,36 @@
+"""create cv text cache table
+
+Revision ID: 5a7e3d21c4b8
+Revises: 4f1b2c7d9e10
+Create Date: 2026-10-18 10:02:47.915306
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5a7e3d21c4b8'
+down_revision = '4f1b2c7d9e10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('cv_text_cache',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('pdf_sha256', sa.String(length=64), nullable=False),
+    sa.Column('extractor_version', sa.String(length=32), nullable=False),
+    sa.Column('text', sa.Text(), nullable=False),
+    sa.Column('page_count', sa.Integer(), nullable=False),
+    sa.Column('ocr_pages', sa.JSON(), nullable=False),
+    sa.Column('hits', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('last_used_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('pdf_sha256', 'extractor_version', name='uq_cv_text_cache_sha_version')
+    )
+
+
+def downgrade():
+    op.drop_table('cv_text_cache')
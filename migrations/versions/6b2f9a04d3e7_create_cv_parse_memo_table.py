@@ -0,0 +1,35 @@
+"""create cv parse memo table
+
+Revision ID: 6b2f9a04d3e7
+Revises: 5a7e3d21c4b8
+Create Date: 2026-10-18 10:41:05.227714
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6b2f9a04d3e7'
+down_revision = '5a7e3d21c4b8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('cv_parse_memo',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('text_sha256', sa.String(length=64), nullable=False),
+    sa.Column('model', sa.String(length=64), nullable=False),
+    sa.Column('prompt_version', sa.String(length=32), nullable=False),
+    sa.Column('cv_json', sa.JSON(), nullable=False),
+    sa.Column('hits', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('last_used_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('text_sha256', 'model', 'prompt_version', name='uq_cv_parse_memo_key')
+    )
+
+
+def downgrade():
+    op.drop_table('cv_parse_memo')
@@ -0,0 +1,30 @@
+"""create llm rate buckets table
+
+Revision ID: 7c3d1e58f2a9
+Revises: 6b2f9a04d3e7
+Create Date: 2026-10-18 11:20:13.604381
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c3d1e58f2a9'
+down_revision = '6b2f9a04d3e7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('llm_rate_buckets',
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('req_level', sa.Float(), nullable=False),
+    sa.Column('tok_level', sa.Float(), nullable=False),
+    sa.Column('refilled_at', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade():
+    op.drop_table('llm_rate_buckets')
@@ -0,0 +1,58 @@
+"""ai result status and latest indexes
+
+Revision ID: 8d4e2a6b1f03
+Revises: 7c3d1e58f2a9
+Create Date: 2026-10-18 12:41:57.203114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d4e2a6b1f03'
+down_revision = '7c3d1e58f2a9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('postulation_ai_results', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('status', sa.String(length=16), server_default='succeeded', nullable=False))
+        batch_op.add_column(sa.Column('error', sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column('job_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('attempts', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('pipeline_version', sa.String(length=128), nullable=True))
+        batch_op.add_column(sa.Column('started_at', sa.DateTime(), nullable=True))
+        batch_op.alter_column('score', existing_type=sa.Integer(), nullable=True)
+        batch_op.alter_column('feedback', existing_type=sa.Text(), nullable=True)
+        batch_op.create_index('ix_postulation_ai_results_latest', ['postulation_id', sa.text('created_at DESC')], unique=False)
+
+    # Fallos históricos (score=0, feedback "Error: ...") fuera de la distribución de puntajes
+    op.execute(
+        "UPDATE postulation_ai_results "
+        "SET status = 'failed', error = substr(feedback, 8), score = NULL "
+        "WHERE feedback LIKE 'Error:%'"
+    )
+
+    with op.batch_alter_table('scoring_jobs', schema=None) as batch_op:
+        batch_op.create_index('ix_scoring_jobs_latest', ['postulation_id', sa.text('created_at DESC')], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('scoring_jobs', schema=None) as batch_op:
+        batch_op.drop_index('ix_scoring_jobs_latest')
+
+    op.execute("UPDATE postulation_ai_results SET score = 0 WHERE score IS NULL")
+    op.execute("UPDATE postulation_ai_results SET feedback = '' WHERE feedback IS NULL")
+
+    with op.batch_alter_table('postulation_ai_results', schema=None) as batch_op:
+        batch_op.drop_index('ix_postulation_ai_results_latest')
+        batch_op.alter_column('feedback', existing_type=sa.Text(), nullable=False)
+        batch_op.alter_column('score', existing_type=sa.Integer(), nullable=False)
+        batch_op.drop_column('started_at')
+        batch_op.drop_column('pipeline_version')
+        batch_op.drop_column('attempts')
+        batch_op.drop_column('job_id')
+        batch_op.drop_column('error')
+        batch_op.drop_column('status')
@@ -0,0 +1,49 @@
+"""create scoring batches table
+
+Revision ID: 9e5f3b7c2a14
+Revises: 8d4e2a6b1f03
+Create Date: 2026-10-18 13:27:40.912655
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9e5f3b7c2a14'
+down_revision = '8d4e2a6b1f03'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('scoring_batches',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('vacancy_id', sa.Integer(), nullable=True),
+    sa.Column('kind', sa.String(length=32), nullable=False),
+    sa.Column('filters', sa.JSON(), nullable=True),
+    sa.Column('max_concurrency', sa.Integer(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.Column('created_by', sa.String(length=128), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('scoring_batches', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_scoring_batches_vacancy_id'), ['vacancy_id'], unique=False)
+
+    with op.batch_alter_table('scoring_jobs', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('batch_id', sa.Integer(), nullable=True))
+        batch_op.create_index(batch_op.f('ix_scoring_jobs_batch_id'), ['batch_id'], unique=False)
+        batch_op.create_foreign_key('fk_scoring_jobs_batch_id', 'scoring_batches', ['batch_id'], ['id'], ondelete='SET NULL')
+
+
+def downgrade():
+    with op.batch_alter_table('scoring_jobs', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_scoring_jobs_batch_id', type_='foreignkey')
+        batch_op.drop_index(batch_op.f('ix_scoring_jobs_batch_id'))
+        batch_op.drop_column('batch_id')
+
+    with op.batch_alter_table('scoring_batches', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_scoring_batches_vacancy_id'))
+
+    op.drop_table('scoring_batches')
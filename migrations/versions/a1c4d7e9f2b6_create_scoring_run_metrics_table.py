@@ -0,0 +1,65 @@
+"""create scoring run metrics table
+
+Revision ID: a1c4d7e9f2b6
+Revises: 9e5f3b7c2a14
+Create Date: 2026-10-18 14:05:12.308417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a1c4d7e9f2b6'
+down_revision = '9e5f3b7c2a14'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('scoring_run_metrics',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('postulation_id', sa.Integer(), nullable=True),
+    sa.Column('vacancy_id', sa.Integer(), nullable=True),
+    sa.Column('job_id', sa.Integer(), nullable=True),
+    sa.Column('attempt', sa.Integer(), nullable=True),
+    sa.Column('status', sa.String(length=16), nullable=False),
+    sa.Column('error', sa.String(length=255), nullable=True),
+    sa.Column('fetch_ms', sa.Integer(), nullable=True),
+    sa.Column('extract_ms', sa.Integer(), nullable=True),
+    sa.Column('ocr_ms', sa.Integer(), nullable=True),
+    sa.Column('prescreen_ms', sa.Integer(), nullable=True),
+    sa.Column('summarize_ms', sa.Integer(), nullable=True),
+    sa.Column('score_ms', sa.Integer(), nullable=True),
+    sa.Column('persist_ms', sa.Integer(), nullable=True),
+    sa.Column('total_ms', sa.Integer(), nullable=False),
+    sa.Column('page_count', sa.Integer(), nullable=True),
+    sa.Column('ocr_pages', sa.Integer(), nullable=False),
+    sa.Column('text_cache_hit', sa.Boolean(), nullable=False),
+    sa.Column('parse_cache_hit', sa.Boolean(), nullable=False),
+    sa.Column('summarize_prompt_tokens', sa.Integer(), nullable=False),
+    sa.Column('summarize_completion_tokens', sa.Integer(), nullable=False),
+    sa.Column('score_prompt_tokens', sa.Integer(), nullable=False),
+    sa.Column('score_completion_tokens', sa.Integer(), nullable=False),
+    sa.Column('llm_calls', sa.Integer(), nullable=False),
+    sa.Column('llm_retries', sa.Integer(), nullable=False),
+    sa.Column('rate_wait_ms', sa.Integer(), nullable=False),
+    sa.Column('cost_usd', sa.Float(), nullable=False),
+    sa.Column('model', sa.String(length=64), nullable=True),
+    sa.Column('pipeline_version', sa.String(length=128), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('scoring_run_metrics', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_scoring_run_metrics_postulation_id'), ['postulation_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_scoring_run_metrics_created_at'), ['created_at'], unique=False)
+        batch_op.create_index('ix_scoring_run_metrics_vacancy_created', ['vacancy_id', 'created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('scoring_run_metrics', schema=None) as batch_op:
+        batch_op.drop_index('ix_scoring_run_metrics_vacancy_created')
+        batch_op.drop_index(batch_op.f('ix_scoring_run_metrics_created_at'))
+        batch_op.drop_index(batch_op.f('ix_scoring_run_metrics_postulation_id'))
+
+    op.drop_table('scoring_run_metrics')
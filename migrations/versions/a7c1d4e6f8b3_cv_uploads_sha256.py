@@ -0,0 +1,28 @@
+"""cv uploads sha256
+
+Revision ID: a7c1d4e6f8b3
+Revises: f6b9c3d5e7a2
+Create Date: 2026-10-18 18:02:19.574630
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c1d4e6f8b3'
+down_revision = 'f6b9c3d5e7a2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('cv_uploads', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('sha256', sa.String(length=64), nullable=True))
+        batch_op.create_index(batch_op.f('ix_cv_uploads_sha256'), ['sha256'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('cv_uploads', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_cv_uploads_sha256'))
+        batch_op.drop_column('sha256')
@@ -0,0 +1,33 @@
+"""create llm circuit breakers table
+
+Revision ID: b2d5e8f1a3c7
+Revises: a1c4d7e9f2b6
+Create Date: 2026-10-18 14:48:31.552190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b2d5e8f1a3c7'
+down_revision = 'a1c4d7e9f2b6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('llm_circuit_breakers',
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('state', sa.String(length=16), nullable=False),
+    sa.Column('failures', sa.Integer(), nullable=False),
+    sa.Column('opened_at', sa.Float(), nullable=True),
+    sa.Column('retry_at', sa.Float(), nullable=True),
+    sa.Column('last_error', sa.String(length=255), nullable=True),
+    sa.Column('updated_at', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade():
+    op.drop_table('llm_circuit_breakers')
@@ -0,0 +1,29 @@
+"""scoring jobs kind
+
+Revision ID: b8d2e5f7a9c4
+Revises: a7c1d4e6f8b3
+Create Date: 2026-10-18 18:40:05.916382
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8d2e5f7a9c4'
+down_revision = 'a7c1d4e6f8b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('scoring_jobs', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('kind', sa.String(length=16), server_default='score', nullable=False))
+        batch_op.alter_column('postulation_id', existing_type=sa.Integer(), nullable=True)
+
+
+def downgrade():
+    op.execute("DELETE FROM scoring_jobs WHERE postulation_id IS NULL")
+    with op.batch_alter_table('scoring_jobs', schema=None) as batch_op:
+        batch_op.alter_column('postulation_id', existing_type=sa.Integer(), nullable=False)
+        batch_op.drop_column('kind')
@@ -0,0 +1,26 @@
+"""scoring batches skipped
+
+Revision ID: c3e6f8a1b2d5
+Revises: b8d2e5f7a9c4
+Create Date: 2026-10-18 21:05:12.374410
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3e6f8a1b2d5'
+down_revision = 'b8d2e5f7a9c4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('scoring_batches', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('skipped', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('scoring_batches', schema=None) as batch_op:
+        batch_op.drop_column('skipped')
@@ -0,0 +1,35 @@
+"""scoring jobs applicant id
+
+Revision ID: c3e6f9a2b4d8
+Revises: b2d5e8f1a3c7
+Create Date: 2026-10-18 15:20:44.718306
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3e6f9a2b4d8'
+down_revision = 'b2d5e8f1a3c7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('scoring_jobs', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('applicant_id', sa.Integer(), nullable=True))
+        batch_op.create_index(batch_op.f('ix_scoring_jobs_applicant_id'), ['applicant_id'], unique=False)
+
+    # Solo los jobs pendientes: los terminados no se vuelven a agrupar
+    op.execute(
+        "UPDATE scoring_jobs SET applicant_id = "
+        "(SELECT postulation.applicant_id FROM postulation WHERE postulation.id = scoring_jobs.postulation_id) "
+        "WHERE status IN ('queued', 'running')"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('scoring_jobs', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_scoring_jobs_applicant_id'))
+        batch_op.drop_column('applicant_id')
@@ -0,0 +1,64 @@
+"""cv minhash lsh index
+
+Revision ID: d4f7a1b3c5e9
+Revises: c3e6f9a2b4d8
+Create Date: 2026-10-18 16:05:12.381904
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4f7a1b3c5e9'
+down_revision = 'c3e6f9a2b4d8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('cv_minhashes',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('text_sha256', sa.String(length=64), nullable=False),
+    sa.Column('signature', sa.LargeBinary(), nullable=False),
+    sa.Column('shingle_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('text_sha256')
+    )
+    op.create_table('cv_lsh_buckets',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('band', sa.SmallInteger(), nullable=False),
+    sa.Column('bucket', sa.String(length=16), nullable=False),
+    sa.Column('text_sha256', sa.String(length=64), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('text_sha256', 'band', name='uq_cv_lsh_buckets_text_band')
+    )
+    with op.batch_alter_table('cv_lsh_buckets', schema=None) as batch_op:
+        batch_op.create_index('ix_cv_lsh_buckets_band_bucket', ['band', 'bucket'], unique=False)
+
+    op.create_table('postulation_cv_texts',
+    sa.Column('postulation_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('vacancy_id', sa.Integer(), nullable=True),
+    sa.Column('applicant_id', sa.Integer(), nullable=True),
+    sa.Column('text_sha256', sa.String(length=64), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('postulation_id')
+    )
+    with op.batch_alter_table('postulation_cv_texts', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_postulation_cv_texts_text_sha256'), ['text_sha256'], unique=False)
+        batch_op.create_index(batch_op.f('ix_postulation_cv_texts_vacancy_id'), ['vacancy_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('postulation_cv_texts', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_postulation_cv_texts_vacancy_id'))
+        batch_op.drop_index(batch_op.f('ix_postulation_cv_texts_text_sha256'))
+
+    op.drop_table('postulation_cv_texts')
+    with op.batch_alter_table('cv_lsh_buckets', schema=None) as batch_op:
+        batch_op.drop_index('ix_cv_lsh_buckets_band_bucket')
+
+    op.drop_table('cv_lsh_buckets')
+    op.drop_table('cv_minhashes')
@@ -0,0 +1,37 @@
+"""postulation skill scans
+
+Revision ID: d7a9b1c3e5f2
+Revises: c3e6f8a1b2d5
+Create Date: 2026-10-18 21:32:48.610257
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7a9b1c3e5f2'
+down_revision = 'c3e6f8a1b2d5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('postulation_skill_scans',
+    sa.Column('postulation_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('text_sha256', sa.String(length=64), nullable=False),
+    sa.Column('catalog_version', sa.String(length=64), nullable=False),
+    sa.Column('skills_found', sa.Integer(), nullable=False),
+    sa.Column('scanned_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('postulation_id')
+    )
+    # Marca de los escaneos con evidencia ya guardada (una fila por postulación)
+    op.execute(
+        "INSERT INTO postulation_skill_scans (postulation_id, text_sha256, catalog_version, skills_found, scanned_at) "
+        "SELECT postulation_id, MIN(text_sha256), MIN(catalog_version), COUNT(*), MAX(created_at) "
+        "FROM postulation_skill_evidence GROUP BY postulation_id"
+    )
+
+
+def downgrade():
+    op.drop_table('postulation_skill_scans')
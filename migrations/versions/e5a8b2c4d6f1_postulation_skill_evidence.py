@@ -0,0 +1,44 @@
+"""postulation skill evidence
+
+Revision ID: e5a8b2c4d6f1
+Revises: d4f7a1b3c5e9
+Create Date: 2026-10-18 16:48:37.205113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a8b2c4d6f1'
+down_revision = 'd4f7a1b3c5e9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('postulation_skill_evidence',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('postulation_id', sa.Integer(), nullable=False),
+    sa.Column('vacancy_id', sa.Integer(), nullable=True),
+    sa.Column('skill_id', sa.Integer(), nullable=False),
+    sa.Column('required', sa.Boolean(), nullable=False),
+    sa.Column('hits', sa.Integer(), nullable=False),
+    sa.Column('positions', sa.JSON(), nullable=False),
+    sa.Column('snippet', sa.String(length=255), nullable=True),
+    sa.Column('text_sha256', sa.String(length=64), nullable=False),
+    sa.Column('catalog_version', sa.String(length=64), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['skill_id'], ['skills.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('postulation_id', 'skill_id', name='uq_postulation_skill_evidence')
+    )
+    with op.batch_alter_table('postulation_skill_evidence', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_postulation_skill_evidence_postulation_id'), ['postulation_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('postulation_skill_evidence', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_postulation_skill_evidence_postulation_id'))
+
+    op.drop_table('postulation_skill_evidence')
@@ -0,0 +1,43 @@
+"""cv uploads
+
+Revision ID: f6b9c3d5e7a2
+Revises: e5a8b2c4d6f1
+Create Date: 2026-10-18 17:26:51.640217
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f6b9c3d5e7a2'
+down_revision = 'e5a8b2c4d6f1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('cv_uploads',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('key', sa.String(length=512), nullable=False),
+    sa.Column('applicant_id', sa.Integer(), nullable=False),
+    sa.Column('vacancy_id', sa.Integer(), nullable=True),
+    sa.Column('filename', sa.String(length=255), nullable=True),
+    sa.Column('content_type', sa.String(length=100), nullable=False),
+    sa.Column('status', sa.String(length=16), nullable=False),
+    sa.Column('size_bytes', sa.Integer(), nullable=True),
+    sa.Column('etag', sa.String(length=128), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('key')
+    )
+    with op.batch_alter_table('cv_uploads', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_cv_uploads_applicant_id'), ['applicant_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('cv_uploads', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_cv_uploads_applicant_id'))
+
+    op.drop_table('cv_uploads')
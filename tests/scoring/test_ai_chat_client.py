@@ -0,0 +1,108 @@
+# tests/scoring/test_ai_chat_client.py
+import pytest
+import requests
+
+from app.ext import ai_scorer
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, payload=None, headers=None):
+        self.status_code = status_code
+        self.reason = "X"
+        self.headers = headers or {}
+        self._payload = payload or {}
+        self.text = str(self._payload)
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def post(self, url, **kwargs):
+        self.calls.append(kwargs)
+        item = self.responses.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+def _ok(content='{"score": 80}'):
+    return FakeResponse(200, {
+        "choices": [{"message": {"content": content}}],
+        "usage": {"prompt_tokens": 120, "completion_tokens": 30, "total_tokens": 150},
+    })
+
+
+@pytest.fixture()
+def sleeps(monkeypatch):
+    waits = []
+    monkeypatch.setattr(ai_scorer, "OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(ai_scorer.time, "sleep", waits.append)
+    ai_scorer.pop_call_stats()
+    return waits
+
+
+def _use(monkeypatch, responses):
+    session = FakeSession(responses)
+    monkeypatch.setattr(ai_scorer, "_session", session)
+    return session
+
+
+def test_success_records_latency_and_usage(monkeypatch, sleeps):
+    session = _use(monkeypatch, [_ok()])
+    assert ai_scorer._post_chat([{"role": "user", "content": "hola"}]) == '{"score": 80}'
+    assert session.calls[0]["timeout"] == (ai_scorer.AI_CONNECT_TIMEOUT, ai_scorer.AI_READ_TIMEOUT)
+    (stats,) = ai_scorer.pop_call_stats()
+    assert stats["attempts"] == 1
+    assert stats["prompt_tokens"] == 120 and stats["completion_tokens"] == 30
+    assert sleeps == []
+
+
+def test_429_honors_retry_after(monkeypatch, sleeps):
+    _use(monkeypatch, [FakeResponse(429, headers={"Retry-After": "7"}), _ok()])
+    ai_scorer._post_chat([{"role": "user", "content": "x"}])
+    assert len(sleeps) == 1
+    assert 7 <= sleeps[0] <= 7.25
+    assert ai_scorer.pop_call_stats()[0]["attempts"] == 2
+
+
+def test_non_retryable_4xx_fails_fast(monkeypatch, sleeps):
+    session = _use(monkeypatch, [FakeResponse(400, {"error": "bad"}), _ok()])
+    with pytest.raises(ai_scorer.ChatAPIError) as exc:
+        ai_scorer._post_chat([{"role": "user", "content": "x"}])
+    assert exc.value.status_code == 400
+    assert len(session.calls) == 1
+    assert sleeps == []
+
+
+def test_network_errors_and_5xx_retry_with_jitter_and_no_trailing_sleep(monkeypatch, sleeps):
+    _use(monkeypatch, [requests.ConnectionError("reset"), FakeResponse(503), FakeResponse(502)])
+    with pytest.raises(ai_scorer.ChatAPIError):
+        ai_scorer._post_chat([{"role": "user", "content": "x"}], retries=3, backoff=2)
+    assert len(sleeps) == 2
+    assert 1 <= sleeps[0] <= 2 and 2 <= sleeps[1] <= 4
+
+
+def test_body_cut_mid_stream_is_retried(monkeypatch, sleeps):
+    session = _use(monkeypatch, [requests.exceptions.ChunkedEncodingError("Connection broken"), _ok()])
+    assert ai_scorer._post_chat([{"role": "user", "content": "x"}], retries=3) == '{"score": 80}'
+    assert len(session.calls) == 2 and len(sleeps) == 1
+
+
+def test_malformed_200_body_is_retried_and_recorded(monkeypatch, sleeps):
+    failures = []
+    monkeypatch.setattr(ai_scorer.llm_breaker, "record_failure", failures.append)
+    session = _use(monkeypatch, [FakeResponse(200, {"error": "sin choices"}), FakeResponse(200, {"choices": []}),
+                                 _ok()])
+    assert ai_scorer._post_chat([{"role": "user", "content": "x"}], retries=3) == '{"score": 80}'
+    assert len(session.calls) == 3 and len(sleeps) == 2 and len(failures) == 2
+
+    _use(monkeypatch, [FakeResponse(200, {"choices": None})])
+    with pytest.raises(ai_scorer.ChatAPIError):
+        ai_scorer._post_chat([{"role": "user", "content": "x"}], retries=1)
+    stats = ai_scorer.pop_call_stats()
+    assert "respuesta inválida" in stats[-1]["error"]
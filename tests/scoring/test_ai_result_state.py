@@ -0,0 +1,66 @@
+# tests/scoring/test_ai_result_state.py
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.ext.db import db
+from app.repositories.ai_result_repo import AIResultRepository
+from app.repositories.scoring_job_repo import ScoringJobRepository
+from app.services.scoring.pipeline import PIPELINE_VERSION, record_failure, save_result
+
+
+@pytest.fixture()
+def repos(app_ctx):
+    return AIResultRepository(), ScoringJobRepository()
+
+
+def _pid() -> int:
+    return int(uuid4().int % 1_000_000) + 2_000_000
+
+
+def test_state_transitions(repos):
+    results, jobs = repos
+    pid = _pid()
+    assert results.state(pid)["status"] == "not_enqueued"
+
+    job = jobs.enqueue(postulation_id=pid, vacancy_id=5, payload={})
+    db.session.commit()
+    assert results.state(pid)["status"] == "queued"
+
+    job.status, job.attempts = "running", 1
+    db.session.commit()
+    assert results.state(pid)["status"] == "running"
+
+    job.status = "succeeded"
+    save_result(pid, 5, 80, "ok", job={"job_id": job.id, "attempts": 1,
+                                      "started_at": datetime.utcnow().isoformat()})
+    state = results.state(pid)
+    assert state["status"] == "succeeded" and state["score"] == 80
+    assert state["job_id"] == job.id and state["pipeline_version"] == PIPELINE_VERSION
+
+
+def test_history_is_append_only_and_latest_wins(repos):
+    results, _ = repos
+    pid = _pid()
+    save_result(pid, None, 50, "primera")
+    record_failure(pid, None, RuntimeError("timeout"))
+    state = results.state(pid)
+    assert state["status"] == "failed" and state["score"] is None
+    assert state["error"] == "timeout"
+    assert results.latest(pid).feedback == "Error: timeout"
+
+
+def test_states_for_many_postulations(repos):
+    results, jobs = repos
+    a, b, c = _pid(), _pid() + 1, _pid() + 2
+    save_result(a, None, 30, "v1")
+    save_result(a, None, 90, "v2")
+    jobs.enqueue(postulation_id=b, vacancy_id=None, payload={},
+                 run_after=datetime.utcnow() + timedelta(hours=1))
+    db.session.commit()
+
+    states = results.states([a, b, c])
+    assert states[a]["score"] == 90
+    assert states[b]["status"] == "queued"
+    assert states[c]["status"] == "not_enqueued"
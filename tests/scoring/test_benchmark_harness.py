@@ -0,0 +1,54 @@
+# tests/scoring/test_benchmark_harness.py
+import io
+
+import pdfplumber
+import pytest
+import requests
+
+from benchmarks.corpus import cv_lines, scanned_pdf, text_pdf
+from benchmarks.fake_llm import FakeLLMServer
+from benchmarks.run_pipeline import percentile
+
+
+@pytest.fixture()
+def llm():
+    srv = FakeLLMServer(latency_ms=0, jitter_ms=0, seed=1).start()
+    yield srv
+    srv.stop()
+
+
+def _chat(srv, system):
+    return requests.post(f"{srv.base_url}/chat/completions", json={
+        "model": "x", "messages": [{"role": "system", "content": system}, {"role": "user", "content": "cv"}],
+    }, timeout=5)
+
+
+def test_fake_llm_answers_parser_and_scoring(llm):
+    parsed = _chat(llm, "Eres un estricto PARSER de currículums.").json()
+    assert "habilidades" in parsed["choices"][0]["message"]["content"]
+    scored = _chat(llm, "Eres un evaluador de RRHH.").json()
+    assert '"score"' in scored["choices"][0]["message"]["content"]
+    assert scored["usage"]["total_tokens"] > 0
+
+
+def test_fake_llm_injects_429_with_retry_after(llm):
+    llm.rate_429 = 1.0
+    r = _chat(llm, "x")
+    assert r.status_code == 429 and float(r.headers["Retry-After"]) > 0
+    assert llm.stats["429"] == 1
+
+
+def test_corpus_text_vs_scanned():
+    import random
+    lines = cv_lines(3, random.Random(0))
+    with pdfplumber.open(io.BytesIO(text_pdf(lines))) as pdf:
+        assert "HABILIDADES" in pdf.pages[0].extract_text()
+    with pdfplumber.open(io.BytesIO(scanned_pdf(lines))) as pdf:
+        assert not (pdf.pages[0].extract_text() or "").strip()
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 95) == 0.0
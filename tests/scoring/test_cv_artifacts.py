@@ -0,0 +1,87 @@
+# tests/scoring/test_cv_artifacts.py
+from uuid import uuid4
+
+from app.ext.db import db
+from app.models.cv_text_cache import CVTextCache
+from app.services.scoring import pipeline
+
+
+def test_second_extraction_of_same_bytes_is_a_cache_hit(app_ctx, monkeypatch):
+    calls = []
+
+    def fake_extract(path):
+        calls.append(path)
+        return {"text": "Python SQL", "page_count": 2, "ocr_pages": [False, True]}
+
+    monkeypatch.setattr(pipeline, "extract_pdf", fake_extract)
+    data = b"%PDF-1.4 " + uuid4().bytes
+
+    assert pipeline.extract_cv_text(data) == "Python SQL"
+    assert pipeline.extract_cv_text(data) == "Python SQL"
+    assert len(calls) == 1
+
+    row = CVTextCache.query.filter_by(extractor_version=pipeline.EXTRACTOR_VERSION).filter(
+        CVTextCache.text == "Python SQL"
+    ).first()
+    assert row.page_count == 2
+    assert row.ocr_pages == [False, True]
+    assert row.hits == 1
+
+
+def test_new_extractor_version_misses(app_ctx, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        pipeline, "extract_pdf",
+        lambda path: calls.append(path) or {"text": "x", "page_count": 1, "ocr_pages": [False]},
+    )
+    data = b"%PDF-1.4 " + uuid4().bytes
+
+    pipeline.extract_cv_text(data)
+    monkeypatch.setattr(pipeline, "EXTRACTOR_VERSION", "otra-version")
+    pipeline.extract_cv_text(data)
+    assert len(calls) == 2
+    db.session.rollback()
+
+
+def test_failed_ocr_is_not_cached(app_ctx, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        pipeline, "extract_pdf",
+        lambda path: calls.append(path) or {"text": "", "page_count": 1, "ocr_pages": [False],
+                                            "ocr_skipped": 0, "ocr_failed": 1},
+    )
+    data = b"%PDF-1.4 " + uuid4().bytes
+
+    pipeline.extract_cv_text(data)
+    pipeline.extract_cv_text(data)
+    # Falla transitoria de OCR: se vuelve a extraer, no queda cacheado el texto vacío
+    assert len(calls) == 2
+
+
+def test_summarize_is_memoized_by_normalized_text(app_ctx, monkeypatch):
+    calls = []
+
+    def fake_summarize(text):
+        calls.append(text)
+        return {"habilidades": ["python"], "experiencia": []}
+
+    monkeypatch.setattr(pipeline, "summarize_cv_to_json", fake_summarize)
+    text = f"Ana {uuid4().hex}\nSKILLS python"
+
+    first = pipeline.summarize_cv_cached(text)
+    # Mismo texto tras normalizar (espacios colapsados) -> hit
+    second = pipeline.summarize_cv_cached(text.replace(" ", "   "))
+    assert first == second == {"habilidades": ["python"], "experiencia": []}
+    assert len(calls) == 1
+
+
+def test_invalid_parser_output_is_not_memoized(app_ctx, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        pipeline, "summarize_cv_to_json",
+        lambda text: calls.append(text) or {"habilidades": [], "_raw": text},
+    )
+    text = f"cv roto {uuid4().hex}"
+    pipeline.summarize_cv_cached(text)
+    pipeline.summarize_cv_cached(text)
+    assert len(calls) == 2
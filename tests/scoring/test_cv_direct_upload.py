@@ -0,0 +1,89 @@
+# tests/scoring/test_cv_direct_upload.py
+import base64
+import json
+import random
+
+import boto3
+import pytest
+
+from app.ext import s3
+from app.models.cv_upload import CVUpload
+from app.services import cv_uploads
+from app.services.cv_uploads import CVUploadError
+
+
+@pytest.fixture()
+def signer(monkeypatch):
+    client = boto3.client("s3", aws_access_key_id="AKIATEST", aws_secret_access_key="secret",
+                          region_name="us-east-2")
+    monkeypatch.setattr(s3, "s3_client", client)
+    monkeypatch.setattr(s3, "AWS_BUCKET", "cvs-test")
+    return client
+
+
+@pytest.fixture()
+def fake_object(monkeypatch):
+    state = {"head": None, "prefix": b"%PDF-1.7", "deleted": []}
+    monkeypatch.setattr(cv_uploads, "head_cv_key", lambda key: state["head"])
+    monkeypatch.setattr(cv_uploads, "read_cv_prefix", lambda key, n: state["prefix"][:n])
+    monkeypatch.setattr(cv_uploads, "delete_cv_key", lambda key: state["deleted"].append(key))
+    return state
+
+
+def _applicant():
+    return random.randint(10_000_000, 90_000_000)
+
+
+def test_presigned_post_is_scoped_to_key_type_and_size(app_ctx, signer):
+    applicant_id = _applicant()
+    out = cv_uploads.presign_cv_upload(applicant_id=applicant_id, vacancy_id=7, filename="Mi CV.pdf")
+
+    assert out["key"].startswith(f"curriculums/vacancy_7/applicant_{applicant_id}_")
+    assert out["fields"]["key"] == out["key"] and out["fields"]["Content-Type"] == "application/pdf"
+    policy = json.loads(base64.b64decode(out["fields"]["policy"]))
+    assert ["content-length-range", 1, s3.CV_MAX_BYTES] in policy["conditions"]
+    assert {"Content-Type": "application/pdf"} in policy["conditions"]
+    assert {"key": out["key"]} in policy["conditions"]
+
+    row = CVUpload.query.filter_by(key=out["key"]).one()
+    assert (row.applicant_id, row.status) == (applicant_id, "pending")
+
+    # Mismo postulante, vacante y archivo en el mismo segundo: clave distinta
+    again = cv_uploads.presign_cv_upload(applicant_id=applicant_id, vacancy_id=7, filename="Mi CV.pdf")
+    assert again["key"] != out["key"] and again["key"].endswith("_Mi_CV.pdf")
+
+    with pytest.raises(CVUploadError):
+        cv_uploads.presign_cv_upload(applicant_id=applicant_id, vacancy_id=None, filename="cv.docx")
+    with pytest.raises(CVUploadError):
+        cv_uploads.presign_cv_upload(applicant_id=applicant_id, vacancy_id=None, filename="cv.pdf",
+                                     size=s3.CV_MAX_BYTES + 1)
+
+
+def test_complete_verifies_object_with_head(app_ctx, signer, fake_object):
+    applicant_id = _applicant()
+    key = cv_uploads.presign_cv_upload(applicant_id=applicant_id, vacancy_id=None, filename="cv.pdf")["key"]
+
+    with pytest.raises(CVUploadError) as other:
+        cv_uploads.complete_cv_upload(applicant_id=applicant_id + 1, key=key)
+    assert other.value.status == 404
+    with pytest.raises(CVUploadError) as missing:
+        cv_uploads.complete_cv_upload(applicant_id=applicant_id, key=key)
+    assert missing.value.status == 409
+
+    fake_object["head"] = {"size": 1200, "content_type": "application/pdf", "etag": "abc"}
+    row = cv_uploads.complete_cv_upload(applicant_id=applicant_id, key=key)
+    assert (row.status, row.size_bytes, row.etag) == ("uploaded", 1200, "abc")
+    assert row.completed_at is not None
+    assert cv_uploads.upload_payload(row)["key"] == key
+
+
+def test_complete_rejects_and_deletes_non_pdf(app_ctx, signer, fake_object):
+    applicant_id = _applicant()
+    key = cv_uploads.presign_cv_upload(applicant_id=applicant_id, vacancy_id=None, filename="cv.pdf")["key"]
+    fake_object["head"] = {"size": 900, "content_type": "application/pdf", "etag": "x"}
+    fake_object["prefix"] = b"PK\x03\x04zip"
+
+    with pytest.raises(CVUploadError):
+        cv_uploads.complete_cv_upload(applicant_id=applicant_id, key=key)
+    assert fake_object["deleted"] == [key]
+    assert CVUpload.query.filter_by(key=key).one().status == "pending"
@@ -0,0 +1,54 @@
+# tests/scoring/test_cv_fetch.py
+import pytest
+
+from app.services.scoring import pipeline
+
+
+class FakeBody:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.closed = False
+
+    def iter_chunks(self, chunk_size):
+        for i in range(0, len(self.data), chunk_size):
+            yield self.data[i:i + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+class FakeS3:
+    def __init__(self, data):
+        self.body = FakeBody(data)
+        self.calls = []
+
+    def get_object(self, Bucket, Key):
+        self.calls.append((Bucket, Key))
+        return {"Body": self.body}
+
+
+def test_s3_body_is_streamed_to_memory(monkeypatch):
+    data = b"%PDF-1.4 " + b"x" * 600_000
+    fake = FakeS3(data)
+    monkeypatch.setattr(pipeline, "s3_client", fake)
+
+    out = pipeline.fetch_cv_bytes({"storage": "s3", "s3_bucket": "b", "s3_key": "curriculums/k.pdf"})
+    assert out == data
+    assert fake.calls == [("b", "curriculums/k.pdf")]
+    assert fake.body.closed
+
+
+def test_oversized_body_is_rejected():
+    with pytest.raises(RuntimeError):
+        pipeline._read_stream(FakeBody(b"x" * 2048).iter_chunks(256), limit=1024)
+
+
+def test_extraction_receives_bytes_not_a_path(app_ctx, monkeypatch):
+    seen = []
+    monkeypatch.setattr(
+        pipeline, "extract_pdf",
+        lambda src: seen.append(src) or {"text": "t", "page_count": 1, "ocr_pages": [False]},
+    )
+    payload = b"%PDF-1.4 bytes-en-memoria-unicos-006"
+    pipeline.extract_cv_text(payload)
+    assert seen == [payload]
@@ -0,0 +1,77 @@
+# tests/scoring/test_cv_heuristics.py
+import json
+
+from app.ext import ai_scorer
+from app.ext.ai_scorer import _normalize_cv_text
+from app.ext.cv_heuristics import extract_local, split_sections
+
+CV = """Juan Pérez
+Quito, Ecuador
+Email: Juan.Perez@gmail.com | Tel: +593 99 123 4567
+linkedin.com/in/juanperez  https://github.com/jperez
+Cédula 1712345678
+EXPERIENCIA
+Acme 2019 - 2021 Desarrollador backend
+HABILIDADES
+Python, SQL
+CERTIFICADOS
+AWS https://aws.amazon.com/verify/123
+REFERENCIAS
+Ana Gómez ana@acme.com 099 888 7777
+"""
+
+
+def test_extracts_contacts_and_reduces_parser_input():
+    local = extract_local(_normalize_cv_text(CV))
+    assert local.email == "juan.perez@gmail.com"
+    assert local.phone == "+593 99 123 4567"
+    assert local.linkedin == "https://linkedin.com/in/juanperez"
+    assert local.github == "https://github.com/jperez"
+    assert local.sections == ["EXPERIENCIA", "HABILIDADES", "CERTIFICADOS", "REFERENCIAS"]
+
+    # Sin contactos ni referencias; el resto (incluidas fechas y otras URLs) intacto
+    assert "@" not in local.text and "123 4567" not in local.text and "Ana Gómez" not in local.text
+    assert "Email" not in local.text and "linkedin" not in local.text
+    assert "Quito, Ecuador" in local.text and "2019 - 2021" in local.text
+    assert "https://aws.amazon.com/verify/123" in local.text
+
+
+def test_unlabelled_id_numbers_are_not_phones():
+    assert extract_local("Ana\nCédula 1712345678\n2018 - 2020 Acme").phone is None
+    assert extract_local("Ana\nCelular: 0991234567").phone == "0991234567"
+
+
+def test_split_sections_keeps_header_block():
+    parts = split_sections(_normalize_cv_text("Ana\nEXPERIENCIA\nAcme\nIDIOMAS\nInglés"))
+    assert [h for h, _ in parts] == [None, "EXPERIENCIA", "IDIOMAS"]
+
+
+def test_parser_gets_reduced_text_and_result_is_prefilled(monkeypatch):
+    seen = {}
+
+    def fake_chat(messages, **kw):
+        seen["user"] = messages[1]["content"]
+        return json.dumps({"identidad": {"nombre": "Juan Pérez", "ubicacion": "Quito"},
+                           "experiencia": [], "habilidades": ["Python"]})
+    monkeypatch.setattr(ai_scorer, "_post_chat", fake_chat)
+
+    out = ai_scorer.summarize_cv_to_json(CV)
+    assert "gmail" not in seen["user"]
+    assert out["identidad"] == {"nombre": "Juan Pérez", "email": "juan.perez@gmail.com",
+                                "telefono": "+593 99 123 4567", "ubicacion": "Quito"}
+    assert out["links"] == {"linkedin": "https://linkedin.com/in/juanperez", "github": "https://github.com/jperez"}
+    assert out["habilidades"] == ["Python"]
+
+
+def test_inline_referencias_is_not_dropped():
+    cv = (
+        "Ana Torres\nBIBLIOTECARIA\n"
+        "Manejo de referencias bibliográficas, catalogación MARC21 y Koha.\n"
+        "Atención en sala de lectura\n"
+        "Referencias laborales:\nLuis Paz 099 111 2222\n"
+    )
+    local = extract_local(_normalize_cv_text(cv))
+    assert local.sections == ["REFERENCIAS"]  # solo el encabezado en línea propia
+    assert "catalogación MARC21 y Koha" in local.text
+    assert "Atención en sala de lectura" in local.text
+    assert "Luis Paz" not in local.text
@@ -0,0 +1,121 @@
+# tests/scoring/test_cv_near_duplicates.py
+import random
+from app.ext.ai_scorer import cv_text_fingerprint
+from app.services.scoring import near_duplicates as nd
+from app.services.scoring import pipeline
+
+_VOCAB = ("python sql docker django flask aws linux git api rest backend datos equipo proyecto "
+          "cliente ventas gestion lider analisis reportes soporte redes kubernetes java spring").split()
+
+
+def _cv(seed, words=300):
+    rnd = random.Random(seed)
+    return f"Postulante {seed}\n" + " ".join(rnd.choice(_VOCAB) + str(rnd.randint(0, 99)) for _ in range(words))
+
+
+def _edit(text, every=100):
+    words = text.split(" ")
+    return " ".join(w + "x" if i % every == 0 else w for i, w in enumerate(words))
+
+
+def _ids(n):
+    base = random.randint(10_000_000, 90_000_000)
+    return list(range(base, base + n))
+
+
+def test_signature_estimates_jaccard():
+    a = _cv("firma")
+    sig_a, _ = nd.signature(a)
+    assert nd.estimate_jaccard(sig_a, nd.signature(a)[0]) == 1.0
+    assert nd.estimate_jaccard(sig_a, nd.signature(_edit(a))[0]) > 0.7
+    assert nd.estimate_jaccard(sig_a, nd.signature(_cv("otra-firma"))[0]) < 0.2
+    assert len(nd.band_buckets(sig_a)) == nd.BANDS
+    assert nd.signature("  ") is None
+
+
+def test_similar_postulations_and_duplicate_clusters(app_ctx):
+    vacancy_id, other_vacancy = _ids(2)
+    p1, p2, p3, p4, p5 = _ids(5)
+    # Semillas fijas: LSH es probabilístico y el test debe ser reproducible
+    template = _cv("plantilla")
+    nd.index_cv_text(template, postulation_id=p1, vacancy_id=vacancy_id, applicant_id=1)
+    nd.index_cv_text(template, postulation_id=p2, vacancy_id=other_vacancy, applicant_id=2)
+    nd.index_cv_text(_edit(template), postulation_id=p3, vacancy_id=vacancy_id, applicant_id=3)
+    nd.index_cv_text(_cv("distinto"), postulation_id=p4, vacancy_id=vacancy_id, applicant_id=4)
+    nd.index_cv_text(_edit(template, every=80), postulation_id=p5, vacancy_id=vacancy_id, applicant_id=5)
+
+    items = nd.similar_postulations(p1, threshold=0.7, limit=10)
+    assert [i["postulation_id"] for i in items][:1] == [p2]
+    assert items[0]["exact"] is True and items[0]["similarity"] == 1.0
+    assert {i["postulation_id"] for i in items} == {p2, p3, p5}
+    assert nd.similar_postulations(_ids(1)[0], threshold=0.7, limit=10) is None
+
+    clusters = nd.duplicate_clusters(vacancy_id, threshold=0.7)
+    assert len(clusters) == 1
+    assert clusters[0]["postulation_ids"] == sorted([p1, p3, p5])
+    assert clusters[0]["distinct_texts"] == 3
+
+
+def test_near_identical_text_reuses_parse(app_ctx, monkeypatch):
+    calls = []
+
+    def fake_summarize(text):
+        calls.append(text)
+        return {"identidad": {"nombre": "Ana", "email": "ana@x.com", "telefono": None, "ubicacion": "Quito"},
+                "links": {"linkedin": None, "github": None}, "habilidades": ["python"], "experiencia": []}
+
+    monkeypatch.setattr(pipeline, "summarize_cv_to_json", fake_summarize)
+    config = pipeline.current_app.config
+    monkeypatch.setitem(config, "AI_NEAR_DUP_REUSE_MIN", 0.9)
+
+    body = _cv("reuso", words=600)
+    original = body + "\nana@x.com"
+    pipeline._index_text({}, original)
+    pipeline.summarize_cv_cached(original)
+
+    copy = _edit(body, every=300) + "\nluis@y.com"
+    pipeline._index_text({}, copy)
+    reused = pipeline.summarize_cv_cached(copy)
+    assert len(calls) == 1
+    assert reused["habilidades"] == ["python"]
+    assert reused["identidad"] == {"nombre": None, "email": "luis@y.com", "telefono": None, "ubicacion": None}
+
+    # Queda memoizado con su propia huella
+    pipeline.summarize_cv_cached(copy)
+    assert len(calls) == 1
+    assert cv_text_fingerprint(copy) != cv_text_fingerprint(original)
+
+    # Desactivado: texto casi igual nuevo vuelve al parser
+    monkeypatch.setitem(config, "AI_NEAR_DUP_REUSE_MIN", 0)
+    other = _edit(body, every=200) + "\nana@x.com"
+    pipeline._index_text({}, other)
+    pipeline.summarize_cv_cached(other)
+    assert len(calls) == 2
+
+
+def test_reused_parse_drops_donor_contacts(app_ctx, monkeypatch):
+    calls = []
+
+    def fake_summarize(text):
+        calls.append(text)
+        return {"identidad": {"nombre": "Ana", "email": "ana@x.com", "telefono": "+593 99 123 4567",
+                              "ubicacion": "Quito"},
+                "links": {"linkedin": "https://linkedin.com/in/ana-t", "github": "https://github.com/anat"},
+                "habilidades": ["sql"], "experiencia": []}
+
+    monkeypatch.setattr(pipeline, "summarize_cv_to_json", fake_summarize)
+    monkeypatch.setitem(pipeline.current_app.config, "AI_NEAR_DUP_REUSE_MIN", 0.9)
+
+    body = _cv("sin-contacto", words=600)
+    donor = (body + "\nana@x.com\nTeléfono: +593 99 123 4567\n"
+             "linkedin.com/in/ana-t\ngithub.com/anat")
+    pipeline._index_text({}, donor)
+    pipeline.summarize_cv_cached(donor)
+
+    # El casi duplicado no trae datos de contacto: no hereda ninguno del donante
+    copy = _edit(body, every=300)
+    pipeline._index_text({}, copy)
+    reused = pipeline.summarize_cv_cached(copy)
+    assert len(calls) == 1 and reused["habilidades"] == ["sql"]
+    assert reused["identidad"] == dict.fromkeys(("nombre", "email", "telefono", "ubicacion"))
+    assert reused["links"] == {"linkedin": None, "github": None}
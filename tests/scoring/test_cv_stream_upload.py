@@ -0,0 +1,110 @@
+# tests/scoring/test_cv_stream_upload.py
+import hashlib
+import io
+import random
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from app.ext import s3
+from app.services import cv_uploads
+from app.services.cv_uploads import CVStreamReader, CVUploadError
+
+PART = 64 * 1024
+
+
+class _Body(io.RawIOBase):
+    """Cuerpo de petición no buscable que registra cuánto se pidió por lectura."""
+
+    def __init__(self, data: bytes):
+        self._buf = io.BytesIO(data)
+        self.reads = []
+
+    def read(self, size=-1):
+        self.reads.append(size)
+        return self._buf.read(size)
+
+
+@pytest.fixture()
+def fake_s3(monkeypatch):
+    sent = {"parts": []}
+
+    def upload(fileobj, key, content_type):
+        sent["key"] = key
+        while True:
+            part = fileobj.read(PART)
+            if not part:
+                break
+            sent["parts"].append(len(part))
+
+    monkeypatch.setattr(cv_uploads, "upload_cv_fileobj", upload)
+    return sent
+
+
+def _pdf(size: int) -> bytes:
+    return b"%PDF-1.7\n" + random.randbytes(size - 9)
+
+
+def test_stream_upload_hashes_on_the_fly_in_bounded_parts(app_ctx, fake_s3):
+    data = _pdf(5 * PART + 123)
+    body = _Body(data)
+    row = cv_uploads.stream_cv_upload(body, applicant_id=random.randint(1, 10**8), vacancy_id=3,
+                                      filename="cv.pdf", content_length=len(data))
+
+    assert row.sha256 == hashlib.sha256(data).hexdigest()
+    assert (row.size_bytes, row.status) == (len(data), "uploaded")
+    assert max(body.reads) == PART and fake_s3["parts"][-1] == 123
+    assert row.key == fake_s3["key"]
+
+
+class _TrickleBody(_Body):
+    """Como LimitedStream sobre un socket lento: cada read devuelve a lo sumo 1000 bytes."""
+
+    def read(self, size=-1):
+        self.reads.append(size)
+        return self._buf.read(min(size, 1000) if size and size > 0 else 1000)
+
+
+def test_short_reads_are_filled_to_whole_parts(app_ctx, fake_s3):
+    data = _pdf(3 * PART + 77)
+    row = cv_uploads.stream_cv_upload(_TrickleBody(data), applicant_id=random.randint(1, 10**8),
+                                      vacancy_id=None, filename="cv.pdf")
+
+    # Partes no finales de tamaño completo (S3 rechaza partes intermedias < 5MB)
+    assert fake_s3["parts"] == [PART, PART, PART, 77]
+    assert row.sha256 == hashlib.sha256(data).hexdigest()
+
+
+def test_stream_aborts_on_size_or_magic(app_ctx, fake_s3, monkeypatch):
+    with pytest.raises(CVUploadError) as declared:
+        cv_uploads.stream_cv_upload(_Body(b""), applicant_id=1, vacancy_id=None, filename="cv.pdf",
+                                    content_length=s3.CV_MAX_BYTES + 1)
+    assert declared.value.status == 413
+
+    body = _Body(_pdf(10 * PART))
+    reader = CVStreamReader(body, max_bytes=3 * PART)
+    with pytest.raises(CVUploadError):
+        while reader.read(PART):
+            pass
+    assert len(body.reads) == 4  # corta en la parte que excede, sin leer el resto
+
+    with pytest.raises(CVUploadError):
+        CVStreamReader(_Body(b"PK\x03\x04" + b"x" * 100)).read(2)
+
+    truncated = CVStreamReader(_Body(b"%PD"))
+    assert truncated.read(PART) == b"%PD"
+    with pytest.raises(CVUploadError):
+        truncated.read(PART)
+
+
+def test_magic_violation_propagates_through_s3transfer_before_any_request(app_ctx, monkeypatch):
+    client = boto3.client("s3", aws_access_key_id="AKIATEST", aws_secret_access_key="secret",
+                          region_name="us-east-2")
+    monkeypatch.setattr(s3, "s3_client", client)
+    monkeypatch.setattr(s3, "AWS_BUCKET", "cvs-test")
+    with Stubber(client) as stub:
+        with pytest.raises(CVUploadError):
+            cv_uploads.stream_cv_upload(_Body(b"<html>" + b"x" * 1000), applicant_id=1, vacancy_id=None,
+                                        filename="cv.pdf")
+        stub.assert_no_pending_responses()
@@ -0,0 +1,141 @@
+# tests/scoring/test_cv_sweeper.py
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.ext import s3
+from app.ext.db import db
+from app.models.admin.charges import Charges
+from app.models.admin.vacancy import Vacancy
+from app.models.cv_upload import CVUpload
+from app.models.web_portal.postulation import Postulation
+from app.services import cv_sweeper
+from tests.factories import make_applicant
+
+NOW = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+
+class FakeS3:
+    """Bucket en memoria con list_objects_v2 paginado y delete_objects (máx. 1000 claves)."""
+
+    def __init__(self):
+        self.objects: dict[str, datetime] = {}
+        self.list_calls = 0
+        self.delete_calls: list[int] = []
+        self.fail: set[str] = set()  # claves que S3 rechaza (AccessDenied)
+
+    def get_paginator(self, name):
+        assert name == "list_objects_v2"
+        return self
+
+    def paginate(self, Bucket, Prefix, PaginationConfig):
+        keys = sorted(k for k in self.objects if k.startswith(Prefix))
+        size = PaginationConfig["PageSize"]
+        for i in range(0, max(len(keys), 1), size):
+            self.list_calls += 1
+            yield {"Contents": [{"Key": k, "LastModified": self.objects[k]} for k in keys[i:i + size]]}
+
+    def delete_objects(self, Bucket, Delete):
+        assert len(Delete["Objects"]) <= 1000
+        self.delete_calls.append(len(Delete["Objects"]))
+        errors = []
+        for obj in Delete["Objects"]:
+            if obj["Key"] in self.fail:
+                errors.append({"Key": obj["Key"], "Code": "AccessDenied"})
+            else:
+                self.objects.pop(obj["Key"], None)
+        return {"Errors": errors} if errors else {}
+
+
+@pytest.fixture()
+def bucket(monkeypatch):
+    fake = FakeS3()
+    monkeypatch.setattr(s3, "s3_client", fake)
+    # Prefijo propio por test: la BD de tests se comparte entre tests
+    monkeypatch.setattr(s3, "AWS_S3_FOLDER", f"cv-{uuid4().hex[:8]}")
+    monkeypatch.setattr(cv_sweeper, "AWS_S3_FOLDER", s3.AWS_S3_FOLDER)
+    return fake
+
+
+def _vacancy_with_posts(keys):
+    charge = Charges(title=f"Cargo {uuid4().hex[:6]}", area="TI", description="Cargo de prueba")
+    db.session.add(charge)
+    db.session.commit()
+    vac = Vacancy(title="Analista", description="Vacante", charge_id=charge.id,
+                  apply_until=date.today() + timedelta(days=7))
+    db.session.add(vac)
+    db.session.commit()
+    for key in keys:
+        db.session.add(Postulation(applicant_id=make_applicant().id, vacancy_id=vac.id, cv_path=key,
+                                   status="submitted"))
+    db.session.commit()
+    return vac
+
+
+def test_delete_cv_keys_batches_by_1000(bucket):
+    keys = [f"{s3.AWS_S3_FOLDER}/k{i}.pdf" for i in range(2500)]
+    bucket.objects = {k: NOW for k in keys}
+
+    assert s3.delete_cv_keys(keys + keys[:10] + [None, ""]) == keys
+    assert bucket.delete_calls == [1000, 1000, 500]
+    assert bucket.objects == {}
+
+
+def test_sweep_deletes_only_old_unreferenced_cvs(app_ctx, bucket):
+    folder = s3.AWS_S3_FOLDER
+    attached = [f"{folder}/vacancy_1/a{i}.pdf" for i in range(3)]
+    # cv_path guardado como URL pública: se compara por su clave
+    _vacancy_with_posts([attached[0], s3.public_url_from_key(attached[1]), attached[2]])
+
+    old = NOW - timedelta(days=10)
+    orphans = [f"{folder}/vacancy_1/orphan{i}.pdf" for i in range(1500)]
+    recent = f"{folder}/vacancy_0/recien_subido.pdf"
+    bucket.objects = {**{k: old for k in attached + orphans}, recent: NOW - timedelta(hours=1)}
+    db.session.add(CVUpload(key=orphans[0], applicant_id=1, filename="cv.pdf", status="uploaded"))
+    db.session.commit()
+
+    dry = cv_sweeper.sweep_orphan_cvs(grace_hours=48, dry_run=True, now=NOW)
+    assert (dry.scanned, dry.orphans, dry.deleted) == (1504, 1500, 0)
+    assert len(bucket.objects) == 1504 and bucket.delete_calls == []
+
+    bucket.list_calls = 0
+    result = cv_sweeper.sweep_orphan_cvs(grace_hours=48, now=NOW)
+    assert (result.orphans, result.deleted) == (1500, 1500)
+    assert bucket.list_calls == 2  # página por página (1000 + 504)
+    assert len(bucket.delete_calls) == 2
+    assert set(bucket.objects) == set(attached) | {recent}
+    assert CVUpload.query.filter_by(key=orphans[0]).first() is None
+
+
+def test_delete_cvs_ignores_keys_outside_prefix(app_ctx, bucket):
+    keys = [f"{s3.AWS_S3_FOLDER}/x.pdf", "otros/y.pdf", None]
+    bucket.objects = {k: NOW for k in keys if k}
+
+    assert cv_sweeper.delete_cvs(keys) == 1
+    assert set(bucket.objects) == {"otros/y.pdf"}
+
+
+def test_delete_cvs_keeps_upload_rows_of_failed_keys(app_ctx, bucket):
+    ok, denied = f"{s3.AWS_S3_FOLDER}/ok.pdf", f"{s3.AWS_S3_FOLDER}/denied.pdf"
+    bucket.objects = {ok: NOW, denied: NOW}
+    bucket.fail = {denied}
+    for key in (ok, denied):
+        db.session.add(CVUpload(key=key, applicant_id=1, filename="cv.pdf", status="uploaded"))
+    db.session.commit()
+
+    assert cv_sweeper.delete_cvs([ok, denied]) == 1
+    assert set(bucket.objects) == {denied}
+    assert CVUpload.query.filter_by(key=ok).first() is None
+    assert CVUpload.query.filter_by(key=denied).one().status == "uploaded"
+
+
+def test_delete_unreferenced_cvs_keeps_keys_used_elsewhere(app_ctx, bucket):
+    folder = s3.AWS_S3_FOLDER
+    shared, own = f"{folder}/vacancy_1/shared.pdf", f"{folder}/vacancy_1/own.pdf"
+    # Otra vacante sigue usando el mismo CV (guardado como URL pública)
+    _vacancy_with_posts([s3.public_url_from_key(shared)])
+    bucket.objects = {shared: NOW, own: NOW}
+
+    assert cv_sweeper.delete_unreferenced_cvs([shared, own, None]) == 1
+    assert set(bucket.objects) == {shared}
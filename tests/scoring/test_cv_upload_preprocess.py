@@ -0,0 +1,87 @@
+# tests/scoring/test_cv_upload_preprocess.py
+import io
+import random
+
+import pytest
+
+from app.ext.db import db
+from app.ext.llm_circuit_breaker import llm_breaker
+from app.models.scoring_job import ScoringJob
+from app.services import cv_uploads
+from app.services.scoring import pipeline, preprocess
+from app.services.scoring.worker import ScoringWorker
+
+
+@pytest.fixture()
+def empty_queue(app_ctx):
+    ScoringJob.query.filter(ScoringJob.status.in_(("queued", "running"))).update(
+        {"status": "failed"}, synchronize_session=False)
+    db.session.commit()
+
+
+@pytest.fixture()
+def uploaded(empty_queue, monkeypatch):
+    """Sube un PDF por streaming (S3 falso) y devuelve (fila cv_uploads, bytes)."""
+    monkeypatch.setattr(cv_uploads, "upload_cv_fileobj", lambda f, key, ct: [None for _ in iter(lambda: f.read(4096), b"")])
+    data = b"%PDF-1.7\n" + random.randbytes(2048)
+    row = cv_uploads.stream_cv_upload(io.BytesIO(data), applicant_id=random.randint(1, 10**8), vacancy_id=9,
+                                      filename="cv.pdf")
+    return row, data
+
+
+def _fake_extract(calls):
+    def extract(data):
+        calls.append(len(data))
+        return {"text": "Python SQL Docker", "page_count": 3, "ocr_pages": [False, True, False]}
+    return extract
+
+
+def test_upload_enqueues_preprocess_and_scoring_reuses_the_text(test_app, uploaded, monkeypatch):
+    row, data = uploaded
+    job = ScoringJob.query.filter_by(kind="preprocess").order_by(ScoringJob.id.desc()).first()
+    assert job.postulation_id is None and job.payload["cv"]["s3_key"] == row.key
+
+    calls = []
+    monkeypatch.setattr(pipeline, "extract_pdf", _fake_extract(calls))
+    monkeypatch.setattr(preprocess, "fetch_cv_bytes", lambda cv: data)
+    worker = ScoringWorker(test_app, worker_id="t", handler=lambda p: pytest.fail("no es un job de scoring"))
+    assert worker.run_once() is True
+    db.session.expire_all()
+    assert db.session.get(ScoringJob, job.id).status == "succeeded"
+    assert calls == [len(data)]
+
+    # El scoring de la postulación encuentra el texto por la clave: sin descarga ni extracción
+    monkeypatch.setattr(pipeline, "fetch_cv_bytes", lambda cv: pytest.fail("no debería descargar"))
+    pipeline.pop_run_counters()
+    text = pipeline.fetch_cv_text({"storage": "url", "presigned_url": "https://s3/x", "s3_key": row.key})
+    assert text == "Python SQL Docker"
+    counters = pipeline.pop_run_counters()
+    assert counters["text_cache_hit"] == 1 and counters["ocr_pages"] == 1
+    assert calls == [len(data)]
+
+
+def test_preprocess_runs_while_llm_circuit_is_open(test_app, uploaded, monkeypatch):
+    row, data = uploaded
+    score_job = ScoringJob(postulation_id=random.randint(1, 10**6), payload={}, status="queued")
+    db.session.add(score_job)
+    db.session.commit()
+    monkeypatch.setattr(llm_breaker, "retry_after", lambda: 30.0)
+    seen = []
+
+    worker = ScoringWorker(test_app, worker_id="t", handler=lambda p: pytest.fail("circuito abierto"),
+                           preprocess_handler=lambda p: seen.append(p["cv"]["s3_key"]) or {})
+    assert worker.run_once() is True
+    assert seen == [row.key]
+    assert worker.run_once() is False
+    db.session.expire_all()
+    assert db.session.get(ScoringJob, score_job.id).status == "queued"
+    db.session.get(ScoringJob, score_job.id).status = "failed"
+    db.session.commit()
+
+
+def test_preprocess_can_be_disabled(empty_queue, monkeypatch):
+    monkeypatch.setitem(preprocess.current_app.config, "CV_PREPROCESS_ON_UPLOAD", False)
+    monkeypatch.setattr(cv_uploads, "upload_cv_fileobj", lambda f, key, ct: f.read(1 << 20))
+    before = ScoringJob.query.filter_by(kind="preprocess").count()
+    cv_uploads.stream_cv_upload(io.BytesIO(b"%PDF-1.4 x"), applicant_id=1, vacancy_id=None, filename="a.pdf")
+    assert ScoringJob.query.filter_by(kind="preprocess").count() == before
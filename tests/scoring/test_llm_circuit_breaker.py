@@ -0,0 +1,173 @@
+# tests/scoring/test_llm_circuit_breaker.py
+from uuid import uuid4
+
+import pytest
+import requests
+
+from app.ext import ai_scorer
+from app.ext import llm_circuit_breaker as cb
+from app.ext.db import db
+from app.ext.llm_circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.models.postulation_ai_result import PostulationAIResult
+from app.models.scoring_job import ScoringJob
+from app.repositories.scoring_job_repo import ScoringJobRepository
+from app.services.scoring import worker as worker_mod
+from app.services.scoring.worker import ScoringWorker
+
+
+class Clock:
+    def __init__(self):
+        self.now = 5_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    c = Clock()
+    monkeypatch.setattr(cb.time, "time", c.time)
+    return c
+
+
+def _breaker(**kw):
+    kw.setdefault("failure_threshold", 3)
+    kw.setdefault("open_sec", 30)
+    kw.setdefault("slow_call_sec", 10)
+    return CircuitBreaker(f"t-{uuid4().hex[:8]}", **kw)
+
+
+def test_opens_after_consecutive_failures_and_probes_once(app_ctx, clock):
+    br = _breaker()
+    br.record_failure("503")
+    br.record_success(0.5)          # un éxito reinicia la cuenta
+    for _ in range(3):
+        br.before_call()
+        br.record_failure("timeout")
+
+    snap = br.snapshot()
+    assert snap["state"] == "open" and snap["shared"] is True
+    with pytest.raises(CircuitOpenError) as exc:
+        br.before_call()
+    assert exc.value.retry_after == pytest.approx(30)
+
+    clock.now += 31
+    br.before_call()                # la sonda pasa...
+    with pytest.raises(CircuitOpenError):
+        br.before_call()            # ...y el resto sigue rechazado
+    br.record_success(1.0)
+    assert br.snapshot()["state"] == "closed"
+    br.before_call()
+
+
+def test_failed_probe_reopens_and_slow_calls_count(app_ctx, clock):
+    br = _breaker(failure_threshold=2)
+    br.record_success(11)           # lenta = fallo
+    br.record_success(12)
+    assert br.snapshot()["state"] == "open"
+
+    clock.now += 31
+    br.before_call()
+    br.record_failure("ConnectionError")
+    assert br.retry_after() == pytest.approx(30)
+
+
+def test_throttled_probe_releases_the_probe_slot(app_ctx, clock):
+    br = _breaker(failure_threshold=1)
+    br.record_failure("503")
+    clock.now += 31
+    br.before_call()                # sonda
+    br.record_throttled(retry_after=5)
+    assert br.snapshot()["state"] == "half_open"
+    with pytest.raises(CircuitOpenError) as exc:
+        br.before_call()
+    assert exc.value.retry_after == pytest.approx(5)
+
+    clock.now += 5
+    br.before_call()                # nueva sonda sin esperar probe_timeout
+    br.record_success(0.5)
+    assert br.snapshot()["state"] == "closed"
+
+    # Cerrado, un 429 no suma fallos
+    br.record_throttled()
+    assert br.snapshot()["failures"] == 0
+
+
+def test_database_outage_uses_local_state_then_retries(app_ctx, clock, monkeypatch):
+    br = _breaker(db_retry=30)
+    real = br._transition_db
+    calls = []
+
+    def flaky(fn):
+        calls.append(clock.now)
+        if len(calls) == 1:
+            raise cb.SQLAlchemyError("conexión perdida")
+        return real(fn)
+
+    monkeypatch.setattr(br, "_transition_db", flaky)
+    br.record_failure("503")
+    br.record_failure("503")
+    assert len(calls) == 1 and br.snapshot()["shared"] is False
+
+    clock.now += 30
+    br.record_success(0.1)
+    assert len(calls) == 2 and br.snapshot()["shared"] is True
+
+
+def test_post_chat_fails_fast_while_open(monkeypatch):
+    br = _breaker(failure_threshold=1)
+    br.record_failure("boom")
+    monkeypatch.setattr(ai_scorer, "llm_breaker", br)
+    monkeypatch.setattr(ai_scorer, "OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(ai_scorer, "_session", type("NoCalls", (), {
+        "post": lambda self, *a, **k: pytest.fail("no debe llamar al proveedor")})())
+    ai_scorer.pop_call_stats()
+
+    with pytest.raises(CircuitOpenError):
+        ai_scorer._post_chat([{"role": "user", "content": "x"}])
+    assert "Circuito" in ai_scorer.pop_call_stats()[0]["error"]
+
+
+def test_post_chat_network_errors_open_the_circuit(monkeypatch):
+    br = _breaker(failure_threshold=2)
+    monkeypatch.setattr(ai_scorer, "llm_breaker", br)
+    monkeypatch.setattr(ai_scorer, "OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(ai_scorer.time, "sleep", lambda s: None)
+    calls = []
+
+    class Down:
+        def post(self, url, **kw):
+            calls.append(url)
+            raise requests.ConnectionError("reset")
+    monkeypatch.setattr(ai_scorer, "_session", Down())
+
+    with pytest.raises(CircuitOpenError):
+        ai_scorer._post_chat([{"role": "user", "content": "x"}], retries=5)
+    assert len(calls) == 2          # el 3er intento ya no sale a la red
+
+
+def test_worker_parks_job_without_consuming_attempt(test_app, app_ctx, monkeypatch):
+    ScoringJob.query.filter(ScoringJob.status.in_(["queued", "running"])).update(
+        {"status": "failed"}, synchronize_session=False)
+    db.session.commit()
+    repo = ScoringJobRepository()
+    pid = int(uuid4().int % 1_000_000) + 1
+    repo.enqueue(postulation_id=pid, vacancy_id=None, payload={}, max_attempts=1)
+    db.session.commit()
+
+    def open_circuit(_):
+        raise CircuitOpenError("abierto", retry_after=60)
+
+    worker = ScoringWorker(test_app, worker_id="t", handler=open_circuit)
+    assert worker.run_once() is True
+
+    job = db.session.get(ScoringJob, ScoringJob.query.filter_by(postulation_id=pid).one().id, populate_existing=True)
+    assert job.status == "queued" and job.attempts == 0
+    assert job.last_error.startswith("CircuitOpenError")
+    assert PostulationAIResult.query.filter_by(postulation_id=pid).first() is None
+
+    # Mientras el circuito siga abierto el worker no reclama jobs
+    monkeypatch.setattr(worker_mod, "llm_breaker", type("Open", (), {"retry_after": lambda self: 10.0})())
+    job.run_after = job.created_at
+    db.session.commit()
+    assert worker.run_once() is False
@@ -0,0 +1,100 @@
+# tests/scoring/test_llm_rate_limiter.py
+import pytest
+from uuid import uuid4
+
+from app.ext import llm_rate_limiter as rl
+from app.ext.llm_rate_limiter import TokenBucketLimiter, RateLimitTimeout, estimate_tokens
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, s):
+        self.now += s
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    c = Clock()
+    monkeypatch.setattr(rl.time, "time", c.time)
+    monkeypatch.setattr(rl.time, "monotonic", c.monotonic)
+    monkeypatch.setattr(rl.time, "sleep", c.sleep)
+    monkeypatch.setattr(rl.random, "uniform", lambda a, b: 0.0)
+    return c
+
+
+def _name():
+    return f"t-{uuid4().hex[:8]}"
+
+
+def test_estimate_tokens_counts_prompt_and_max_tokens():
+    msgs = [{"role": "system", "content": "x" * 400}, {"role": "user", "content": "y" * 400}]
+    assert estimate_tokens(msgs, 900) == 200 + 900
+
+
+def test_disabled_limiter_never_waits(clock):
+    lim = TokenBucketLimiter(_name(), rpm=0, tpm=0)
+    assert lim.acquire(10_000) == 0.0
+    assert lim.snapshot()["enabled"] is False
+
+
+def test_requests_per_minute_budget_queues_excess(clock):
+    lim = TokenBucketLimiter(_name(), rpm=60, tpm=0, max_wait=30)
+    for _ in range(60):
+        assert lim.acquire(0) == 0.0
+    assert lim.snapshot()["saturation"] == pytest.approx(1.0)
+    waited = lim.acquire(0)  # 1 req/seg de rellenado
+    assert 0.9 <= waited <= 1.1
+
+
+def test_tokens_per_minute_budget_and_timeout(clock):
+    lim = TokenBucketLimiter(_name(), rpm=0, tpm=6000, max_wait=5)
+    assert lim.acquire(6000) == 0.0
+    # Necesita 1000 tokens -> 10s de rellenado, excede max_wait
+    with pytest.raises(RateLimitTimeout):
+        lim.acquire(1000)
+    # Costos mayores al bucket se recortan a su capacidad (no bloquean para siempre)
+    lim.max_wait = 120
+    assert lim.acquire(50_000) <= 61
+
+
+def test_shared_bucket_in_database(app_ctx, clock):
+    name = _name()
+    a = TokenBucketLimiter(name, rpm=2, tpm=0, max_wait=0.5)
+    b = TokenBucketLimiter(name, rpm=2, tpm=0, max_wait=0.5)
+    assert a.acquire(0) == 0.0
+    assert b.acquire(0) == 0.0
+    # El presupuesto lo comparten ambas instancias (procesos distintos en prod)
+    with pytest.raises(RateLimitTimeout):
+        a.acquire(0)
+    assert b.snapshot()["shared"] is True
+
+
+def test_database_outage_falls_back_locally_and_retries_after_backoff(app_ctx, clock, monkeypatch):
+    lim = TokenBucketLimiter(_name(), rpm=60, tpm=0, db_retry=30)
+    real = lim._try_take_db
+    calls = []
+
+    def flaky(cost):
+        calls.append(clock.now)
+        if len(calls) == 1:
+            raise rl.SQLAlchemyError("conexión perdida")
+        return real(cost)
+
+    monkeypatch.setattr(lim, "_try_take_db", flaky)
+    assert lim.acquire(0) == 0.0          # falla la BD -> bucket local
+    assert lim.snapshot()["shared"] is False
+    lim.acquire(0)
+    assert len(calls) == 1                # dentro del backoff no se reintenta la BD
+
+    clock.now += 30
+    lim.acquire(0)
+    assert len(calls) == 2                # pasado el backoff vuelve al bucket compartido
+    assert lim.snapshot()["shared"] is True
@@ -0,0 +1,46 @@
+# tests/scoring/test_metrics_access.py
+from datetime import timedelta
+
+import pytest
+from flask_jwt_extended import create_access_token
+from jwt import DecodeError
+from flask_jwt_extended.exceptions import NoAuthorizationError
+from werkzeug.exceptions import Forbidden
+
+from app.ext.llm_circuit_breaker import llm_breaker
+from app.resources.health import LLMHealth
+from app.resources.metrics import ScoringMetricsExport
+
+
+def _get(app, auth=None):
+    headers = {"Authorization": auth} if auth else {}
+    with app.test_request_context("/api/v1/metrics/scoring", headers=headers):
+        return ScoringMetricsExport().get()
+
+
+def test_scoring_metrics_require_admin_or_scrape_token(test_app, monkeypatch):
+    monkeypatch.setitem(test_app.config, "METRICS_SCRAPE_TOKEN", "s3cr3t")
+
+    with pytest.raises(NoAuthorizationError):
+        _get(test_app)
+    with pytest.raises(DecodeError):
+        _get(test_app, "Bearer otro")
+
+    with test_app.app_context():
+        user = create_access_token(identity="42", expires_delta=timedelta(minutes=5))
+        admin = create_access_token(identity="admin:1", expires_delta=timedelta(minutes=5))
+    with pytest.raises(Forbidden):
+        _get(test_app, f"Bearer {user}")
+
+    assert "scoring_jobs" in _get(test_app, f"Bearer {admin}").get_data(as_text=True)
+    assert "scoring_jobs" in _get(test_app, "Bearer s3cr3t").get_data(as_text=True)
+
+
+def test_llm_health_hides_last_error(test_app, monkeypatch):
+    monkeypatch.setattr(llm_breaker, "snapshot", lambda: {
+        "state": "open", "last_error": "HTTPError: 401 https://api.interno/v1?key=abc",
+    })
+    with test_app.test_request_context("/api/v1/health/llm"):
+        out = LLMHealth().get().get_json()
+    assert out["status"] == "degraded"
+    assert "last_error" not in out["circuit_breaker"]
@@ -0,0 +1,79 @@
+# tests/scoring/test_multi_vacancy_scoring.py
+import json
+from uuid import uuid4
+
+from app.ext import ai_scorer
+from app.ext.db import db
+from app.models.postulation_ai_result import PostulationAIResult
+from app.models.scoring_job import ScoringJob
+from app.repositories.scoring_job_repo import ScoringJobRepository
+from app.services.scoring import pipeline
+from app.services.scoring.worker import ScoringWorker
+
+
+def test_multi_prompt_parses_results_per_key(monkeypatch):
+    seen = {}
+
+    def fake_chat(messages, **kw):
+        seen["prompt"] = messages[1]["content"]
+        return json.dumps({"resultados": [
+            {"postulacion": "11", "score": 140, "feedback": "Encaja."},
+            {"postulacion": "99", "score": 50, "feedback": "No pedida."},
+        ]})
+    monkeypatch.setattr(ai_scorer, "_post_chat", fake_chat)
+
+    out = ai_scorer.score_candidate_v3_multi(
+        {"age": 30},
+        [{"key": 11, "vacancy_profile": {"charge_title": "Backend"}},
+         {"key": 12, "vacancy_profile": {"charge_title": "Contador"}}],
+        {"habilidades": ["Python"]},
+    )
+    assert out == {"11": {"score": 100, "feedback": "Encaja."}}
+    # Las claves son ids de postulación y así se rotulan (no como ids de vacante)
+    assert "[POSTULACIÓN 11]" in seen["prompt"] and "[POSTULACIÓN 12]" in seen["prompt"]
+    assert "VACANTE 11" not in seen["prompt"] and "id de la vacante" not in seen["prompt"]
+    assert seen["prompt"].count("[CV_JSON") == 1
+
+
+def test_worker_scores_pending_siblings_in_one_call(test_app, app_ctx, monkeypatch):
+    ScoringJob.query.filter(ScoringJob.status.in_(["queued", "running"])).update(
+        {"status": "failed"}, synchronize_session=False)
+    db.session.commit()
+    repo = ScoringJobRepository()
+    applicant_id = int(uuid4().int % 1_000_000) + 1
+    pids = [int(uuid4().int % 1_000_000) + 1 for _ in range(3)]
+    for n, pid in enumerate(pids):
+        repo.enqueue(postulation_id=pid, vacancy_id=None, payload={
+            "postulation_id": pid, "vacancy_id": None, "applicant_id": applicant_id, "cv": {},
+            "applicant_profile": {"age": 30},
+            "vacancy_profile": {"charge_title": f"Cargo {n}"},
+        })
+    db.session.commit()
+
+    calls = {"summarize": 0, "multi": [], "single": 0}
+    monkeypatch.setattr(pipeline, "fetch_cv_text", lambda cv: "Python Flask SQL")
+    monkeypatch.setattr(pipeline, "summarize_cv_cached",
+                        lambda text: calls.__setitem__("summarize", calls["summarize"] + 1) or {"habilidades": []})
+
+    def multi(applicant, targets, cv_json):
+        calls["multi"].append([t["key"] for t in targets])
+        # La respuesta omite la última vacante
+        return {t["key"]: {"score": 60, "feedback": "ok"} for t in targets[:-1]}
+
+    def single(*a, **k):
+        calls["single"] += 1
+        return {"score": 40, "feedback": "individual"}
+    monkeypatch.setattr(pipeline, "score_candidate_v3_multi", multi)
+    monkeypatch.setattr(pipeline, "score_candidate_v3", single)
+
+    worker = ScoringWorker(test_app, worker_id="t")
+    assert worker.run_once() is True
+
+    assert calls["summarize"] == 1 and calls["single"] == 1
+    assert calls["multi"] == [[str(p) for p in pids]]
+    jobs = ScoringJob.query.filter(ScoringJob.postulation_id.in_(pids)).all()
+    assert {j.status for j in jobs} == {"succeeded"}
+    scores = {r.postulation_id: r.score for r in PostulationAIResult.query.filter(
+        PostulationAIResult.postulation_id.in_(pids))}
+    assert scores == {pids[0]: 60, pids[1]: 60, pids[2]: 40}
+    assert worker.run_once() is False
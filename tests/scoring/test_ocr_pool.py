@@ -0,0 +1,68 @@
+# tests/scoring/test_ocr_pool.py
+import io
+import os
+import signal
+import sys
+import time
+
+from PIL import Image
+
+from app.ext import pdf_reader
+from app.ext.ocr_pool import OCRPool
+
+
+def _fake_ocr(image) -> str:
+    """Tarea OCR de prueba (corre en el proceso del pool, sin easyocr)."""
+    return f"texto ocr {image.size[0]}x{image.size[1]} " * 3
+
+
+def test_pdf_reader_does_not_load_ocr_model_in_this_process():
+    import app.ext.pdf_reader  # noqa: F401
+    import app.ext.ocr_pool as pool_mod
+
+    assert pool_mod._reader is None
+    assert "torch" not in sys.modules
+
+
+def test_pool_runs_ocr_out_of_process_and_reports_failure():
+    pool = OCRPool(workers=1, langs=["es"])
+    try:
+        # Sin easyocr instalado el proceso OCR arranca igual y la página cuenta como fallida (None)
+        out = pool.ocr_image(Image.new("RGB", (40, 20), "white"), timeout=60)
+        try:
+            import easyocr  # noqa: F401
+        except ImportError:
+            assert out is None
+        else:
+            assert isinstance(out, str)
+    finally:
+        pool.shutdown()
+    assert pool._executor is None
+
+
+def test_pool_is_rebuilt_after_an_ocr_process_dies(monkeypatch):
+    pool = OCRPool(workers=1, task=_fake_ocr)
+    monkeypatch.setattr(pdf_reader, "ocr_pool", pool)
+    monkeypatch.setattr(pdf_reader, "PDF_OCR_MODE", "batch")
+    monkeypatch.setattr(pdf_reader, "_rasterize", lambda source, *, first_page, last_page, **kw: [
+        Image.new("RGB", (30, 10), "white") for _ in range(first_page, last_page + 1)
+    ])
+    blank = [Image.new("RGB", (200, 200), "white") for _ in range(2)]
+    buf = io.BytesIO()
+    blank[0].save(buf, format="PDF", save_all=True, append_images=blank[1:])
+    try:
+        assert pool.submit(blank[0]).result(timeout=60).startswith("texto ocr")
+        broken = pool._executor
+        for proc in list(broken._processes.values()):
+            os.kill(proc.pid, signal.SIGKILL)
+        waited = time.monotonic() + 30
+        while not broken._broken and time.monotonic() < waited:
+            time.sleep(0.05)
+        assert broken._broken
+
+        out = pdf_reader.extract_pdf(buf.getvalue())
+        assert out["ocr_pages"] == [True, True]
+        assert "texto ocr 30x10" in out["text"]
+        assert pool._executor is not broken
+    finally:
+        pool.shutdown()
@@ -0,0 +1,111 @@
+# tests/scoring/test_pdf_reader_batch.py
+import io
+from concurrent.futures import Future
+
+import pytest
+from PIL import Image
+
+from app.ext import pdf_reader
+
+
+def _scanned_pdf(pages: int) -> bytes:
+    imgs = [Image.new("RGB", (200, 200), "white") for _ in range(pages)]
+    buf = io.BytesIO()
+    imgs[0].save(buf, format="PDF", save_all=True, append_images=imgs[1:])
+    return buf.getvalue()
+
+
+class FakePool:
+    def __init__(self, resolve=True, workers=2, fail_pages=()):
+        self.submitted = []
+        self.resolve = resolve
+        self.workers = workers
+        self.fail_pages = set(fail_pages)
+
+    def submit(self, img):
+        self.submitted.append(img)
+        fut = Future()
+        if img in self.fail_pages:
+            fut.set_exception(RuntimeError("proceso OCR caído"))
+        elif self.resolve:
+            fut.set_result(f"texto ocr pagina {img} " * 3)
+        return fut
+
+
+@pytest.fixture()
+def raster_calls(monkeypatch):
+    calls = []
+
+    def fake_rasterize(source, *, first_page, last_page, **kw):
+        calls.append((first_page, last_page))
+        return list(range(first_page, last_page + 1))
+
+    monkeypatch.setattr(pdf_reader, "_rasterize", fake_rasterize)
+    monkeypatch.setattr(pdf_reader, "PDF_OCR_MODE", "batch")
+    return calls
+
+
+def test_contiguous_runs():
+    assert pdf_reader._contiguous_runs([7, 1, 2, 3, 6]) == [(1, 3), (6, 7)]
+    assert pdf_reader._contiguous_runs([]) == []
+
+
+def test_scanned_pages_are_rasterized_once_and_ocr_in_parallel(monkeypatch, raster_calls):
+    pool = FakePool()
+    monkeypatch.setattr(pdf_reader, "ocr_pool", pool)
+
+    out = pdf_reader.extract_pdf(_scanned_pdf(6))
+
+    assert raster_calls == [(1, 6)]           # una sola invocación de poppler
+    assert pool.submitted == [1, 2, 3, 4, 5, 6]
+    assert out["page_count"] == 6
+    assert out["ocr_pages"] == [True] * 6
+    assert out["ocr_skipped"] == 0
+    assert "texto ocr pagina 6" in out["text"]
+
+
+def test_page_budget_limits_ocr(monkeypatch, raster_calls):
+    monkeypatch.setattr(pdf_reader, "ocr_pool", FakePool())
+    monkeypatch.setattr(pdf_reader, "OCR_MAX_PAGES", 2)
+
+    out = pdf_reader.extract_pdf(_scanned_pdf(4))
+    assert raster_calls == [(1, 2)]
+    assert out["ocr_pages"] == [True, True, False, False]
+    assert out["ocr_skipped"] == 2
+
+
+def test_time_budget_drops_unfinished_pages(monkeypatch, raster_calls):
+    monkeypatch.setattr(pdf_reader, "ocr_pool", FakePool(resolve=False))
+    monkeypatch.setattr(pdf_reader, "OCR_TIME_BUDGET_SEC", 0.05)
+
+    out = pdf_reader.extract_pdf(_scanned_pdf(2))
+    assert out["ocr_pages"] == [False, False]
+    assert out["ocr_skipped"] == 2
+
+
+def test_in_flight_pages_are_capped_at_pool_workers(monkeypatch, raster_calls):
+    pool = FakePool(resolve=False, workers=2)
+    monkeypatch.setattr(pdf_reader, "ocr_pool", pool)
+    monkeypatch.setattr(pdf_reader, "OCR_TIME_BUDGET_SEC", 0.05)
+
+    out = pdf_reader.extract_pdf(_scanned_pdf(6))
+    # Al agotarse el presupuesto solo quedan ocupando el pool `workers` páginas
+    assert pool.submitted == [1, 2]
+    assert out["ocr_skipped"] == 6
+
+
+def test_failed_ocr_pages_are_reported_not_returned_as_empty(monkeypatch, raster_calls):
+    monkeypatch.setattr(pdf_reader, "ocr_pool", FakePool(fail_pages={2}))
+
+    out = pdf_reader.extract_pdf(_scanned_pdf(3))
+    assert out["ocr_pages"] == [True, False, True]
+    assert (out["ocr_failed"], out["ocr_skipped"]) == (1, 0)
+
+
+def test_sequential_mode_reports_failed_pages(monkeypatch, raster_calls):
+    monkeypatch.setattr(pdf_reader, "PDF_OCR_MODE", "sequential")
+    monkeypatch.setattr(pdf_reader.ocr_pool, "ocr_image", lambda img: None if img == 1 else "texto ocr " * 5)
+
+    out = pdf_reader.extract_pdf(_scanned_pdf(2))
+    assert out["ocr_pages"] == [False, True]
+    assert out["ocr_failed"] == 1
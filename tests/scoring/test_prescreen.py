@@ -0,0 +1,64 @@
+# tests/scoring/test_prescreen.py
+from uuid import uuid4
+
+import pytest
+
+from app.models.scoring_job import ScoringJob
+from app.services.scoring import pipeline
+from app.services.scoring.prescreen import prescreen_coverage, requirement_terms
+
+CV = """
+Juan Pérez
+EXPERIENCIA
+Desarrollador backend en Acme (2021-2024): APIs con Python y Flask, PostgreSQL.
+HABILIDADES
+Python, Flask, SQL, Docker
+"""
+
+
+def test_requirement_terms_merge_knowledge_and_skills():
+    terms = requirement_terms({"req_knowledge": ["Python / Flask", "Inglés B2"]}, ["Docker", "python"])
+    assert terms == ["python", "flask", "inglés b2", "docker"]
+
+
+def test_coverage_with_accent_folding_and_stopwords():
+    res = prescreen_coverage(CV, ["python", "conocimientos de flask", "docker", "contabilidad"])
+    assert res.matched == ["python", "conocimientos de flask", "docker"]
+    assert res.missing == ["contabilidad"]
+    assert res.coverage == pytest.approx(0.75)
+
+
+def test_no_terms_means_not_evaluated():
+    res = prescreen_coverage(CV, [])
+    assert not res.evaluated and res.coverage == 1.0
+
+
+@pytest.fixture()
+def prescreen_on(test_app):
+    test_app.config.update(AI_PRESCREEN_MIN_COVERAGE=0.5, AI_PRESCREEN_MODE="defer")
+    yield
+    test_app.config.update(AI_PRESCREEN_MIN_COVERAGE=0.0)
+
+
+def test_low_coverage_skips_llm_and_defers(app_ctx, prescreen_on, monkeypatch):
+    monkeypatch.setattr(pipeline, "summarize_cv_to_json", lambda t: pytest.fail("no debe llamar al LLM"))
+    pid = int(uuid4().int % 1_000_000)
+    data = {
+        "postulation_id": pid,
+        "vacancy_id": None,
+        "vacancy_profile": {"req_knowledge": ["Contabilidad", "NIIF", "SAP FI"]},
+        "applicant_profile": {},
+    }
+
+    out = pipeline.prescreen(data, CV)
+    assert out["provisional"] is True and out["score"] == 0
+
+    deferred = ScoringJob.query.filter_by(postulation_id=pid).one()
+    assert deferred.payload["prescreen"] is False
+    # El reintento diferido no vuelve a pre-filtrar
+    assert pipeline.prescreen(deferred.payload, CV) is None
+
+
+def test_enough_coverage_continues_to_llm(app_ctx, prescreen_on):
+    data = {"postulation_id": 1, "vacancy_profile": {"req_knowledge": ["Python", "SQL"]}}
+    assert pipeline.prescreen(data, CV) is None
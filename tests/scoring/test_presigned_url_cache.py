@@ -0,0 +1,78 @@
+# tests/scoring/test_presigned_url_cache.py
+import boto3
+import pytest
+
+from app.ext import s3
+from app.ext.s3 import PresignedURLCache
+from app.services.scoring.payloads import cv_source
+
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def signer(monkeypatch):
+    client = boto3.client("s3", aws_access_key_id="AKIATEST", aws_secret_access_key="secret",
+                          region_name="us-east-2")
+    monkeypatch.setattr(s3, "s3_client", client)
+    monkeypatch.setattr(s3, "AWS_BUCKET", "cvs-test")
+    calls = []
+    sign = s3._sign_get_url
+    monkeypatch.setattr(s3, "_sign_get_url", lambda key, exp: calls.append(key) or sign(key, exp))
+    return calls
+
+
+def test_reuses_url_within_bucket_and_resigns_after(signer):
+    clock = Clock(now=1200 * 1000)
+    cache = PresignedURLCache(max_size=10, min_remaining=0.75, clock=clock)
+
+    url = cache.get("curriculums/a.pdf", 1200)
+    clock.now += 299  # ventana = 1200 * 0.25 = 300s
+    assert cache.get("curriculums/a.pdf", 1200) == url
+    assert signer == ["curriculums/a.pdf"]
+
+    clock.now += 1
+    cache.get("curriculums/a.pdf", 1200)
+    assert signer == ["curriculums/a.pdf"] * 2
+
+    # Otra vigencia es otra entrada
+    cache.get("curriculums/a.pdf", 60)
+    assert len(signer) == 3
+
+
+def test_lru_evicts_oldest_and_zero_size_disables(signer):
+    cache = PresignedURLCache(max_size=2, clock=Clock())
+    cache.get("k1", 1200)
+    cache.get("k2", 1200)
+    cache.get("k1", 1200)  # k1 pasa a ser la más reciente
+    cache.get("k3", 1200)
+    assert len(cache) == 2
+
+    signer.clear()
+    cache.get("k1", 1200)
+    cache.get("k2", 1200)
+    assert signer == ["k2"]
+
+    off = PresignedURLCache(max_size=0, clock=Clock())
+    off.get("k1", 1200)
+    off.get("k1", 1200)
+    assert signer == ["k2", "k1", "k1"] and len(off) == 0
+
+
+def test_presign_many_and_scoring_payload_share_cache(signer, monkeypatch):
+    monkeypatch.setattr(s3, "presigned_urls", PresignedURLCache(max_size=100))
+
+    urls = s3.presign_many(["curriculums/a.pdf", None, "curriculums/b.pdf", "curriculums/a.pdf", ""])
+    assert list(urls) == ["curriculums/a.pdf", "curriculums/b.pdf"]
+    assert all("X-Amz-Signature=" in u or "Signature=" in u for u in urls.values())
+    assert signer == ["curriculums/a.pdf", "curriculums/b.pdf"]
+
+    # El trigger de scoring firma con la misma vigencia (20 min): sale del cache
+    src = cv_source("curriculums/a.pdf")
+    assert src["presigned_url"] == urls["curriculums/a.pdf"]
+    assert len(signer) == 2
@@ -0,0 +1,133 @@
+# tests/scoring/test_rescore_batch.py
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.ext import s3
+from app.ext.db import db
+from app.models.admin.charges import Charges
+from app.models.admin.vacancy import Vacancy
+from app.models.scoring_job import ScoringJob
+from app.models.web_portal.postulation import Postulation
+from app.repositories.scoring_job_repo import ScoringJobRepository
+from app.services.scoring.batches import batch_progress, enqueue_rescore
+from app.services.scoring.payloads import build_scoring_payload
+from tests.factories import make_applicant
+
+
+@pytest.fixture()
+def vacancy_with_posts(app_ctx):
+    charge = Charges(title=f"Cargo {uuid4().hex[:6]}", area="TI", description="Cargo de prueba")
+    db.session.add(charge)
+    db.session.commit()
+    vac = Vacancy(
+        title="Analista", description="Vacante", charge_id=charge.id,
+        apply_until=date.today() + timedelta(days=7),
+    )
+    db.session.add(vac)
+    db.session.commit()
+    posts = []
+    for status in ("submitted", "submitted", "accepted", "rejected"):
+        p = Postulation(applicant_id=make_applicant().id, vacancy_id=vac.id,
+                        cv_path=f"curriculums/{uuid4().hex}.pdf", status=status)
+        db.session.add(p)
+        posts.append(p)
+    db.session.commit()
+    return vac, posts
+
+
+def test_enqueue_filters_and_skips_busy(vacancy_with_posts):
+    vac, posts = vacancy_with_posts
+    repo = ScoringJobRepository()
+    repo.enqueue(postulation_id=posts[0].id, vacancy_id=vac.id, payload={})
+    db.session.commit()
+
+    batch = enqueue_rescore(vac, statuses=["submitted", "accepted"], max_concurrency=2)
+    jobs = ScoringJob.query.filter_by(batch_id=batch.id).all()
+    assert batch.total == 2
+    assert {j.postulation_id for j in jobs} == {posts[1].id, posts[2].id}
+    # Referencia S3 (no URL firmada): el job puede correr mucho después
+    assert all(j.payload["cv"]["storage"] == "s3" for j in jobs)
+
+
+def test_claim_respects_batch_concurrency_and_prefers_interactive(vacancy_with_posts):
+    vac, posts = vacancy_with_posts
+    repo = ScoringJobRepository()
+    # BD compartida por la sesión de tests: descartar jobs pendientes de otros tests
+    ScoringJob.query.filter(ScoringJob.status.in_(("queued", "running"))).update(
+        {"status": "failed"}, synchronize_session=False
+    )
+    batch = enqueue_rescore(vac, max_concurrency=1)
+    interactive = repo.enqueue(postulation_id=10_000_000 + posts[0].id, vacancy_id=None, payload={})
+    db.session.commit()
+
+    first = repo.claim_next(worker_id="w1", lease_seconds=60)
+    assert first.id == interactive.id
+
+    second = repo.claim_next(worker_id="w1", lease_seconds=60)
+    assert second.batch_id == batch.id
+    # Lote con 1 job en curso: ya no hay capacidad
+    assert repo.claim_next(worker_id="w2", lease_seconds=60) is None
+
+    repo.mark_succeeded(second)
+    db.session.commit()
+    third = repo.claim_next(worker_id="w2", lease_seconds=60)
+    assert third is not None and third.batch_id == batch.id
+
+    progress = batch_progress(batch)
+    assert progress["total"] == 4 and progress["succeeded"] == 1 and progress["running"] == 1
+    assert progress["progress"] == 0.25 and not progress["finished"]
+
+
+def test_eta_uses_batch_age_not_retry_claims(vacancy_with_posts):
+    vac, _ = vacancy_with_posts
+    ScoringJob.query.filter(ScoringJob.status.in_(("queued", "running"))).update(
+        {"status": "failed"}, synchronize_session=False
+    )
+    batch = enqueue_rescore(vac, statuses=["submitted"], max_concurrency=2)
+    batch.created_at = datetime.utcnow() - timedelta(seconds=100)
+    jobs = ScoringJob.query.filter_by(batch_id=batch.id).all()
+    # Un job terminó; el otro se reintentó recién, así que su started_at es de ahora
+    jobs[0].status = "succeeded"
+    jobs[1].status, jobs[1].started_at = "running", datetime.utcnow()
+    db.session.commit()
+
+    progress = batch_progress(batch)
+    assert progress["elapsed_sec"] >= 100
+    assert progress["eta_sec"] >= 100  # 1 restante al ritmo de 1 job / 100s
+
+
+def test_deferred_job_is_adopted_not_counted_busy(vacancy_with_posts):
+    vac, posts = vacancy_with_posts
+    repo = ScoringJobRepository()
+    # Diferido por el prescreen (run_after futuro) vs. uno listo para reclamarse
+    deferred = repo.enqueue(postulation_id=posts[0].id, vacancy_id=vac.id, payload={"prescreen": False},
+                            run_after=datetime.utcnow() + timedelta(hours=1))
+    deferred.attempts = 1
+    repo.enqueue(postulation_id=posts[1].id, vacancy_id=vac.id, payload={})
+    db.session.commit()
+
+    batch = enqueue_rescore(vac, statuses=["submitted"])
+    assert (batch.total, batch.skipped) == (1, 1)
+
+    db.session.refresh(deferred)
+    assert deferred.batch_id == batch.id and deferred.attempts == 0
+    assert deferred.run_after <= datetime.utcnow()
+    assert deferred.payload["cv"]["storage"] == "s3"
+    # Sin job duplicado para la postulación adoptada
+    assert ScoringJob.query.filter_by(postulation_id=posts[0].id).count() == 1
+
+    progress = batch_progress(batch)
+    assert progress["total"] == 1 and progress["skipped"] == 1 and progress["queued"] == 1
+
+
+def test_payload_uses_key_when_cv_path_is_a_url(vacancy_with_posts):
+    vac, posts = vacancy_with_posts
+    key = posts[0].cv_path
+    posts[0].cv_path = s3.public_url_from_key(key)
+    db.session.commit()
+
+    cv = build_scoring_payload(posts[0], vac, presign=False)["cv"]
+    # Con la clave (no la URL) el pipeline encuentra el texto pre-procesado en cv_uploads
+    assert cv["storage"] == "s3" and cv["s3_key"] == key
@@ -0,0 +1,137 @@
+# tests/scoring/test_result_hub.py
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from app.ext.db import db
+from app.ext.result_hub import PgResultListener, ResultHub, ensure_listener
+from app.resources.ai_scoring import _finished_state, _jobs
+from app.services.scoring.pipeline import save_result
+
+
+def _pid() -> int:
+    return int(uuid4().int % 1_000_000) + 1_000_000
+
+
+def test_publish_wakes_waiter_before_recheck():
+    hub = ResultHub()
+    box = {}
+
+    def _publish():
+        time.sleep(0.05)
+        box["value"] = "listo"
+        hub.publish(7)
+
+    threading.Thread(target=_publish).start()
+    t0 = time.monotonic()
+    got = hub.wait_for(7, lambda: box.get("value"), timeout=5, recheck_interval=10)
+    assert got == "listo"
+    assert time.monotonic() - t0 < 2
+    assert hub.waiting() == 0
+
+
+def test_wait_times_out_with_none():
+    hub = ResultHub()
+    assert hub.wait_for(1, lambda: None, timeout=0.05, recheck_interval=0.01) is None
+
+
+def test_finished_result_waits_for_active_job(app_ctx):
+    pid = _pid()
+    job = _jobs.enqueue(postulation_id=pid, vacancy_id=None, payload={})
+    db.session.commit()
+    save_result(pid, None, 40, "anterior")
+    assert _finished_state(pid) is None
+
+    job.status = "succeeded"
+    save_result(pid, None, 75, "final")
+    state = _finished_state(pid)
+    assert state is not None and state["score"] == 75 and state["status"] == "succeeded"
+
+
+def test_deferred_job_does_not_block_result(app_ctx):
+    pid = _pid()
+    _jobs.enqueue(postulation_id=pid, vacancy_id=None, payload={},
+                  run_after=datetime.utcnow() + timedelta(hours=6))
+    save_result(pid, None, 10, "[Provisional] ...", status="provisional")
+    assert _finished_state(pid)["status"] == "provisional"
+
+
+class _PgSession:
+    """Sesión falsa con dialecto PostgreSQL: registra lo que se ejecuta."""
+
+    def __init__(self):
+        self.executed = []
+
+    def get_bind(self):
+        return type("Bind", (), {"dialect": type("D", (), {"name": "postgresql"})()})()
+
+    def execute(self, stmt, params):
+        self.executed.append((str(stmt), params))
+
+
+def test_notify_uses_pg_notify_only_on_postgres(app_ctx):
+    pg = _PgSession()
+    ResultHub.notify(pg, 42)
+    assert pg.executed == [("SELECT pg_notify(:channel, :payload)", {"channel": "ai_results", "payload": "42"})]
+    # SQLite (tests/dev): no-op, solo aviso en proceso
+    ResultHub.notify(db.session, 42)
+    assert ensure_listener(db.engine) is False
+
+
+def test_listener_forwards_notifies_from_other_processes():
+    hub = ResultHub()
+    a, b = socket.socketpair()
+
+    class Conn:
+        autocommit = False
+
+        def __init__(self):
+            self.notifies = []
+            self.listened = []
+
+        def fileno(self):
+            return a.fileno()
+
+        def cursor(self):
+            conn = self
+
+            class Cur:
+                def __enter__(self):
+                    return self
+
+                def __exit__(self, *exc):
+                    return False
+
+                def execute(self, sql):
+                    conn.listened.append(sql)
+            return Cur()
+
+        def poll(self):
+            a.recv(16)
+            self.notifies.append(type("N", (), {"payload": "7"})())
+
+    conn = Conn()
+    raw = type("Raw", (), {"driver_connection": conn, "invalidate": lambda self: None})()
+    engine = type("Engine", (), {"raw_connection": lambda self: raw})()
+    listener = PgResultListener(engine, hub, poll_sec=0.05)
+    box = {}
+
+    def _worker_saves_result():
+        time.sleep(0.1)
+        box["value"] = "listo"
+        b.send(b"x")  # llega un NOTIFY por el socket de la conexión
+
+    listener.start()
+    threading.Thread(target=_worker_saves_result).start()
+    try:
+        t0 = time.monotonic()
+        assert hub.wait_for(7, lambda: box.get("value"), timeout=5, recheck_interval=10) == "listo"
+        assert time.monotonic() - t0 < 2
+        assert conn.autocommit is True and conn.listened == ["LISTEN ai_results"]
+    finally:
+        listener.stop()
+        listener.join(timeout=2)
+        a.close()
+        b.close()
@@ -0,0 +1,134 @@
+# tests/scoring/test_scoring_queue.py
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.ext.db import db
+from app.models.scoring_job import ScoringJob
+from app.models.postulation_ai_result import PostulationAIResult
+from app.repositories.scoring_job_repo import ScoringJobRepository
+from app.services.scoring.worker import ScoringWorker
+
+
+@pytest.fixture()
+def repo(app_ctx):
+    ScoringJob.query.delete()
+    db.session.commit()
+    return ScoringJobRepository()
+
+
+def _pid() -> int:
+    return int(uuid4().int % 1_000_000) + 1
+
+
+def test_enqueue_and_claim_sets_lease(repo):
+    pid = _pid()
+    repo.enqueue(postulation_id=pid, vacancy_id=7, payload={"postulation_id": pid})
+    db.session.commit()
+
+    job = repo.claim_next(worker_id="w1", lease_seconds=60)
+    assert job is not None
+    assert job.status == "running"
+    assert job.locked_by == "w1"
+    assert job.attempts == 1
+    assert job.lease_until > datetime.utcnow()
+
+    # Nadie más puede reclamarlo mientras el lease esté vigente
+    assert repo.claim_next(worker_id="w2", lease_seconds=60) is None
+
+
+def test_expired_lease_is_reclaimed(repo):
+    pid = _pid()
+    repo.enqueue(postulation_id=pid, vacancy_id=None, payload={})
+    db.session.commit()
+    job = repo.claim_next(worker_id="w1", lease_seconds=60)
+    job.lease_until = datetime.utcnow() - timedelta(seconds=1)
+    db.session.commit()
+
+    again = repo.claim_next(worker_id="w2", lease_seconds=60)
+    assert again is not None and again.id == job.id
+    assert again.locked_by == "w2"
+    assert again.attempts == 2
+
+
+def test_heartbeat_only_for_owner(repo):
+    repo.enqueue(postulation_id=_pid(), vacancy_id=None, payload={})
+    db.session.commit()
+    job = repo.claim_next(worker_id="w1", lease_seconds=60)
+    assert repo.heartbeat(job.id, worker_id="w1", lease_seconds=120) is True
+    assert repo.heartbeat(job.id, worker_id="intruso", lease_seconds=120) is False
+
+
+def test_future_run_after_is_not_claimed(repo):
+    repo.enqueue(
+        postulation_id=_pid(), vacancy_id=None, payload={},
+        run_after=datetime.utcnow() + timedelta(minutes=5),
+    )
+    db.session.commit()
+    assert repo.claim_next(worker_id="w1", lease_seconds=60) is None
+
+
+def test_worker_success_marks_job(test_app, repo):
+    pid = _pid()
+    repo.enqueue(postulation_id=pid, vacancy_id=3, payload={"postulation_id": pid})
+    db.session.commit()
+    seen = []
+
+    worker = ScoringWorker(test_app, worker_id="t", handler=lambda p: seen.append(p) or {})
+    assert worker.run_once() is True
+    assert len(seen) == 1
+    meta = seen[0].pop("_job")
+    assert seen == [{"postulation_id": pid}]
+    assert meta["attempts"] == 1 and meta["job_id"]
+
+    job = ScoringJob.query.filter_by(postulation_id=pid).one()
+    assert job.status == "succeeded"
+    assert job.finished_at is not None
+    assert job.locked_by is None and job.lease_until is None
+    assert worker.run_once() is False
+
+
+def test_worker_does_not_settle_a_job_it_no_longer_owns(test_app, repo):
+    pid = _pid()
+    repo.enqueue(postulation_id=pid, vacancy_id=3, payload={})
+    db.session.commit()
+
+    def slow(payload):
+        # El lease vence a mitad del pipeline y otro worker reclama el job
+        db.session.query(ScoringJob).filter_by(id=payload["_job"]["job_id"]).update(
+            {"lease_until": datetime.utcnow() - timedelta(seconds=1)})
+        db.session.commit()
+        assert ScoringJobRepository().claim_next(worker_id="w2", lease_seconds=60) is not None
+        return {}
+
+    worker = ScoringWorker(test_app, worker_id="w1", handler=slow, group_handler=None)
+    assert worker.run_once() is True
+    db.session.expire_all()
+    job = ScoringJob.query.filter_by(postulation_id=pid).one()
+    assert (job.status, job.locked_by, job.attempts) == ("running", "w2", 2)
+    assert job.finished_at is None
+
+
+def test_worker_retries_then_records_failure(test_app, repo):
+    pid = _pid()
+    repo.enqueue(postulation_id=pid, vacancy_id=3, payload={}, max_attempts=2)
+    db.session.commit()
+
+    def boom(_):
+        raise RuntimeError("llm caído")
+
+    worker = ScoringWorker(test_app, worker_id="t", handler=boom, retry_backoff_sec=0)
+    assert worker.run_once() is True
+    job = db.session.get(ScoringJob, ScoringJob.query.filter_by(postulation_id=pid).one().id, populate_existing=True)
+    assert job.status == "queued"
+    assert "llm caído" in job.last_error
+    assert PostulationAIResult.query.filter_by(postulation_id=pid).first() is None
+
+    assert worker.run_once() is True
+    job = db.session.get(ScoringJob, job.id, populate_existing=True)
+    assert job.status == "failed"
+    row = PostulationAIResult.query.filter_by(postulation_id=pid).first()
+    assert row is not None and row.feedback.startswith("Error:")
+    assert row.status == "failed" and row.score is None
+    assert row.job_id == job.id and row.attempts == 2
@@ -0,0 +1,99 @@
+# tests/scoring/test_scoring_run_metrics.py
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.ext import ai_scorer
+from app.models.scoring_run_metric import ScoringRunMetric
+from app.repositories.scoring_metrics_repo import ScoringMetricsRepository
+from app.resources.metrics import render_scoring_metrics
+from app.services.scoring import pipeline
+
+
+@pytest.fixture()
+def priced(test_app):
+    test_app.config.update(AI_PRICE_INPUT_PER_MTOK=2.0, AI_PRICE_OUTPUT_PER_MTOK=8.0)
+    yield
+    test_app.config.pop("AI_PRICE_INPUT_PER_MTOK")
+    test_app.config.pop("AI_PRICE_OUTPUT_PER_MTOK")
+
+
+def _fake_llm(result, *, prompt, completion, attempts=1):
+    def call(*args, **kwargs):
+        ai_scorer._record_call({"status": "ok", "attempts": attempts, "rate_wait_ms": 5,
+                                "prompt_tokens": prompt, "completion_tokens": completion})
+        return result
+    return call
+
+
+def _payload(vacancy_id):
+    return {
+        "postulation_id": int(uuid4().int % 1_000_000),
+        "vacancy_id": vacancy_id,
+        "cv": {},
+        "applicant_profile": {"age": 30},
+        "_job": {"job_id": 77, "attempts": 2},
+    }
+
+
+def test_run_persists_stage_times_tokens_and_cost(app_ctx, priced, monkeypatch):
+    monkeypatch.setattr(pipeline, "fetch_cv_text", lambda cv: "Python, SQL")
+    monkeypatch.setattr(pipeline, "summarize_cv_to_json",
+                        _fake_llm({"habilidades": []}, prompt=1000, completion=200, attempts=2))
+    monkeypatch.setattr(pipeline, "score_candidate_v2",
+                        _fake_llm({"score": 70, "feedback": "ok"}, prompt=3000, completion=500))
+    vacancy_id = int(uuid4().int % 1_000_000)
+    data = _payload(vacancy_id)
+
+    pipeline.process_payload(data)
+
+    row = ScoringRunMetric.query.filter_by(postulation_id=data["postulation_id"]).one()
+    assert row.status == "succeeded" and row.job_id == 77 and row.attempt == 2
+    assert (row.summarize_prompt_tokens, row.summarize_completion_tokens) == (1000, 200)
+    assert (row.score_prompt_tokens, row.score_completion_tokens) == (3000, 500)
+    assert row.llm_calls == 2 and row.llm_retries == 1 and row.rate_wait_ms == 10
+    assert row.cost_usd == pytest.approx((4000 * 2.0 + 700 * 8.0) / 1_000_000)
+    assert row.total_ms >= 0 and row.score_ms is not None and row.persist_ms is not None
+
+
+def test_failed_run_is_recorded_and_error_propagates(app_ctx, monkeypatch):
+    monkeypatch.setattr(pipeline, "fetch_cv_text", lambda cv: "Python")
+    monkeypatch.setattr(pipeline, "summarize_cv_cached", lambda text: {})
+
+    def boom(*a, **k):
+        raise TimeoutError("LLM lento")
+    monkeypatch.setattr(pipeline, "score_candidate_v2", boom)
+    data = _payload(None)
+
+    with pytest.raises(TimeoutError):
+        pipeline.process_payload(data)
+
+    row = ScoringRunMetric.query.filter_by(postulation_id=data["postulation_id"]).one()
+    assert row.status == "failed" and row.error == "TimeoutError: LLM lento"
+    assert row.persist_ms is None
+
+
+def test_stats_by_vacancy_and_prometheus_export(app_ctx):
+    from app.ext.db import db
+    repo = ScoringMetricsRepository()
+    vacancy_id = int(uuid4().int % 1_000_000)
+    for total, status in ((1000, "succeeded"), (3000, "succeeded"), (500, "failed")):
+        repo.add(vacancy_id=vacancy_id, status=status, total_ms=total, score_ms=total // 2,
+                 ocr_pages=1, score_prompt_tokens=100, llm_calls=1, cost_usd=0.01)
+    db.session.commit()
+
+    (row,) = repo.stats(group_by="vacancy", since=datetime.utcnow() - timedelta(days=1), vacancy_id=vacancy_id)
+    assert row["vacancy_id"] == vacancy_id and row["runs"] == 3
+    assert (row["succeeded"], row["failed"]) == (2, 1)
+    assert row["avg_total_ms"] == 1500.0 and row["max_total_ms"] == 3000
+    assert row["ocr_pages"] == 3 and row["prompt_tokens"] == 300
+    assert row["cost_usd"] == pytest.approx(0.03)
+
+    days = repo.stats(group_by="day", since=datetime.utcnow() - timedelta(days=1), vacancy_id=vacancy_id)
+    assert len(days) == 1 and days[0]["runs"] == 3
+
+    text = render_scoring_metrics(row, {"queued": 4}, 15)
+    assert 'scoring_window_runs{status="failed"} 1' in text
+    assert 'scoring_window_stage_avg_ms{stage="total"} 1500.0' in text
+    assert 'scoring_jobs{status="queued"} 4' in text
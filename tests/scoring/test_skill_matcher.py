@@ -0,0 +1,88 @@
+# tests/scoring/test_skill_matcher.py
+from uuid import uuid4
+
+from app.ext.db import db
+from app.models.admin.skill import Skill
+from app.repositories.skill_evidence_repo import SkillEvidenceRepository
+from app.services.scoring import pipeline, skill_matcher
+from app.services.scoring.skill_matcher import SkillAutomaton
+
+CV = """EXPERIENCIA
+Desarrollo  de APIs con   Python y JavaScript; Gestión de Proyectos ágiles.
+Usé C++ y ASP.NET en Acme. python otra vez.
+"""
+
+
+def _spans(matches, text):
+    return {m.nombre: [text[s:e] for s, e in m.positions] for m in matches}
+
+
+def test_automaton_folds_accents_and_respects_word_boundaries():
+    auto = SkillAutomaton([(1, "Python"), (2, "Java"), (3, "gestion de proyectos"),
+                           (4, "C++"), (5, ".NET"), (6, "APIs con Python"), (7, "  ")])
+    assert len(auto) == 6
+    matches = auto.scan(CV)
+    spans = _spans(matches, CV)
+
+    assert spans["Python"] == ["Python", "python"]
+    assert "Java" not in spans  # solo aparece dentro de JavaScript
+    assert spans["gestion de proyectos"] == ["Gestión de Proyectos"]
+    assert spans["C++"] == ["C++"] and spans[".NET"] == [".NET"]
+    # Posiciones sobre el texto original aunque haya espacios repetidos
+    assert spans["APIs con Python"] == ["APIs con   Python"]
+    assert [m.nombre for m in matches][0] == "APIs con Python"
+    assert next(m for m in matches if m.skill_id == 1).hits == 2
+
+
+def test_evidence_is_persisted_and_rebuilt_only_on_catalog_change(app_ctx, monkeypatch):
+    tag = uuid4().hex[:8]
+    skill = Skill(nombre=f"Kotlin{tag}", nivel_minimo=1)
+    db.session.add(skill)
+    db.session.commit()
+    skill_matcher.skill_matcher.clear()
+    postulation_id = int(uuid4().int % 10_000_000) + 50_000_000
+    text = f"Proyectos móviles con kotlin{tag.upper()} y Compose"
+
+    pipeline._record_skill_evidence({"postulation_id": postulation_id, "vacancy_id": None}, text)
+    first = skill_matcher.skill_matcher.current()
+    rows = SkillEvidenceRepository().of_postulation(postulation_id)
+    assert [(r["skill_id"], r["hits"], r["required"]) for r in rows] == [(skill.id, 1, False)]
+    start, end = rows[0]["positions"][0]
+    assert text[start:end] == f"kotlin{tag.upper()}"
+    assert "Proyectos móviles" in rows[0]["snippet"]
+
+    # Sin cambios en el catálogo: mismo autómata y no se reescanea
+    assert skill_matcher.skill_matcher.current() is first
+    assert skill_matcher.record_skill_evidence(
+        text, postulation_id=postulation_id, vacancy_id=None,
+        text_sha256=pipeline.cv_text_fingerprint(text)) is None
+
+    # Desactivar la skill cambia la versión: nuevo autómata y evidencia vacía
+    skill.is_active = False
+    db.session.commit()
+    assert skill_matcher.skill_matcher.current() is not first
+    pipeline._record_skill_evidence({"postulation_id": postulation_id, "vacancy_id": None}, text)
+    assert SkillEvidenceRepository().of_postulation(postulation_id) == []
+
+
+def test_zero_match_scan_is_not_repeated(app_ctx, monkeypatch):
+    skill_matcher.skill_matcher.clear()
+    postulation_id = int(uuid4().int % 10_000_000) + 60_000_000
+    text = f"Sin skills del catálogo {uuid4().hex}"
+    sha = pipeline.cv_text_fingerprint(text)
+
+    pipeline._record_skill_evidence({"postulation_id": postulation_id, "vacancy_id": None}, text)
+    assert SkillEvidenceRepository().of_postulation(postulation_id) == []
+
+    scans = []
+    automaton = skill_matcher.skill_matcher.current()
+    monkeypatch.setattr(automaton, "scan", lambda t: scans.append(t) or [])
+    assert skill_matcher.record_skill_evidence(
+        text, postulation_id=postulation_id, vacancy_id=None, text_sha256=sha) is None
+    assert scans == []
+
+    # Otro texto sí se escanea
+    assert skill_matcher.record_skill_evidence(
+        text + " v2", postulation_id=postulation_id, vacancy_id=None,
+        text_sha256=pipeline.cv_text_fingerprint(text + " v2")) == 0
+    assert len(scans) == 1
@@ -0,0 +1,60 @@
+# tests/scoring/test_vacancy_prompt.py
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.ext.ai_scorer import _comparison_prompt_v3
+from app.ext.db import db
+from app.models.admin.charges import Charges
+from app.models.admin.vacancy import Vacancy
+from app.services.scoring.vacancy_prompt import VacancyPromptCache
+
+
+@pytest.fixture()
+def vacancy(app_ctx):
+    charge = Charges(title=f"Cargo {uuid4().hex[:6]}", area="TI", description="Cargo de prueba")
+    db.session.add(charge)
+    db.session.commit()
+    v = Vacancy(
+        title="Backend Python",
+        description="Desarrollo de APIs",
+        charge_id=charge.id,
+        apply_until=date.today() + timedelta(days=7),
+        req_knowledge=["Python", "Flask"],
+    )
+    db.session.add(v)
+    db.session.commit()
+    return v
+
+
+def test_fragment_is_reused_until_vacancy_changes(vacancy):
+    cache = VacancyPromptCache()
+    first = cache.get(vacancy.id)
+    assert "- Cargo: Backend Python" in first.fragment
+    assert cache.get(vacancy.id) is first
+
+    vacancy.req_knowledge = ["Python", "Django"]
+    vacancy.updated_at = datetime.utcnow() + timedelta(seconds=1)
+    db.session.commit()
+
+    second = cache.get(vacancy.id)
+    assert second is not first and "Django" in second.fragment
+    assert second.fingerprint != first.fingerprint
+
+
+def test_invalidate_and_unknown_vacancy(vacancy):
+    cache = VacancyPromptCache()
+    first = cache.for_vacancy(vacancy)
+    cache.invalidate(vacancy.id)
+    assert cache.get(vacancy.id) is not first
+    assert cache.get(10_000_000) is None
+
+
+def test_prompt_starts_with_shared_vacancy_prefix(vacancy):
+    vp = VacancyPromptCache().for_vacancy(vacancy)
+    a = _comparison_prompt_v3({"age": 30}, vp.profile, {"habilidades": ["Python"]}, vp.fragment)
+    b = _comparison_prompt_v3({"age": 41}, vp.profile, {"habilidades": ["SQL"]}, vp.fragment)
+    assert a.startswith(vp.fragment) and b.startswith(vp.fragment)
+    # Sin fragmento precalculado se renderiza el mismo bloque
+    assert _comparison_prompt_v3({"age": 30}, vp.profile, {"habilidades": ["Python"]}) == a